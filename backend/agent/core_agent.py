@@ -126,7 +126,7 @@ class CharleeAgent(Agent):
         Lista tarefas com filtros opcionais.
 
         Args:
-            status: Filtrar por status ("Pendente", "Em Progresso", "Concluída", "Cancelada")
+            status: Filtrar por status ("pending", "in_progress", "completed", "cancelled")
             big_rock_id: Filtrar por ID do Big Rock
             limite: Número máximo de tarefas a retornar
         """
@@ -148,10 +148,10 @@ class CharleeAgent(Agent):
 
         for tarefa in tarefas:
             status_emoji = {
-                "Pendente": "⏳",
-                "Em Progresso": "🔄",
-                "Concluída": "✅",
-                "Cancelada": "❌",
+                "pending": "⏳",
+                "in_progress": "🔄",
+                "completed": "✅",
+                "cancelled": "❌",
             }.get(tarefa.status, "❓")
 
             big_rock_nome = tarefa.big_rock.nome if tarefa.big_rock else "Sem Big Rock"
@@ -66,7 +66,7 @@ class CapacityGuardAgent(Agent):
                 tarefas = (
                     self.database.query(Task)
                     .filter(Task.big_rock_id == br.id)
-                    .filter(Task.status == "Pendente")
+                    .filter(Task.status == "pending")
                     .filter(Task.deadline <= data_limite)
                     .all()
                 )
@@ -129,7 +129,7 @@ class CapacityGuardAgent(Agent):
 
             tarefas_atuais = (
                 self.database.query(Task)
-                .filter(Task.status == "Pendente")
+                .filter(Task.status == "pending")
                 .filter(Task.deadline <= data_limite)
                 .count()
             )
@@ -189,7 +189,7 @@ class CapacityGuardAgent(Agent):
 
             tarefas_adiaveis = (
                 self.database.query(Task)
-                .filter(Task.status == "Pendente")
+                .filter(Task.status == "pending")
                 .filter(Task.deadline > data_limite_urgente)
                 .filter(Task.deadline <= data_limite_total)
                 .limit(5)
@@ -246,7 +246,7 @@ class CapacityGuardAgent(Agent):
                 num_tarefas = (
                     self.database.query(Task)
                     .filter(Task.big_rock_id == br.id)
-                    .filter(Task.status == "Pendente")
+                    .filter(Task.status == "pending")
                     .filter(Task.deadline <= data_limite)
                     .count()
                 )
@@ -261,7 +261,7 @@ class CycleAwareAgent(Agent):
 
             tarefas_proximas = (
                 self.database.query(Task)
-                .filter(Task.status == "Pendente")
+                .filter(Task.status == "pending")
                 .filter(Task.deadline.isnot(None))
                 .filter(Task.deadline <= data_limite)
                 .all()
@@ -84,7 +84,7 @@ class DailyTrackingAgent(Agent):
             # Contar tarefas completadas do dia
             tarefas_hoje = (
                 self.database.query(Task)
-                .filter(Task.status == "Concluída", func.date(Task.completed_at) == data_obj)
+                .filter(Task.status == "completed", func.date(Task.completed_at) == data_obj)
                 .count()
             )
 
@@ -98,7 +98,7 @@ class FreelancerAgent(Agent):
                 estimated_hours=estimated_hours,
                 deadline=deadline_date,
                 start_date=start_date_obj,
-                tags=tags,
+                tags=[tag.strip() for tag in tags.split(",") if tag.strip()] if tags else None,
                 status="proposal",
             )
 
@@ -266,11 +266,8 @@ class FreelancerAgent(Agent):
                 billable=billable,
             )
 
+            # Project actual_hours is kept up to date by the WorkLog flush listeners
             self.database.add(work_log)
-
-            # Update project actual hours
-            project.update_actual_hours(self.database)
-
             self.database.commit()
             self.database.refresh(work_log)
             self.database.refresh(project)
@@ -371,17 +368,11 @@ class FreelancerAgent(Agent):
             total_hours = sum(log.hours for log in work_logs)
             total_amount = sum(log.calculate_amount() for log in work_logs)
 
-            # Generate invoice number if not provided
-            if not invoice_number:
-                today = date.today()
-                count = self.database.query(Invoice).filter(Invoice.user_id == user_id).count()
-                invoice_number = f"INV-{today.strftime('%Y%m')}-{count + 1:04d}"
-
-            # Create invoice
+            # Create invoice (the database numbers it when invoice_number is empty)
             invoice = Invoice(
                 user_id=user_id,
                 project_id=project_id,
-                invoice_number=invoice_number,
+                invoice_number=invoice_number or None,
                 issue_date=date.today(),
                 due_date=date.today() + timedelta(days=30),  # Default Net 30
                 total_amount=total_amount,
@@ -396,14 +387,11 @@ class FreelancerAgent(Agent):
             self.database.refresh(invoice)
 
             # Mark work logs as invoiced
-            for log in work_logs:
-                log.invoiced = True
-                log.invoice_id = invoice.id
-
+            WorkLog.bulk_mark_invoiced(self.database, [log.id for log in work_logs], invoice.id)
             self.database.commit()
 
             result = "📄 **Invoice Generated!**\n\n"
-            result += f"🔢 **Number**: {invoice_number}\n"
+            result += f"🔢 **Number**: {invoice.invoice_number}\n"
             result += f"📅 **Issue Date**: {invoice.issue_date.strftime('%d/%m/%Y')}\n"
             result += f"📅 **Due Date**: {invoice.due_date.strftime('%d/%m/%Y')}\n\n"
 
@@ -451,7 +439,7 @@ class FreelancerAgent(Agent):
             total_remaining_hours = 0
             for project in active_projects:
                 remaining = max(0, project.estimated_hours - project.actual_hours)
-                total_remaining_hours += remaining
+                total_remaining_hours += float(remaining)
 
             # Assume 20 hours/week capacity (adjust based on user settings)
             weekly_capacity = 20
@@ -27,12 +27,7 @@ def check_account_lockout(user: User) -> tuple[bool, Optional[str]]:
         Tuple of (is_locked: bool, message: Optional[str])
     """
     if user.is_locked():
-        # Ensure locked_until is timezone-aware
-        locked_until = user.locked_until
-        if locked_until.tzinfo is None:
-            locked_until = locked_until.replace(tzinfo=timezone.utc)
-
-        remaining_time = locked_until - datetime.now(timezone.utc)
+        remaining_time = user.locked_until - datetime.now(timezone.utc)
         minutes_remaining = int(remaining_time.total_seconds() / 60)
         return True, f"Account is locked. Try again in {minutes_remaining} minutes."
 
@@ -52,12 +47,9 @@ def record_failed_login(db: Session, user: User) -> tuple[bool, int]:
     """
     # Reset counter if last failed attempt was more than 24 hours ago
     if user.last_failed_login:
-        # Ensure last_failed_login is timezone-aware
-        last_failed = user.last_failed_login
-        if last_failed.tzinfo is None:
-            last_failed = last_failed.replace(tzinfo=timezone.utc)
-
-        hours_since_last_failure = (datetime.now(timezone.utc) - last_failed).total_seconds() / 3600
+        hours_since_last_failure = (
+            datetime.now(timezone.utc) - user.last_failed_login
+        ).total_seconds() / 3600
 
         if hours_since_last_failure > LockoutConfig.RESET_ATTEMPTS_AFTER_HOURS:
             user.failed_login_attempts = 0
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from api.middleware.error_handler import GlobalErrorHandlerMiddleware
@@ -45,6 +46,7 @@ from api.routes import (
     tasks,
     wellness,
 )
+from database import schemas
 from database.config import Base, engine
 
 # Initialize logger
@@ -56,6 +58,7 @@ async def lifespan(app: FastAPI):
     """Lifespan events for FastAPI app."""
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created/verified")
+    schemas.warm_up()
     logger.info("Charlee backend started successfully")
     yield
     logger.info("Shutting down Charlee backend...")
@@ -99,6 +102,9 @@ For detailed setup instructions, see the [Backend README](../README.md).
     """,
     version="2.0.0",
     lifespan=lifespan,
+    # Encode response bodies (already JSON-ready after response_model
+    # serialization) with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Charlee Support",
         "url": "https://github.com/samaraCassie/Charlee",
@@ -66,7 +66,7 @@ async def weekly_stats(
             db.query(Task)
             .filter(
                 Task.user_id == current_user.id,
-                Task.status == "Concluída",
+                Task.status == "completed",
                 func.date(Task.concluido_em) == day_date,
             )
             .count()
@@ -77,7 +77,7 @@ async def weekly_stats(
             db.query(Task)
             .filter(
                 Task.user_id == current_user.id,
-                Task.status == "Pendente",
+                Task.status == "pending",
                 func.date(Task.deadline) == day_date,
             )
             .count()
@@ -133,7 +133,7 @@ async def monthly_stats(
             db.query(Task)
             .filter(
                 Task.user_id == current_user.id,
-                Task.status == "Concluída",
+                Task.status == "completed",
                 Task.concluido_em >= month_start,
                 Task.concluido_em < month_end,
             )
@@ -165,7 +165,7 @@ async def big_rocks_distribution(
             .filter(
                 Task.user_id == current_user.id,
                 Task.big_rock_id == br.id,
-                Task.status == "Concluída",
+                Task.status == "completed",
                 Task.concluido_em >= thirty_days_ago,
             )
             .count()
@@ -195,7 +195,7 @@ async def productivity_stats(
 
     # Tarefas concluídas
     completed_tasks = (
-        db.query(Task).filter(Task.user_id == current_user.id, Task.status == "Concluída").count()
+        db.query(Task).filter(Task.user_id == current_user.id, Task.status == "completed").count()
     )
 
     # Taxa de conclusão
@@ -206,7 +206,7 @@ async def productivity_stats(
         db.query(Task)
         .filter(
             Task.user_id == current_user.id,
-            Task.status == "Pendente",
+            Task.status == "pending",
             Task.deadline < date.today(),
         )
         .count()
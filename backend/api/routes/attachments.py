@@ -12,6 +12,8 @@ from database.schemas import AttachmentResponse
 
 router = APIRouter()
 
+ATTACHMENT_FILE_TYPES = frozenset({"audio", "image"})
+
 
 @router.get("/tasks/{task_id}/attachments", response_model=List[AttachmentResponse])
 async def get_task_attachments(
@@ -87,7 +89,7 @@ async def get_all_user_attachments(
 
     # Apply filters
     if file_type:
-        if file_type not in ["audio", "image"]:
+        if file_type not in ATTACHMENT_FILE_TYPES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="file_type must be 'audio' or 'image'",
@@ -211,7 +211,7 @@ async def login(
 
     refresh_token = RefreshToken(
         user_id=user.id,
-        token=refresh_token_str,
+        token_hash=RefreshToken.hash_token(refresh_token_str),
         expires_at=refresh_token_expires,
         user_agent=request.headers.get("user-agent"),
         ip_address=request.client.host if request.client else None,
@@ -262,7 +262,7 @@ async def refresh_token(
     db_token = (
         db.query(RefreshToken)
         .filter(
-            RefreshToken.token == refresh_request.refresh_token,
+            RefreshToken.token_hash == RefreshToken.hash_token(refresh_request.refresh_token),
             RefreshToken.user_id == token_data.user_id,
             RefreshToken.revoked.is_(False),
         )
@@ -276,11 +276,7 @@ async def refresh_token(
         )
 
     # Check if token is expired
-    # Make expires_at timezone-aware if it isn't already
-    expires_at = db_token.expires_at
-    if expires_at.tzinfo is None:
-        expires_at = expires_at.replace(tzinfo=timezone.utc)
-    if expires_at < datetime.now(timezone.utc):
+    if db_token.expires_at < datetime.now(timezone.utc):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token expired",
@@ -332,7 +328,7 @@ async def logout(
     db_token = (
         db.query(RefreshToken)
         .filter(
-            RefreshToken.token == refresh_request.refresh_token,
+            RefreshToken.token_hash == RefreshToken.hash_token(refresh_request.refresh_token),
             RefreshToken.user_id == current_user.id,
             RefreshToken.revoked.is_(False),
         )
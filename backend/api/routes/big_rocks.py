@@ -1,16 +1,19 @@
 """Big Rocks API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from api.auth.dependencies import get_current_user
 from api.cache import invalidate_pattern
+from api.json_body import JSONBody
 from database import crud, schemas
 from database.config import get_db
 from database.models import User
 
 router = APIRouter()
 
+_big_rock_body = JSONBody(schemas.BigRockCreate)
+
 
 @router.get("/", response_model=schemas.BigRockListResponse)
 def get_big_rocks(
@@ -28,7 +31,10 @@ def get_big_rocks(
     big_rocks = crud.get_big_rocks(
         db, user_id=current_user.id, skip=skip, limit=limit, active_only=active_only
     )
-    return {"total": len(big_rocks), "big_rocks": big_rocks}
+    return Response(
+        schemas.BigRockResponse.dump_list_json(big_rocks, "big_rocks"),
+        media_type="application/json",
+    )
 
 
 @router.get("/{big_rock_id}", response_model=schemas.BigRockResponse)
@@ -45,12 +51,17 @@ def get_big_rock(
     big_rock = crud.get_big_rock(db, big_rock_id, user_id=current_user.id)
     if not big_rock:
         raise HTTPException(status_code=404, detail="Big Rock not found")
-    return big_rock
+    return schemas.BigRockResponse.from_orm_fast(big_rock)
 
 
-@router.post("/", response_model=schemas.BigRockResponse, status_code=201)
+@router.post(
+    "/",
+    response_model=schemas.BigRockResponse,
+    status_code=201,
+    openapi_extra=_big_rock_body.openapi_extra,
+)
 def create_big_rock(
-    big_rock: schemas.BigRockCreate,
+    big_rock: schemas.BigRockCreate = Depends(_big_rock_body),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -60,7 +71,7 @@ def create_big_rock(
     # Invalidate all Big Rock caches
     invalidate_pattern("big_rocks:*")
 
-    return result
+    return schemas.BigRockResponse.from_orm_fast(result)
 
 
 @router.patch("/{big_rock_id}", response_model=schemas.BigRockResponse)
@@ -78,7 +89,7 @@ def update_big_rock(
     # Invalidate all Big Rock caches
     invalidate_pattern("big_rocks:*")
 
-    return big_rock
+    return schemas.BigRockResponse.from_orm_fast(big_rock)
 
 
 @router.delete("/{big_rock_id}", status_code=204)
@@ -9,8 +9,9 @@ import secrets
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload, undefer_group
 
 from api.auth.dependencies import get_current_user
 from database.config import get_db
@@ -20,10 +21,12 @@ from database.models import (
     CalendarEvent,
     CalendarSyncLog,
     User,
+    UserConflictSummary,
 )
 from database.schemas import (
     CalendarConflictListResponse,
     CalendarConflictResponse,
+    CalendarConflictSummaryResponse,
     CalendarConflictUpdate,
     CalendarConnectionListResponse,
     CalendarConnectionResponse,
@@ -319,7 +322,7 @@ async def list_connections(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> CalendarConnectionListResponse:
+) -> Response:
     """
     List all calendar connections for the current user.
 
@@ -349,7 +352,10 @@ async def list_connections(
         extra={"user_id": current_user.id, "count": len(connections)},
     )
 
-    return CalendarConnectionListResponse(total=total, connections=connections)
+    return Response(
+        CalendarConnectionResponse.dump_list_json(connections, "connections", total),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -433,8 +439,6 @@ async def update_connection(
     for key, value in update_dict.items():
         setattr(connection, key, value)
 
-    connection.updated_at = datetime.utcnow()
-
     db.commit()
     db.refresh(connection)
 
@@ -566,7 +570,7 @@ async def list_events(
     connection_id: Optional[int] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> CalendarEventListResponse:
+) -> Response:
     """
     List calendar events for the current user.
 
@@ -591,7 +595,10 @@ async def list_events(
 
     logger.info("Listed calendar events", extra={"user_id": current_user.id, "count": len(events)})
 
-    return CalendarEventListResponse(total=total, events=events)
+    return Response(
+        CalendarEventResponse.dump_list_json(events, "events", total),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -630,6 +637,50 @@ async def get_event(
     return event
 
 
+@router.get(
+    "/events/{event_id}/conflicts",
+    response_model=CalendarConflictListResponse,
+    summary="List open conflicts of a calendar event",
+)
+async def list_event_conflicts(
+    event_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    List the unresolved conflicts of a calendar event.
+
+    Args:
+        event_id: Event ID
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        CalendarConflictListResponse: Conflicts not yet resolved
+
+    Raises:
+        HTTPException 404: If event not found
+        HTTPException 403: If event doesn't belong to user
+    """
+    event = (
+        db.query(CalendarEvent)
+        .options(selectinload(CalendarEvent.active_conflicts).undefer_group("payload"))
+        .filter(CalendarEvent.id == event_id)
+        .first()
+    )
+
+    if not event:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+
+    if event.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+    return Response(
+        CalendarConflictResponse.dump_list_json(event.active_conflicts, "conflicts"),
+        media_type="application/json",
+    )
+
+
 # ==================== Synchronization ====================
 
 
@@ -732,7 +783,7 @@ async def list_sync_logs(
     connection_id: Optional[int] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> CalendarSyncLogListResponse:
+) -> Response:
     """
     List synchronization logs.
 
@@ -746,7 +797,11 @@ async def list_sync_logs(
     Returns:
         CalendarSyncLogListResponse: List of sync logs
     """
-    query = db.query(CalendarSyncLog).filter(CalendarSyncLog.user_id == current_user.id)
+    query = (
+        db.query(CalendarSyncLog)
+        .options(undefer_group("detail"))
+        .filter(CalendarSyncLog.user_id == current_user.id)
+    )
 
     if connection_id:
         query = query.filter(CalendarSyncLog.connection_id == connection_id)
@@ -757,7 +812,10 @@ async def list_sync_logs(
 
     logger.info("Listed sync logs", extra={"user_id": current_user.id, "count": len(logs)})
 
-    return CalendarSyncLogListResponse(total=total, logs=logs)
+    return Response(
+        CalendarSyncLogResponse.dump_list_json(logs, "logs", total),
+        media_type="application/json",
+    )
 
 
 # ==================== Conflicts ====================
@@ -774,7 +832,7 @@ async def list_conflicts(
     status_filter: Optional[str] = Query(None, alias="status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> CalendarConflictListResponse:
+) -> Response:
     """
     List calendar synchronization conflicts.
 
@@ -788,7 +846,11 @@ async def list_conflicts(
     Returns:
         CalendarConflictListResponse: List of conflicts
     """
-    query = db.query(CalendarConflict).filter(CalendarConflict.user_id == current_user.id)
+    query = (
+        db.query(CalendarConflict)
+        .options(undefer_group("payload"))
+        .filter(CalendarConflict.user_id == current_user.id)
+    )
 
     if status_filter:
         query = query.filter(CalendarConflict.status == status_filter)
@@ -799,7 +861,37 @@ async def list_conflicts(
 
     logger.info("Listed conflicts", extra={"user_id": current_user.id, "count": len(conflicts)})
 
-    return CalendarConflictListResponse(total=total, conflicts=conflicts)
+    return Response(
+        CalendarConflictResponse.dump_list_json(conflicts, "conflicts", total),
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/conflicts/summary",
+    response_model=CalendarConflictSummaryResponse,
+    summary="Count unresolved calendar conflicts",
+)
+async def get_conflict_summary(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> CalendarConflictSummaryResponse:
+    """
+    Get the number of unresolved calendar conflicts for the current user.
+
+    Reads the trigger-maintained user_conflict_summary row instead of
+    counting calendar_conflicts.
+
+    Args:
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        CalendarConflictSummaryResponse: Unresolved conflict count
+    """
+    return CalendarConflictSummaryResponse(
+        unresolved=UserConflictSummary.unresolved_for(db, current_user.id)
+    )
 
 
 @router.get(
@@ -827,7 +919,12 @@ async def get_conflict(
         HTTPException 404: If conflict not found
         HTTPException 403: If conflict doesn't belong to user
     """
-    conflict = db.query(CalendarConflict).filter(CalendarConflict.id == conflict_id).first()
+    conflict = (
+        db.query(CalendarConflict)
+        .options(undefer_group("payload"))
+        .filter(CalendarConflict.id == conflict_id)
+        .first()
+    )
 
     if not conflict:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conflict not found")
@@ -865,7 +962,12 @@ async def resolve_conflict(
         HTTPException 404: If conflict not found
         HTTPException 403: If conflict doesn't belong to user
     """
-    conflict = db.query(CalendarConflict).filter(CalendarConflict.id == conflict_id).first()
+    conflict = (
+        db.query(CalendarConflict)
+        .options(undefer_group("payload"))
+        .filter(CalendarConflict.id == conflict_id)
+        .first()
+    )
 
     if not conflict:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conflict not found")
@@ -878,11 +980,10 @@ async def resolve_conflict(
     for key, value in update_dict.items():
         setattr(conflict, key, value)
 
-    # Mark as resolved
+    # Mark as resolved (timestamps are stamped by the database)
     conflict.status = "resolved"
-    conflict.resolved_at = datetime.utcnow()
+    conflict.resolved_at = func.now()
     conflict.resolved_by = current_user.username
-    conflict.updated_at = datetime.utcnow()
 
     db.commit()
     db.refresh(conflict)
@@ -2,14 +2,15 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.auth.dependencies import get_current_user
 from api.cache import invalidate_pattern
 from database import crud, schemas
 from database.config import get_db
-from database.models import User
+from database.models import ProjectHoursMV, User
 
 router = APIRouter()
 
@@ -34,7 +35,25 @@ def get_freelance_projects(
     projects = crud.get_freelance_projects(
         db, user_id=current_user.id, skip=skip, limit=limit, status=status
     )
-    return {"total": len(projects), "projects": projects}
+    return Response(
+        schemas.FreelanceProjectResponse.dump_list_json(projects, "projects"),
+        media_type="application/json",
+    )
+
+
+@router.get("/projects/summary", response_model=schemas.FreelanceHoursSummaryResponse)
+def get_freelance_hours_summary(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get total hours worked and their value across the user's freelance projects.
+
+    Read from the mv_project_hours view, so on PostgreSQL the totals lag new
+    work logs until the next scheduled refresh.
+    """
+    hours, value = ProjectHoursMV.totals_for(db, current_user.id)
+    return schemas.FreelanceHoursSummaryResponse(total_hours=hours, total_value=value)
 
 
 @router.get("/projects/{project_id}", response_model=schemas.FreelanceProjectResponse)
@@ -47,7 +66,7 @@ def get_freelance_project(
     project = crud.get_freelance_project(db, project_id, user_id=current_user.id)
     if not project:
         raise HTTPException(status_code=404, detail="Freelance project not found")
-    return project
+    return schemas.FreelanceProjectResponse.from_orm_fast(project)
 
 
 @router.post("/projects", response_model=schemas.FreelanceProjectResponse, status_code=201)
@@ -62,7 +81,7 @@ def create_freelance_project(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return result
+    return schemas.FreelanceProjectResponse.from_orm_fast(result)
 
 
 @router.patch("/projects/{project_id}", response_model=schemas.FreelanceProjectResponse)
@@ -80,7 +99,7 @@ def update_freelance_project(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return project
+    return schemas.FreelanceProjectResponse.from_orm_fast(project)
 
 
 @router.delete("/projects/{project_id}", status_code=204)
@@ -120,7 +139,11 @@ def get_work_logs(
     work_logs = crud.get_work_logs(
         db, user_id=current_user.id, project_id=project_id, skip=skip, limit=limit
     )
-    return {"total": len(work_logs), "work_logs": work_logs}
+    # limit is caller-controlled, so encode large exports a chunk at a time
+    return StreamingResponse(
+        schemas.WorkLogResponse.iter_list_json(work_logs, "work_logs"),
+        media_type="application/json",
+    )
 
 
 @router.get("/work-logs/{log_id}", response_model=schemas.WorkLogResponse)
@@ -133,7 +156,7 @@ def get_work_log(
     work_log = crud.get_work_log(db, log_id, user_id=current_user.id)
     if not work_log:
         raise HTTPException(status_code=404, detail="Work log not found")
-    return work_log
+    return schemas.WorkLogResponse.from_orm_fast(work_log)
 
 
 @router.post("/work-logs", response_model=schemas.WorkLogResponse, status_code=201)
@@ -153,7 +176,7 @@ def create_work_log(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return result
+    return schemas.WorkLogResponse.from_orm_fast(result)
 
 
 @router.patch("/work-logs/{log_id}", response_model=schemas.WorkLogResponse)
@@ -171,7 +194,7 @@ def update_work_log(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return work_log
+    return schemas.WorkLogResponse.from_orm_fast(work_log)
 
 
 @router.delete("/work-logs/{log_id}", status_code=204)
@@ -211,7 +234,10 @@ def get_invoices(
     invoices = crud.get_invoices(
         db, user_id=current_user.id, project_id=project_id, skip=skip, limit=limit
     )
-    return {"total": len(invoices), "invoices": invoices}
+    return Response(
+        schemas.InvoiceResponse.dump_list_json(invoices, "invoices"),
+        media_type="application/json",
+    )
 
 
 @router.get("/invoices/{invoice_id}", response_model=schemas.InvoiceResponse)
@@ -224,7 +250,7 @@ def get_invoice(
     invoice = crud.get_invoice(db, invoice_id, user_id=current_user.id)
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
-    return invoice
+    return schemas.InvoiceResponse.from_orm_fast(invoice)
 
 
 @router.post("/invoices", response_model=schemas.InvoiceResponse, status_code=201)
@@ -247,7 +273,7 @@ def create_invoice(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return result
+    return schemas.InvoiceResponse.from_orm_fast(result)
 
 
 @router.patch("/invoices/{invoice_id}", response_model=schemas.InvoiceResponse)
@@ -265,7 +291,7 @@ def update_invoice(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return invoice
+    return schemas.InvoiceResponse.from_orm_fast(invoice)
 
 
 @router.delete("/invoices/{invoice_id}", status_code=204)
@@ -317,7 +343,7 @@ def log_work_on_project(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return result
+    return schemas.WorkLogResponse.from_orm_fast(result)
 
 
 @router.get(
@@ -359,4 +385,4 @@ def generate_invoice_for_project(
     # Invalidate all freelance caches
     invalidate_pattern("freelance:*")
 
-    return result
+    return schemas.InvoiceResponse.from_orm_fast(result)
@@ -44,11 +44,11 @@ async def inbox_rapido(
     inbox_texto = sistema.gerar_inbox_rapido(limite=limite)
 
     # Obter tarefas priorizadas
-    tarefas_priorizadas = sistema.priorizar_tarefas(status="Pendente", limite=limite)
+    tarefas_priorizadas = sistema.priorizar_tarefas(status="pending", limite=limite)
 
     return {
         "inbox_text": inbox_texto,
-        "tarefas": tarefas_priorizadas,
+        "tarefas": schemas.TaskResponse.from_orm_list(tarefas_priorizadas),
         "total": len(tarefas_priorizadas),
     }
 
@@ -64,12 +64,15 @@ async def tarefas_hoje(
     from database import crud
 
     today = date.today()
-    tarefas = crud.get_tasks(db, user_id=current_user.id, status="Pendente", limit=50)
+    tarefas = crud.get_tasks(db, user_id=current_user.id, status="pending", limit=50)
 
     # Filtrar por deadline hoje
     tarefas_hoje = [t for t in tarefas if t.deadline and t.deadline.date() == today]
 
-    return {"total": len(tarefas_hoje), "tarefas": tarefas_hoje}
+    return {
+        "total": len(tarefas_hoje),
+        "tasks": schemas.TaskResponse.from_orm_list(tarefas_hoje),
+    }
 
 
 @router.get("/atrasadas", response_model=schemas.TaskListResponse)
@@ -83,7 +86,7 @@ async def tarefas_atrasadas(
     from database import crud
 
     today = date.today()
-    tarefas = crud.get_tasks(db, user_id=current_user.id, status="Pendente", limit=100)
+    tarefas = crud.get_tasks(db, user_id=current_user.id, status="pending", limit=100)
 
     # Filtrar por deadline atrasada
     tarefas_atrasadas = [t for t in tarefas if t.deadline and t.deadline.date() < today]
@@ -91,7 +94,10 @@ async def tarefas_atrasadas(
     # Ordenar por deadline (mais antigo primeiro)
     tarefas_atrasadas.sort(key=lambda t: t.deadline)
 
-    return {"total": len(tarefas_atrasadas), "tarefas": tarefas_atrasadas}
+    return {
+        "total": len(tarefas_atrasadas),
+        "tasks": schemas.TaskResponse.from_orm_list(tarefas_atrasadas),
+    }
 
 
 @router.get("/proxima-semana", response_model=schemas.TaskListResponse)
@@ -107,7 +113,7 @@ async def tarefas_proxima_semana(
     today = date.today()
     next_week = today + timedelta(days=7)
 
-    tarefas = crud.get_tasks(db, user_id=current_user.id, status="Pendente", limit=100)
+    tarefas = crud.get_tasks(db, user_id=current_user.id, status="pending", limit=100)
 
     # Filtrar por deadline próxima semana
     tarefas_semana = [t for t in tarefas if t.deadline and today <= t.deadline.date() <= next_week]
@@ -115,4 +121,7 @@ async def tarefas_proxima_semana(
     # Ordenar por deadline
     tarefas_semana.sort(key=lambda t: t.deadline)
 
-    return {"total": len(tarefas_semana), "tarefas": tarefas_semana}
+    return {
+        "total": len(tarefas_semana),
+        "tasks": schemas.TaskResponse.from_orm_list(tarefas_semana),
+    }
@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v2/notifications/digests", tags=["Notification Digests"])
 
+DIGEST_TYPES = frozenset({"daily", "weekly", "monthly"})
+
 
 @router.get("/", response_model=List[schemas.NotificationDigestResponse])
 def list_digests(
@@ -73,7 +75,7 @@ def generate_digest(
     Generates a summary of recent notifications using AI.
     Available types: daily, weekly, monthly.
     """
-    if digest_type not in ["daily", "weekly", "monthly"]:
+    if digest_type not in DIGEST_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid digest_type. Must be one of: daily, weekly, monthly",
@@ -102,7 +104,7 @@ def get_latest_digest(
     db: Session = Depends(get_db),
 ):
     """Get the latest digest of a specific type."""
-    if digest_type not in ["daily", "weekly", "monthly"]:
+    if digest_type not in DIGEST_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid digest_type. Must be one of: daily, weekly, monthly",
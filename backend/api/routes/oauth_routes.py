@@ -92,7 +92,7 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
 
         refresh_token = RefreshToken(
             user_id=user.id,
-            token=refresh_token_str,
+            token_hash=RefreshToken.hash_token(refresh_token_str),
             expires_at=refresh_token_expires,
             user_agent=request.headers.get("user-agent"),
             ip_address=request.client.host if request.client else None,
@@ -218,7 +218,7 @@ async def github_callback(request: Request, db: Session = Depends(get_db)):
 
         refresh_token = RefreshToken(
             user_id=user.id,
-            token=refresh_token_str,
+            token_hash=RefreshToken.hash_token(refresh_token_str),
             expires_at=refresh_token_expires,
             user_agent=request.headers.get("user-agent"),
             ip_address=request.client.host if request.client else None,
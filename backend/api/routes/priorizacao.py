@@ -53,7 +53,7 @@ async def recalcular_prioridades(
     """
     sistema = create_sistema_priorizacao(db)
 
-    tarefas_priorizadas = sistema.priorizar_tarefas(status="Pendente", big_rock_id=big_rock_id)
+    tarefas_priorizadas = sistema.priorizar_tarefas(status="pending", big_rock_id=big_rock_id)
 
     return {
         "message": "Prioridades recalculadas",
@@ -73,6 +73,9 @@ async def listar_tarefas_priorizadas(
     """
     sistema = create_sistema_priorizacao(db)
 
-    tarefas = sistema.priorizar_tarefas(status="Pendente", big_rock_id=big_rock_id, limite=limite)
+    tarefas = sistema.priorizar_tarefas(status="pending", big_rock_id=big_rock_id, limite=limite)
 
-    return {"total": len(tarefas), "tarefas": tarefas}
+    return {
+        "total": len(tarefas),
+        "tasks": schemas.TaskResponse.from_orm_list(tarefas),
+    }
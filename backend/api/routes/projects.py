@@ -1,6 +1,6 @@
 """Projects Intelligence System API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from agent.specialized_agents.projects.career_insights_agent import (
@@ -21,12 +21,16 @@ from agent.specialized_agents.projects.semantic_analyzer_agent import (
 )
 from api.auth.dependencies import get_current_user
 from api.cache import invalidate_pattern
+from api.json_body import JSONBody
 from database import crud, schemas
 from database.config import get_db
 from database.models import User
 
 router = APIRouter()
 
+_opportunity_body = JSONBody(schemas.FreelanceOpportunityCreate)
+_negotiation_body = JSONBody(schemas.NegotiationCreate)
+
 
 # ==================== FreelancePlatform Routes ====================
 
@@ -43,7 +47,10 @@ def get_platforms(
     platforms = crud.get_platforms(
         db, user_id=current_user.id, skip=skip, limit=limit, active_only=active_only
     )
-    return {"total": len(platforms), "platforms": platforms}
+    return Response(
+        schemas.FreelancePlatformResponse.dump_list_json(platforms, "platforms"),
+        media_type="application/json",
+    )
 
 
 @router.get("/platforms/{platform_id}", response_model=schemas.FreelancePlatformResponse)
@@ -56,7 +63,7 @@ def get_platform(
     platform = crud.get_platform(db, platform_id, user_id=current_user.id)
     if not platform:
         raise HTTPException(status_code=404, detail="Platform not found")
-    return platform
+    return schemas.FreelancePlatformResponse.from_orm_fast(platform)
 
 
 @router.post("/platforms/", response_model=schemas.FreelancePlatformResponse, status_code=201)
@@ -68,7 +75,7 @@ def create_platform(
     """Create a new freelance platform for the authenticated user."""
     result = crud.create_platform(db, platform, user_id=current_user.id)
     invalidate_pattern("projects:platforms:*")
-    return result
+    return schemas.FreelancePlatformResponse.from_orm_fast(result)
 
 
 @router.patch("/platforms/{platform_id}", response_model=schemas.FreelancePlatformResponse)
@@ -83,7 +90,7 @@ def update_platform(
     if not platform:
         raise HTTPException(status_code=404, detail="Platform not found")
     invalidate_pattern("projects:platforms:*")
-    return platform
+    return schemas.FreelancePlatformResponse.from_orm_fast(platform)
 
 
 @router.delete("/platforms/{platform_id}", status_code=204)
@@ -125,7 +132,10 @@ def get_opportunities(
         min_score=min_score,
         recommendation=recommendation,
     )
-    return {"total": len(opportunities), "opportunities": opportunities}
+    return Response(
+        schemas.FreelanceOpportunityResponse.dump_list_json(opportunities, "opportunities"),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -141,16 +151,17 @@ def get_opportunity(
     opportunity = crud.get_opportunity(db, opportunity_id, user_id=current_user.id)
     if not opportunity:
         raise HTTPException(status_code=404, detail="Opportunity not found")
-    return opportunity
+    return schemas.FreelanceOpportunityResponse.from_orm_fast(opportunity)
 
 
 @router.post(
     "/opportunities/",
     response_model=schemas.FreelanceOpportunityResponse,
     status_code=201,
+    openapi_extra=_opportunity_body.openapi_extra,
 )
 def create_opportunity(
-    opportunity: schemas.FreelanceOpportunityCreate,
+    opportunity: schemas.FreelanceOpportunityCreate = Depends(_opportunity_body),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -158,7 +169,7 @@ def create_opportunity(
     try:
         result = crud.create_opportunity(db, opportunity, user_id=current_user.id)
         invalidate_pattern("projects:opportunities:*")
-        return result
+        return schemas.FreelanceOpportunityResponse.from_orm_fast(result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -180,7 +191,7 @@ def update_opportunity(
     if not opportunity:
         raise HTTPException(status_code=404, detail="Opportunity not found")
     invalidate_pattern("projects:opportunities:*")
-    return opportunity
+    return schemas.FreelanceOpportunityResponse.from_orm_fast(opportunity)
 
 
 @router.delete("/opportunities/{opportunity_id}", status_code=204)
@@ -242,7 +253,7 @@ def analyze_opportunity(
             raise HTTPException(status_code=404, detail="Opportunity not found")
 
         invalidate_pattern("projects:opportunities:*")
-        return opportunity
+        return schemas.FreelanceOpportunityResponse.from_orm_fast(opportunity)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
@@ -287,7 +298,7 @@ def evaluate_opportunity(
             raise HTTPException(status_code=404, detail="Opportunity not found")
 
         invalidate_pattern("projects:opportunities:*")
-        return opportunity
+        return schemas.FreelanceOpportunityResponse.from_orm_fast(opportunity)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
@@ -327,7 +338,10 @@ def get_pricing_parameters(
     params = crud.get_pricing_parameters(
         db, user_id=current_user.id, skip=skip, limit=limit, active_only=active_only
     )
-    return {"total": len(params), "pricing_parameters": params}
+    return Response(
+        schemas.PricingParameterResponse.dump_list_json(params, "pricing_parameters"),
+        media_type="application/json",
+    )
 
 
 @router.get("/pricing-parameters/active", response_model=schemas.PricingParameterResponse)
@@ -339,7 +353,7 @@ def get_active_pricing_parameter(
     param = crud.get_active_pricing_parameter(db, user_id=current_user.id)
     if not param:
         raise HTTPException(status_code=404, detail="No active pricing parameter found")
-    return param
+    return schemas.PricingParameterResponse.from_orm_fast(param)
 
 
 @router.get("/pricing-parameters/{param_id}", response_model=schemas.PricingParameterResponse)
@@ -352,7 +366,7 @@ def get_pricing_parameter(
     param = crud.get_pricing_parameter(db, param_id, user_id=current_user.id)
     if not param:
         raise HTTPException(status_code=404, detail="Pricing parameter not found")
-    return param
+    return schemas.PricingParameterResponse.from_orm_fast(param)
 
 
 @router.post(
@@ -368,7 +382,7 @@ def create_pricing_parameter(
     """Create a new pricing parameter version for the authenticated user."""
     result = crud.create_pricing_parameter(db, pricing_param, user_id=current_user.id)
     invalidate_pattern("projects:pricing:*")
-    return result
+    return schemas.PricingParameterResponse.from_orm_fast(result)
 
 
 @router.patch("/pricing-parameters/{param_id}", response_model=schemas.PricingParameterResponse)
@@ -383,7 +397,7 @@ def update_pricing_parameter(
     if not param:
         raise HTTPException(status_code=404, detail="Pricing parameter not found")
     invalidate_pattern("projects:pricing:*")
-    return param
+    return schemas.PricingParameterResponse.from_orm_fast(param)
 
 
 @router.delete("/pricing-parameters/{param_id}", status_code=204)
@@ -424,7 +438,10 @@ def get_project_executions(
         status=status,
         opportunity_id=opportunity_id,
     )
-    return {"total": len(executions), "executions": executions}
+    return Response(
+        schemas.ProjectExecutionResponse.dump_list_json(executions, "executions"),
+        media_type="application/json",
+    )
 
 
 @router.get("/executions/{execution_id}", response_model=schemas.ProjectExecutionResponse)
@@ -437,7 +454,7 @@ def get_project_execution(
     execution = crud.get_project_execution(db, execution_id, user_id=current_user.id)
     if not execution:
         raise HTTPException(status_code=404, detail="Project execution not found")
-    return execution
+    return schemas.ProjectExecutionResponse.from_orm_fast(execution)
 
 
 @router.post("/executions/", response_model=schemas.ProjectExecutionResponse, status_code=201)
@@ -450,7 +467,7 @@ def create_project_execution(
     try:
         result = crud.create_project_execution(db, execution, user_id=current_user.id)
         invalidate_pattern("projects:executions:*")
-        return result
+        return schemas.ProjectExecutionResponse.from_orm_fast(result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -469,7 +486,7 @@ def update_project_execution(
     if not execution:
         raise HTTPException(status_code=404, detail="Project execution not found")
     invalidate_pattern("projects:executions:*")
-    return execution
+    return schemas.ProjectExecutionResponse.from_orm_fast(execution)
 
 
 @router.delete("/executions/{execution_id}", status_code=204)
@@ -507,7 +524,10 @@ def get_negotiations(
         opportunity_id=opportunity_id,
         status=status,
     )
-    return {"total": len(negotiations), "negotiations": negotiations}
+    return Response(
+        schemas.NegotiationResponse.dump_list_json(negotiations, "negotiations"),
+        media_type="application/json",
+    )
 
 
 @router.get("/negotiations/{negotiation_id}", response_model=schemas.NegotiationResponse)
@@ -520,12 +540,17 @@ def get_negotiation(
     negotiation = crud.get_negotiation(db, negotiation_id, user_id=current_user.id)
     if not negotiation:
         raise HTTPException(status_code=404, detail="Negotiation not found")
-    return negotiation
+    return schemas.NegotiationResponse.from_orm_fast(negotiation)
 
 
-@router.post("/negotiations/", response_model=schemas.NegotiationResponse, status_code=201)
+@router.post(
+    "/negotiations/",
+    response_model=schemas.NegotiationResponse,
+    status_code=201,
+    openapi_extra=_negotiation_body.openapi_extra,
+)
 def create_negotiation(
-    negotiation: schemas.NegotiationCreate,
+    negotiation: schemas.NegotiationCreate = Depends(_negotiation_body),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -533,7 +558,7 @@ def create_negotiation(
     try:
         result = crud.create_negotiation(db, negotiation, user_id=current_user.id)
         invalidate_pattern("projects:negotiations:*")
-        return result
+        return schemas.NegotiationResponse.from_orm_fast(result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -552,7 +577,7 @@ def update_negotiation(
     if not negotiation:
         raise HTTPException(status_code=404, detail="Negotiation not found")
     invalidate_pattern("projects:negotiations:*")
-    return negotiation
+    return schemas.NegotiationResponse.from_orm_fast(negotiation)
 
 
 @router.delete("/negotiations/{negotiation_id}", status_code=204)
@@ -2,17 +2,20 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from api.auth.dependencies import get_current_user
 from api.cache import invalidate_pattern
+from api.json_body import JSONBody
 from database import crud, schemas
 from database.config import get_db
 from database.models import User
 
 router = APIRouter()
 
+_task_body = JSONBody(schemas.TaskCreate)
+
 
 @router.get(
     "/",
@@ -50,7 +53,10 @@ def get_tasks(
         big_rock_id=big_rock_id,
         task_type=task_type,
     )
-    return {"total": len(tasks), "tasks": tasks}
+    return Response(
+        schemas.TaskResponse.dump_list_json(tasks, "tasks"),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -72,7 +78,7 @@ def get_task(
     task = crud.get_task(db, task_id, user_id=current_user.id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return schemas.TaskResponse.from_orm_fast(task)
 
 
 @router.post(
@@ -98,9 +104,10 @@ def get_task(
         404: {"description": "Big Rock not found (if big_rock_id provided)"},
         422: {"description": "Validation error (invalid input)"},
     },
+    openapi_extra=_task_body.openapi_extra,
 )
 def create_task(
-    task: schemas.TaskCreate,
+    task: schemas.TaskCreate = Depends(_task_body),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -111,7 +118,7 @@ def create_task(
         # Invalidate all task caches
         invalidate_pattern("tasks:*")
 
-        return result
+        return schemas.TaskResponse.from_orm_fast(result)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -141,7 +148,7 @@ def update_task(
     # Invalidate all task caches
     invalidate_pattern("tasks:*")
 
-    return task
+    return schemas.TaskResponse.from_orm_fast(task)
 
 
 @router.post(
@@ -167,7 +174,7 @@ def mark_task_completed(
     # Invalidate all task caches
     invalidate_pattern("tasks:*")
 
-    return task
+    return schemas.TaskResponse.from_orm_fast(task)
 
 
 @router.post(
@@ -193,7 +200,7 @@ def reopen_task(
     # Invalidate all task caches
     invalidate_pattern("tasks:*")
 
-    return task
+    return schemas.TaskResponse.from_orm_fast(task)
 
 
 @router.delete(
@@ -2,8 +2,35 @@
 
 import html
 import re
+from functools import lru_cache
 from typing import Optional
 
+# Compiled once; validated on every Big Rock create/update
+HEX_COLOR_RE = re.compile(r"^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"|?*]')
+# Basic email pattern (RFC 5322 simplified)
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# Common SQL injection patterns, as one alternation
+_SQL_INJECTION_RE = re.compile(
+    "|".join(
+        [
+            r"(\bOR\b|\bAND\b)\s+[\d\w]+\s*=\s*[\d\w]+",  # OR 1=1, AND 1=1
+            r";\s*DROP\s+TABLE",  # ; DROP TABLE
+            r";\s*DELETE\s+FROM",  # ; DELETE FROM
+            r"UNION\s+SELECT",  # UNION SELECT
+            r"--",  # SQL comments
+            r"/\*.*\*/",  # SQL block comments
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Longer inputs (descriptions, notes) are rarely repeated and would bloat the cache
+SANITIZE_CACHE_MAX_LENGTH = 512
+
 
 def sanitize_html(text: str) -> str:
     """
@@ -49,7 +76,9 @@ def sanitize_string(
     max_length: Optional[int] = None,
     allow_newlines: bool = True,
     strip_html: bool = True,
-) -> str:
+    *,
+    none_if_blank: bool = False,
+) -> Optional[str]:
     """
     General purpose string sanitization.
 
@@ -58,17 +87,31 @@ def sanitize_string(
         max_length: Maximum allowed length (None for no limit)
         allow_newlines: Whether to allow newline characters
         strip_html: Whether to escape HTML entities
+        none_if_blank: Return None instead of an empty or whitespace-only result
 
     Returns:
-        Sanitized string
+        Sanitized string (already stripped, so blank means empty)
 
     Examples:
         >>> sanitize_string("<b>Test</b>", max_length=10)
         "&lt;b&gt;Test&lt;/b&gt;"
     """
     if not text:
-        return text
+        return None if none_if_blank else text
+    if len(text) > SANITIZE_CACHE_MAX_LENGTH:
+        sanitized = _sanitize_string(text, max_length, allow_newlines, strip_html)
+    else:
+        # Names and titles repeat across requests; reuse their sanitized form
+        sanitized = _sanitize_string_cached(text, max_length, allow_newlines, strip_html)
+    if none_if_blank and not sanitized:
+        return None
+    return sanitized
+
 
+def _sanitize_string(
+    text: str, max_length: Optional[int], allow_newlines: bool, strip_html: bool
+) -> str:
+    """Apply sanitize_string's steps to a non-empty string."""
     # Strip leading/trailing whitespace
     sanitized = text.strip()
 
@@ -76,10 +119,14 @@ def sanitize_string(
     if not allow_newlines:
         sanitized = sanitized.replace("\n", " ").replace("\r", " ")
         # Collapse multiple spaces
-        sanitized = re.sub(r"\s+", " ", sanitized)
+        sanitized = _WHITESPACE_RE.sub(" ", sanitized)
 
     # Escape HTML if requested
     if strip_html:
+        # Escaping only lengthens text, so the first max_length characters are
+        # all that can reach the truncated result; don't escape the rest
+        if max_length and len(sanitized) > max_length:
+            sanitized = sanitized[:max_length]
         sanitized = sanitize_html(sanitized)
 
     # Enforce max length
@@ -89,6 +136,14 @@ def sanitize_string(
     return sanitized
 
 
+_sanitize_string_cached = lru_cache(maxsize=4096)(_sanitize_string)
+
+
+def clear_sanitize_cache() -> None:
+    """Drop the memoized results of sanitize_string, e.g. to reset between tests."""
+    _sanitize_string_cached.cache_clear()
+
+
 def validate_color_hex(color: str) -> bool:
     """
     Validate hex color code format.
@@ -107,8 +162,10 @@ def validate_color_hex(color: str) -> bool:
     """
     if not color:
         return False
-    pattern = r"^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$"
-    return bool(re.match(pattern, color))
+    # The usual #RRGGBB form is checked without entering the regex engine
+    if len(color) == 7 and color[0] == "#" and _HEX_DIGITS.issuperset(color[1:]):
+        return True
+    return HEX_COLOR_RE.match(color) is not None
 
 
 def sanitize_filename(filename: str) -> str:
@@ -134,7 +191,7 @@ def sanitize_filename(filename: str) -> str:
     sanitized = filename.replace("/", "").replace("\\", "")
 
     # Remove potentially dangerous characters
-    sanitized = re.sub(r'[<>:"|?*]', "", sanitized)
+    sanitized = _UNSAFE_FILENAME_CHARS_RE.sub("", sanitized)
 
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip(". ")
@@ -161,9 +218,7 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    # Basic email pattern (RFC 5322 simplified)
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 
 def sanitize_json_input(data: dict, allowed_keys: set[str]) -> dict:
@@ -230,19 +285,4 @@ class SecurityValidator:
         if not text:
             return False
 
-        # Common SQL injection patterns
-        suspicious_patterns = [
-            r"(\bOR\b|\bAND\b)\s+[\d\w]+\s*=\s*[\d\w]+",  # OR 1=1, AND 1=1
-            r";\s*DROP\s+TABLE",  # ; DROP TABLE
-            r";\s*DELETE\s+FROM",  # ; DELETE FROM
-            r"UNION\s+SELECT",  # UNION SELECT
-            r"--",  # SQL comments
-            r"/\*.*\*/",  # SQL block comments
-        ]
-
-        text_upper = text.upper()
-        for pattern in suspicious_patterns:
-            if re.search(pattern, text_upper, re.IGNORECASE):
-                return True
-
-        return False
+        return _SQL_INJECTION_RE.search(text.upper()) is not None
@@ -23,6 +23,8 @@ celery_app = Celery(
         "tasks.opportunity_collector",
         "tasks.intelligence_automation",
         "tasks.calendar_sync",
+        "tasks.partition_maintenance",
+        "tasks.materialized_views",
     ],
 )
 
@@ -89,6 +91,18 @@ celery_app.conf.update(
             "schedule": crontab(minute=0, hour="*/2"),
             "options": {"expires": 1800},
         },
+        # Create this and next month's event/audit log partitions daily
+        "create-next-partitions-daily": {
+            "task": "maintenance.create_next_partitions",
+            "schedule": crontab(hour=0, minute=15),
+            "options": {"expires": 3600},
+        },
+        # Refresh the per-project hours/value view every 15 minutes
+        "refresh-project-hours-every-15-minutes": {
+            "task": "maintenance.refresh_project_hours",
+            "schedule": crontab(minute="*/15"),
+            "options": {"expires": 600},
+        },
     },
 )
 
@@ -1,8 +1,9 @@
 """Database configuration and connection setup."""
 
+import orjson
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 
 class Settings(BaseSettings):
@@ -16,6 +17,7 @@ class Settings(BaseSettings):
     db_max_overflow: int = 10
     db_pool_timeout: int = 30
     db_pool_recycle: int = 3600  # Recycle connections after 1 hour
+    db_insertmanyvalues_page_size: int = 1000  # Rows per batched INSERT ... RETURNING
 
     # Authentication & JWT
     jwt_secret_key: str = "your-secret-key-change-in-production-use-openssl-rand-hex-32"
@@ -39,6 +41,26 @@ class Settings(BaseSettings):
 # Initialize settings
 settings = Settings()
 
+
+def json_serializer(value) -> str:
+    """Serialize JSON column values with orjson (native datetime support, C speed)."""
+    # json.dumps accepts int/float/bool dict keys; orjson needs the option for them
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+json_deserializer = orjson.loads
+
+
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """
+    Turn on foreign key enforcement, which SQLite leaves off by default.
+
+    Relationships declared with passive_deletes rely on ON DELETE CASCADE, as
+    on PostgreSQL; without it deleting a parent leaves orphaned child rows.
+    """
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
 # Create SQLAlchemy engine with connection pooling
 # SQLite doesn't support pooling parameters, so we handle it differently
 if settings.database_url.startswith("sqlite"):
@@ -46,7 +68,10 @@ if settings.database_url.startswith("sqlite"):
         settings.database_url,
         echo=settings.debug,
         connect_args={"check_same_thread": False},
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
+    event.listen(engine, "connect", enable_sqlite_foreign_keys)
 else:
     engine = create_engine(
         settings.database_url,
@@ -56,13 +81,18 @@ else:
         max_overflow=settings.db_max_overflow,
         pool_timeout=settings.db_pool_timeout,
         pool_recycle=settings.db_pool_recycle,  # Prevent stale connections
+        insertmanyvalues_page_size=settings.db_insertmanyvalues_page_size,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
 # Create Base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for all models (supports both Column and Mapped styles)."""
 
 
 def get_db():
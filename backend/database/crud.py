@@ -34,6 +34,7 @@ from database.schemas import (
     ResponseTemplateUpdate,
     TaskCreate,
     TaskUpdate,
+    apply_patch,
 )
 
 # ==================== Big Rock CRUD ====================
@@ -80,9 +81,7 @@ def update_big_rock(
     if not db_big_rock:
         return None
 
-    update_data = big_rock_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_big_rock, field, value)
+    apply_patch(db_big_rock, big_rock_update)
 
     db.commit()
     db.refresh(db_big_rock)
@@ -171,9 +170,7 @@ def update_task(db: Session, task_id: int, task_update: TaskUpdate, user_id: int
     if not db_task:
         return None
 
-    update_data = task_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_task, field, value)
+    apply_patch(db_task, task_update)
 
     db.commit()
     db.refresh(db_task)
@@ -264,9 +261,7 @@ def update_freelance_project(db: Session, project_id: int, project_update, user_
     if not db_project:
         return None
 
-    update_data = project_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_project, field, value)
+    apply_patch(db_project, project_update)
 
     db.commit()
     db.refresh(db_project)
@@ -319,17 +314,12 @@ def create_work_log(db: Session, log_data, user_id: int):
     if not log_dict.get("work_date"):
         log_dict["work_date"] = date.today()
 
+    # Project actual_hours is kept up to date by the WorkLog flush listeners
     db_log = WorkLog(**log_dict, user_id=user_id)
     db.add(db_log)
     db.commit()
     db.refresh(db_log)
 
-    # Update project actual hours
-    project = get_freelance_project(db, db_log.project_id, user_id)
-    if project:
-        project.update_actual_hours(db)
-        db.commit()
-
     return db_log
 
 
@@ -339,19 +329,11 @@ def update_work_log(db: Session, log_id: int, log_update, user_id: int):
     if not db_log:
         return None
 
-    update_data = log_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_log, field, value)
+    apply_patch(db_log, log_update)
 
     db.commit()
     db.refresh(db_log)
 
-    # Update project actual hours
-    project = get_freelance_project(db, db_log.project_id, user_id)
-    if project:
-        project.update_actual_hours(db)
-        db.commit()
-
     return db_log
 
 
@@ -361,16 +343,9 @@ def delete_work_log(db: Session, log_id: int, user_id: int) -> bool:
     if not db_log:
         return False
 
-    project_id = db_log.project_id
     db.delete(db_log)
     db.commit()
 
-    # Update project actual hours
-    project = get_freelance_project(db, project_id, user_id)
-    if project:
-        project.update_actual_hours(db)
-        db.commit()
-
     return True
 
 
@@ -430,18 +405,11 @@ def create_invoice(db: Session, invoice_data, user_id: int):
     total_hours = sum(log.hours for log in work_logs)
     total_amount = sum(log.calculate_amount() for log in work_logs)
 
-    # Generate invoice number if not provided
-    invoice_number = invoice_data.invoice_number
-    if not invoice_number:
-        today = date.today()
-        count = db.query(Invoice).filter(Invoice.user_id == user_id).count()
-        invoice_number = f"INV-{today.strftime('%Y%m')}-{count + 1:04d}"
-
-    # Create invoice
+    # Create invoice (the database numbers it when invoice_number is empty)
     db_invoice = Invoice(
         user_id=user_id,
         project_id=project_id,
-        invoice_number=invoice_number,
+        invoice_number=invoice_data.invoice_number or None,
         issue_date=date.today(),
         due_date=date.today() + timedelta(days=30),
         total_amount=total_amount,
@@ -457,10 +425,7 @@ def create_invoice(db: Session, invoice_data, user_id: int):
     db.refresh(db_invoice)
 
     # Mark work logs as invoiced
-    for log in work_logs:
-        log.invoiced = True
-        log.invoice_id = db_invoice.id
-
+    WorkLog.bulk_mark_invoiced(db, [log.id for log in work_logs], db_invoice.id)
     db.commit()
 
     return db_invoice
@@ -472,9 +437,7 @@ def update_invoice(db: Session, invoice_id: int, invoice_update, user_id: int):
     if not db_invoice:
         return None
 
-    update_data = invoice_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_invoice, field, value)
+    apply_patch(db_invoice, invoice_update)
 
     db.commit()
     db.refresh(db_invoice)
@@ -552,9 +515,7 @@ def update_platform(db: Session, platform_id: int, platform_update, user_id: int
     if not db_platform:
         return None
 
-    update_data = platform_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_platform, field, value)
+    apply_patch(db_platform, platform_update)
 
     db.commit()
     db.refresh(db_platform)
@@ -647,9 +608,7 @@ def update_opportunity(db: Session, opportunity_id: int, opportunity_update, use
     if not db_opportunity:
         return None
 
-    update_data = opportunity_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_opportunity, field, value)
+    apply_patch(db_opportunity, opportunity_update)
 
     db.commit()
     db.refresh(db_opportunity)
@@ -839,9 +798,7 @@ def update_project_execution(db: Session, execution_id: int, execution_update, u
     if not db_execution:
         return None
 
-    update_data = execution_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_execution, field, value)
+    apply_patch(db_execution, execution_update)
 
     db.commit()
     db.refresh(db_execution)
@@ -920,9 +877,7 @@ def update_negotiation(db: Session, negotiation_id: int, negotiation_update, use
     if not db_negotiation:
         return None
 
-    update_data = negotiation_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_negotiation, field, value)
+    apply_patch(db_negotiation, negotiation_update)
 
     db.commit()
     db.refresh(db_negotiation)
@@ -1105,9 +1060,7 @@ def update_notification_preference(
     if not db_preference:
         return None
 
-    update_data = preference_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_preference, field, value)
+    apply_patch(db_preference, preference_update)
 
     db.commit()
     db.refresh(db_preference)
@@ -1187,9 +1140,7 @@ def update_notification_source(
     if not db_source:
         return None
 
-    update_data = source_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_source, field, value)
+    apply_patch(db_source, source_update)
 
     db.commit()
     db.refresh(db_source)
@@ -1246,9 +1197,7 @@ def update_notification_rule(
     if not db_rule:
         return None
 
-    update_data = rule_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_rule, field, value)
+    apply_patch(db_rule, rule_update)
 
     db.commit()
     db.refresh(db_rule)
@@ -1383,9 +1332,7 @@ def update_focus_session(
     if not db_session:
         return None
 
-    update_data = session_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_session, field, value)
+    apply_patch(db_session, session_update)
 
     db.commit()
     db.refresh(db_session)
@@ -1445,9 +1392,7 @@ def update_response_template(
     if not db_template:
         return None
 
-    update_data = template_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_template, field, value)
+    apply_patch(db_template, template_update)
 
     db.commit()
     db.refresh(db_template)
@@ -0,0 +1,56 @@
+"""replace calendar status indexes with partial indexes
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index only the hot subset of conflicts and sync logs."""
+    op.drop_index("ix_calendar_conflicts_status", table_name="calendar_conflicts")
+    op.create_index(
+        "ix_calendar_conflicts_unresolved",
+        "calendar_conflicts",
+        ["event_id", "user_id"],
+        unique=False,
+        postgresql_where=sa.text("status <> 'resolved'"),
+    )
+
+    op.drop_index("ix_calendar_sync_logs_status", table_name="calendar_sync_logs")
+    op.create_index(
+        "ix_calendar_sync_logs_unhealthy",
+        "calendar_sync_logs",
+        ["connection_id", "started_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('failed', 'partial')"),
+    )
+
+
+def downgrade():
+    """Restore full-column status indexes."""
+    op.drop_index("ix_calendar_sync_logs_unhealthy", table_name="calendar_sync_logs")
+    op.create_index(
+        "ix_calendar_sync_logs_status",
+        "calendar_sync_logs",
+        ["status"],
+        unique=False,
+    )
+
+    op.drop_index("ix_calendar_conflicts_unresolved", table_name="calendar_conflicts")
+    op.create_index(
+        "ix_calendar_conflicts_status",
+        "calendar_conflicts",
+        ["status"],
+        unique=False,
+    )
@@ -0,0 +1,47 @@
+"""add denormalised unresolved conflict counter to calendar events
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add calendar_events.unresolved_conflict_count and backfill it."""
+    op.add_column(
+        "calendar_events",
+        sa.Column(
+            "unresolved_conflict_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE calendar_events e
+        SET unresolved_conflict_count = c.open_count
+        FROM (
+            SELECT event_id, COUNT(*) AS open_count
+            FROM calendar_conflicts
+            WHERE status <> 'resolved'
+            GROUP BY event_id
+        ) c
+        WHERE c.event_id = e.id
+        """
+    )
+
+
+def downgrade():
+    """Remove calendar_events.unresolved_conflict_count."""
+    op.drop_column("calendar_events", "unresolved_conflict_count")
@@ -0,0 +1,49 @@
+"""stamp calendar timestamps server-side as timestamptz
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = {
+    "calendar_connections": ("created_at", "updated_at"),
+    "calendar_events": ("created_at", "updated_at"),
+    "calendar_sync_logs": ("created_at",),
+    "calendar_conflicts": ("created_at", "updated_at"),
+}
+
+
+def upgrade():
+    """Convert calendar created_at/updated_at to timestamptz with now() defaults."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                server_default=sa.text("now()"),
+            )
+
+
+def downgrade():
+    """Revert calendar timestamps to naive UTC datetimes."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                server_default=sa.text("now()"),
+            )
@@ -0,0 +1,85 @@
+"""add trigger-maintained per-user unresolved conflict summary
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create user_conflict_summary, its maintenance trigger, and backfill it."""
+    op.create_table(
+        "user_conflict_summary",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("unresolved_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_user_conflict_summary() RETURNS trigger AS $$
+        DECLARE
+            delta integer := 0;
+            uid integer;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                uid := NEW.user_id;
+                IF NEW.status IS DISTINCT FROM 'resolved' THEN delta := 1; END IF;
+            ELSIF TG_OP = 'UPDATE' THEN
+                uid := NEW.user_id;
+                IF OLD.status IS DISTINCT FROM 'resolved' AND NEW.status = 'resolved' THEN
+                    delta := -1;
+                ELSIF OLD.status = 'resolved' AND NEW.status IS DISTINCT FROM 'resolved' THEN
+                    delta := 1;
+                END IF;
+            ELSE
+                uid := OLD.user_id;
+                IF OLD.status IS DISTINCT FROM 'resolved' THEN delta := -1; END IF;
+            END IF;
+
+            IF delta <> 0 THEN
+                INSERT INTO user_conflict_summary (user_id, unresolved_count)
+                VALUES (uid, delta)
+                ON CONFLICT (user_id) DO UPDATE
+                SET unresolved_count = user_conflict_summary.unresolved_count + EXCLUDED.unresolved_count;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_user_conflict_summary
+        AFTER INSERT OR UPDATE OF status OR DELETE ON calendar_conflicts
+        FOR EACH ROW EXECUTE FUNCTION bump_user_conflict_summary();
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO user_conflict_summary (user_id, unresolved_count)
+        SELECT user_id, COUNT(*)
+        FROM calendar_conflicts
+        WHERE status <> 'resolved'
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade():
+    """Drop the conflict summary trigger and table."""
+    op.execute("DROP TRIGGER IF EXISTS trg_user_conflict_summary ON calendar_conflicts")
+    op.execute("DROP FUNCTION IF EXISTS bump_user_conflict_summary()")
+    op.drop_table("user_conflict_summary")
@@ -0,0 +1,139 @@
+"""convert calendar sync/conflict status and type columns to native enums
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+# (table, column, enum name, values, old varchar length)
+ENUM_COLUMNS = [
+    (
+        "calendar_sync_logs",
+        "sync_type",
+        "calendar_sync_type",
+        ("manual", "scheduled", "webhook"),
+        20,
+    ),
+    (
+        "calendar_sync_logs",
+        "direction",
+        "calendar_sync_direction",
+        ("to_calendar", "from_calendar", "both"),
+        20,
+    ),
+    (
+        "calendar_sync_logs",
+        "status",
+        "calendar_sync_status",
+        ("started", "success", "failed", "partial"),
+        20,
+    ),
+    (
+        "calendar_conflicts",
+        "conflict_type",
+        "calendar_conflict_type",
+        ("both_modified", "time_conflict", "duplicate", "deletion_conflict"),
+        50,
+    ),
+    (
+        "calendar_conflicts",
+        "status",
+        "calendar_conflict_status",
+        ("detected", "resolved", "manual_review"),
+        20,
+    ),
+]
+
+
+def _drop_partial_indexes():
+    # Partial index predicates reference the varchar columns; rebuild them after
+    op.drop_index("ix_calendar_sync_logs_unhealthy", table_name="calendar_sync_logs")
+    op.drop_index("ix_calendar_conflicts_unresolved", table_name="calendar_conflicts")
+
+
+def _create_partial_indexes():
+    op.create_index(
+        "ix_calendar_sync_logs_unhealthy",
+        "calendar_sync_logs",
+        ["connection_id", "started_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('failed', 'partial')"),
+    )
+    op.create_index(
+        "ix_calendar_conflicts_unresolved",
+        "calendar_conflicts",
+        ["event_id", "user_id"],
+        unique=False,
+        postgresql_where=sa.text("status <> 'resolved'"),
+    )
+
+
+def _drop_status_trigger():
+    # UPDATE OF status pins the column type; PostgreSQL refuses the ALTER while it exists
+    op.execute("DROP TRIGGER IF EXISTS trg_user_conflict_summary ON calendar_conflicts")
+
+
+def _create_status_trigger():
+    op.execute(
+        "CREATE TRIGGER trg_user_conflict_summary "
+        "AFTER INSERT OR UPDATE OF status OR DELETE ON calendar_conflicts "
+        "FOR EACH ROW EXECUTE FUNCTION bump_user_conflict_summary()"
+    )
+
+
+def upgrade():
+    """Replace VARCHAR + CHECK columns with PostgreSQL ENUM types."""
+    _drop_partial_indexes()
+    _drop_status_trigger()
+    op.alter_column("calendar_conflicts", "status", server_default=None)
+
+    for table, column, enum_name, values, _length in ENUM_COLUMNS:
+        postgresql.ENUM(*values, name=enum_name).create(op.get_bind(), checkfirst=True)
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_{column}_check")
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.ENUM(*values, name=enum_name, create_type=False),
+            postgresql_using=f"{column}::{enum_name}",
+        )
+
+    op.alter_column(
+        "calendar_conflicts",
+        "status",
+        server_default=sa.text("'detected'::calendar_conflict_status"),
+    )
+    _create_partial_indexes()
+    _create_status_trigger()
+
+
+def downgrade():
+    """Restore VARCHAR + CHECK columns."""
+    _drop_partial_indexes()
+    _drop_status_trigger()
+    op.alter_column("calendar_conflicts", "status", server_default=None)
+
+    for table, column, enum_name, values, length in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=length),
+            postgresql_using=f"{column}::text",
+        )
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.create_check_constraint(f"{table}_{column}_check", table, f"{column} IN ({allowed})")
+        postgresql.ENUM(name=enum_name).drop(op.get_bind(), checkfirst=True)
+
+    op.alter_column("calendar_conflicts", "status", server_default="detected")
+    _create_partial_indexes()
+    _create_status_trigger()
@@ -0,0 +1,53 @@
+"""store calendar conflict external version as a diff against charlee version
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace calendar_conflicts.external_version with external_diff."""
+    op.add_column("calendar_conflicts", sa.Column("external_diff", sa.JSON(), nullable=True))
+    op.execute(
+        """
+        UPDATE calendar_conflicts c
+        SET external_diff = COALESCE(
+            (
+                SELECT jsonb_object_agg(e.key, e.value)
+                FROM jsonb_each(c.external_version::jsonb) e
+                WHERE c.charlee_version IS NULL
+                   OR NOT (c.charlee_version::jsonb ? e.key)
+                   OR c.charlee_version::jsonb -> e.key IS DISTINCT FROM e.value
+            ),
+            '{}'::jsonb
+        )::json
+        WHERE c.external_version IS NOT NULL
+        """
+    )
+    op.drop_column("calendar_conflicts", "external_version")
+
+
+def downgrade():
+    """Restore the full calendar_conflicts.external_version column."""
+    op.add_column("calendar_conflicts", sa.Column("external_version", sa.JSON(), nullable=True))
+    op.execute(
+        """
+        UPDATE calendar_conflicts
+        SET external_version = (
+            COALESCE(charlee_version::jsonb, '{}'::jsonb) || external_diff::jsonb
+        )::json
+        WHERE external_diff IS NOT NULL
+        """
+    )
+    op.drop_column("calendar_conflicts", "external_diff")
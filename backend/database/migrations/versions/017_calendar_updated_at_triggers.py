@@ -0,0 +1,43 @@
+"""stamp calendar updated_at columns with a BEFORE UPDATE trigger
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+TABLES = ("calendar_connections", "calendar_events", "calendar_conflicts")
+
+
+def upgrade():
+    """Create set_updated_at() and attach it to the calendar tables."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade():
+    """Drop the updated_at triggers."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
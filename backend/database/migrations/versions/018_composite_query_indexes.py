@@ -0,0 +1,82 @@
+"""replace single-column user indexes with composite query indexes
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index the per-user listing predicates and the event bus queue."""
+    op.drop_index(op.f("ix_tasks_user_id"), table_name="tasks")
+    op.create_index(
+        "ix_tasks_user_status_deadline",
+        "tasks",
+        ["user_id", "status", "deadline"],
+        unique=False,
+    )
+
+    op.drop_index(op.f("ix_work_logs_user_id"), table_name="work_logs")
+    op.drop_index(op.f("ix_work_logs_project_id"), table_name="work_logs")
+    op.create_index(
+        "ix_work_logs_user_date",
+        "work_logs",
+        ["user_id", "work_date"],
+        unique=False,
+        postgresql_include=["hours", "project_id"],
+    )
+    op.create_index(
+        "ix_work_logs_project_id_billable",
+        "work_logs",
+        ["project_id", "billable"],
+        unique=False,
+    )
+
+    op.drop_index(op.f("ix_invoices_user_id"), table_name="invoices")
+    op.create_index(
+        "ix_invoices_user_status_issue",
+        "invoices",
+        ["user_id", "status", "issue_date"],
+        unique=False,
+    )
+
+    op.drop_index(op.f("ix_system_events_processado"), table_name="system_events")
+    op.create_index(
+        "ix_system_events_unprocessed",
+        "system_events",
+        [sa.text("prioridade DESC"), "criado_em"],
+        unique=False,
+        postgresql_where=sa.text("processado = false"),
+    )
+
+
+def downgrade():
+    """Restore the single-column indexes."""
+    op.drop_index("ix_system_events_unprocessed", table_name="system_events")
+    op.create_index(
+        op.f("ix_system_events_processado"),
+        "system_events",
+        ["processado"],
+        unique=False,
+    )
+
+    op.drop_index("ix_invoices_user_status_issue", table_name="invoices")
+    op.create_index(op.f("ix_invoices_user_id"), "invoices", ["user_id"], unique=False)
+
+    op.drop_index("ix_work_logs_project_id_billable", table_name="work_logs")
+    op.drop_index("ix_work_logs_user_date", table_name="work_logs")
+    op.create_index(op.f("ix_work_logs_project_id"), "work_logs", ["project_id"], unique=False)
+    op.create_index(op.f("ix_work_logs_user_id"), "work_logs", ["user_id"], unique=False)
+
+    op.drop_index("ix_tasks_user_status_deadline", table_name="tasks")
+    op.create_index(op.f("ix_tasks_user_id"), "tasks", ["user_id"], unique=False)
@@ -0,0 +1,88 @@
+"""store daily log times as TIME and comma-separated lists as text[]
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs converted from comma-separated TEXT to text[]
+ARRAY_COLUMNS = [
+    ("menstrual_cycles", "symptoms"),
+    ("daily_logs", "special_events"),
+    ("freelance_projects", "tags"),
+]
+
+
+def upgrade():
+    """Convert HH:MM strings to TIME and CSV text to arrays with GIN indexes."""
+    for column in ("wake_time", "sleep_time"):
+        op.alter_column(
+            "daily_logs",
+            column,
+            type_=sa.Time(),
+            existing_type=sa.String(length=5),
+            postgresql_using=f"NULLIF({column}, '')::time",
+        )
+
+    for table, column in ARRAY_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.ARRAY(sa.String()),
+            existing_type=sa.Text(),
+            # Trim items and drop empty ones (USING cannot hold an unnest subquery)
+            postgresql_using=(
+                "NULLIF(array_remove(regexp_split_to_array("
+                rf"NULLIF(btrim({column}), ''), '\s*,\s*'), ''), '{{}}')"
+            ),
+        )
+
+    op.create_index(
+        "ix_menstrual_cycles_symptoms_gin",
+        "menstrual_cycles",
+        ["symptoms"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_freelance_projects_tags_gin",
+        "freelance_projects",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade():
+    """Restore the string columns."""
+    op.drop_index("ix_freelance_projects_tags_gin", table_name="freelance_projects")
+    op.drop_index("ix_menstrual_cycles_symptoms_gin", table_name="menstrual_cycles")
+
+    for table, column in ARRAY_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.ARRAY(sa.String()),
+            postgresql_using=f"array_to_string({column}, ',')",
+        )
+
+    for column in ("wake_time", "sleep_time"):
+        op.alter_column(
+            "daily_logs",
+            column,
+            type_=sa.String(length=5),
+            existing_type=sa.Time(),
+            postgresql_using=f"to_char({column}, 'HH24:MI')",
+        )
@@ -0,0 +1,40 @@
+"""cascade invoice deletes from their freelance project
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Let PostgreSQL remove a project's invoices (ORM uses passive_deletes)."""
+    op.drop_constraint("invoices_project_id_fkey", "invoices", type_="foreignkey")
+    op.create_foreign_key(
+        "invoices_project_id_fkey",
+        "invoices",
+        "freelance_projects",
+        ["project_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade():
+    """Restore the non-cascading foreign key."""
+    op.drop_constraint("invoices_project_id_fkey", "invoices", type_="foreignkey")
+    op.create_foreign_key(
+        "invoices_project_id_fkey",
+        "invoices",
+        "freelance_projects",
+        ["project_id"],
+        ["id"],
+    )
@@ -0,0 +1,87 @@
+"""fill high-insert timestamps and flags with server-side defaults
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+# (table, column) creation timestamps now stamped by now() as timestamptz
+TIMESTAMP_COLUMNS = [
+    ("users", "created_at"),
+    ("refresh_tokens", "created_at"),
+    ("audit_logs", "created_at"),
+    ("system_events", "criado_em"),
+    ("tasks", "created_at"),
+    ("work_logs", "created_at"),
+]
+
+# (table, column) other timestamps on the same tables, converted alongside so a
+# row never mixes naive and aware values
+AWARE_COLUMNS = [
+    ("users", "updated_at"),
+    ("system_events", "processado_em"),
+    ("tasks", "updated_at"),
+    ("tasks", "completed_at"),
+    ("work_logs", "updated_at"),
+]
+
+# (table, column, default) flags and counters filled in by the database
+VALUE_DEFAULTS = [
+    ("users", "is_active", "true"),
+    ("users", "is_superuser", "false"),
+    ("refresh_tokens", "revoked", "false"),
+    ("system_events", "prioridade", "5"),
+    ("system_events", "processado", "false"),
+    ("work_logs", "billable", "true"),
+    ("work_logs", "invoiced", "false"),
+]
+
+
+def upgrade():
+    """Move insert defaults from Python to the database."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            server_default=sa.text("now()"),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+    for table, column in AWARE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+    for table, column, default in VALUE_DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text(default))
+
+
+def downgrade():
+    """Drop the flag defaults and restore naive timestamps (now() defaults stay)."""
+    for table, column, _default in VALUE_DEFAULTS:
+        op.alter_column(table, column, server_default=None)
+
+    for table, column in TIMESTAMP_COLUMNS + AWARE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
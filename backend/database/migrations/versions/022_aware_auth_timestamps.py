@@ -0,0 +1,49 @@
+"""store lockout and refresh token timestamps as timestamptz
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+# (table, column) compared against aware datetimes on every login/refresh
+AWARE_COLUMNS = [
+    ("users", "locked_until"),
+    ("users", "last_failed_login"),
+    ("users", "last_login"),
+    ("refresh_tokens", "expires_at"),
+    ("refresh_tokens", "revoked_at"),
+]
+
+
+def upgrade():
+    """Convert naive UTC values to timestamptz."""
+    for table, column in AWARE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade():
+    """Restore naive UTC timestamps."""
+    for table, column in AWARE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,30 @@
+"""number invoices from a database sequence
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-18 16:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+NEXT_INVOICE_NUMBER = "'INV-' || lpad(nextval('invoice_number_seq')::text, 8, '0')"
+
+
+def upgrade():
+    """Create invoice_number_seq and use it as the invoice_number default."""
+    op.execute("CREATE SEQUENCE IF NOT EXISTS invoice_number_seq")
+    op.alter_column("invoices", "invoice_number", server_default=sa.text(NEXT_INVOICE_NUMBER))
+
+
+def downgrade():
+    """Drop the invoice_number default and its sequence."""
+    op.alter_column("invoices", "invoice_number", server_default=None)
+    op.execute("DROP SEQUENCE IF EXISTS invoice_number_seq")
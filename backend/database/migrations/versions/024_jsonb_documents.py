@@ -0,0 +1,68 @@
+"""store event and decision documents as jsonb with GIN indexes
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+# (table, column) converted from json to jsonb
+JSONB_COLUMNS = [
+    ("audit_logs", "event_metadata"),
+    ("system_events", "payload"),
+    ("cross_module_relations", "relation_metadata"),
+    ("integrated_decisions", "modulos_envolvidos"),
+    ("user_settings", "integrations"),
+]
+
+# (index, table, column) GIN indexes for containment (@>) lookups
+GIN_INDEXES = [
+    ("ix_system_events_payload_gin", "system_events", "payload"),
+    ("ix_integrated_decisions_modulos_gin", "integrated_decisions", "modulos_envolvidos"),
+]
+
+
+def upgrade():
+    """Convert the columns to jsonb and index them."""
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade():
+    """Drop the GIN indexes and restore json columns."""
+    for name, table, _column in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,96 @@
+"""convert task, cycle, project and invoice status columns to native enums
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-18 17:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "025"
+down_revision = "024"
+branch_labels = None
+depends_on = None
+
+# (table, column, enum name, values, old varchar length, server default)
+ENUM_COLUMNS = [
+    (
+        "tasks",
+        "type",
+        "task_type",
+        ("fixed_appointment", "task", "continuous"),
+        20,
+        None,
+    ),
+    (
+        "tasks",
+        "status",
+        "task_status",
+        ("pending", "in_progress", "completed", "cancelled"),
+        20,
+        None,
+    ),
+    (
+        "menstrual_cycles",
+        "phase",
+        "cycle_phase",
+        ("menstrual", "follicular", "ovulation", "luteal"),
+        20,
+        None,
+    ),
+    (
+        "freelance_projects",
+        "status",
+        "freelance_project_status",
+        ("proposal", "active", "completed", "cancelled"),
+        20,
+        "proposal",
+    ),
+    (
+        "invoices",
+        "status",
+        "invoice_status",
+        ("draft", "sent", "paid", "overdue", "cancelled"),
+        20,
+        "draft",
+    ),
+]
+
+
+def upgrade():
+    """Replace VARCHAR + CHECK columns with PostgreSQL ENUM types."""
+    for table, column, enum_name, values, _length, default in ENUM_COLUMNS:
+        postgresql.ENUM(*values, name=enum_name).create(op.get_bind(), checkfirst=True)
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_{column}_check")
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.ENUM(*values, name=enum_name, create_type=False),
+            postgresql_using=f"{column}::{enum_name}",
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=sa.text(f"'{default}'::{enum_name}"))
+
+
+def downgrade():
+    """Restore VARCHAR + CHECK columns."""
+    for table, column, enum_name, values, length, default in ENUM_COLUMNS:
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=length),
+            postgresql_using=f"{column}::text",
+        )
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.create_check_constraint(f"{table}_{column}_check", table, f"{column} IN ({allowed})")
+        postgresql.ENUM(name=enum_name).drop(op.get_bind(), checkfirst=True)
+        if default is not None:
+            op.alter_column(table, column, server_default=default)
@@ -0,0 +1,51 @@
+"""store freelance hours, rates and amounts as exact numerics
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "026"
+down_revision = "025"
+branch_labels = None
+depends_on = None
+
+# (table, column, precision, scale)
+NUMERIC_COLUMNS = [
+    ("freelance_projects", "hourly_rate", 8, 2),
+    ("freelance_projects", "estimated_hours", 8, 2),
+    ("freelance_projects", "actual_hours", 8, 2),
+    ("work_logs", "hours", 8, 2),
+    ("invoices", "total_amount", 12, 2),
+    ("invoices", "total_hours", 8, 2),
+    ("invoices", "hourly_rate", 8, 2),
+]
+
+
+def upgrade():
+    """Convert double precision columns to NUMERIC."""
+    for table, column, precision, scale in NUMERIC_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Numeric(precision, scale),
+            existing_type=sa.Float(),
+            postgresql_using=f"round({column}::numeric, {scale})",
+        )
+
+
+def downgrade():
+    """Restore double precision columns."""
+    for table, column, precision, scale in NUMERIC_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(precision, scale),
+            postgresql_using=f"{column}::double precision",
+        )
@@ -0,0 +1,42 @@
+"""replace append-only timestamp B-trees with BRIN indexes
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-18 18:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "027"
+down_revision = "026"
+branch_labels = None
+depends_on = None
+
+# (table, column, old B-tree index, new BRIN index)
+BRIN_COLUMNS = [
+    ("system_events", "criado_em", "ix_system_events_criado_em", "ix_system_events_criado_brin"),
+    ("audit_logs", "created_at", "ix_audit_logs_created_at", "ix_audit_logs_created_brin"),
+    ("work_logs", "work_date", "ix_work_logs_work_date", "ix_work_logs_work_date_brin"),
+]
+
+
+def upgrade():
+    """Swap the B-tree indexes for BRIN (64 pages per range)."""
+    for table, column, btree, brin in BRIN_COLUMNS:
+        op.drop_index(btree, table_name=table)
+        op.create_index(
+            brin,
+            table,
+            [column],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        )
+
+
+def downgrade():
+    """Restore the B-tree indexes."""
+    for table, column, btree, brin in BRIN_COLUMNS:
+        op.drop_index(brin, table_name=table)
+        op.create_index(btree, table, [column], unique=False)
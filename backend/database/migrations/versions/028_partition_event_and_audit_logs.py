@@ -0,0 +1,154 @@
+"""range-partition system_events and audit_logs by month
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+# (table, partition key)
+PARTITIONED_TABLES = [
+    ("system_events", "criado_em"),
+    ("audit_logs", "created_at"),
+]
+
+# Creates <parent>_YYYY_MM covering the month that contains for_month (idempotent).
+# Rows for that month already caught by <parent>_default would overlap the new
+# bounds, so the default is detached, its rows for the month moved across, and
+# re-attached, all under the parent's lock in the caller's transaction.
+CREATE_MONTHLY_PARTITION = """
+CREATE OR REPLACE FUNCTION create_monthly_partition(parent text, for_month date)
+RETURNS text AS $$
+DECLARE
+    month_start date := date_trunc('month', for_month)::date;
+    month_end date := (date_trunc('month', for_month) + interval '1 month')::date;
+    partition_name text := format('%s_%s', parent, to_char(month_start, 'YYYY_MM'));
+    default_name text := parent || '_default';
+    partition_key text;
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    IF to_regclass(default_name) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, parent, month_start, month_end
+        );
+        RETURN partition_name;
+    END IF;
+
+    SELECT a.attname INTO partition_key
+    FROM pg_partitioned_table p
+    JOIN pg_attribute a ON a.attrelid = p.partrelid AND a.attnum = p.partattrs[0]
+    WHERE p.partrelid = parent::regclass;
+
+    EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, default_name);
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, parent, month_start, month_end
+    );
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        default_name, partition_key, month_start, partition_key, month_end, partition_name
+    );
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I DEFAULT', parent, default_name);
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _detach(table):
+    """Rename table aside and return the index and FK DDL to rebuild on its successor."""
+    bind = op.get_bind()
+    index_defs = (
+        bind.exec_driver_sql(
+            "SELECT indexdef FROM pg_indexes "
+            f"WHERE tablename = '{table}' AND indexname <> '{table}_pkey'"
+        )
+        .scalars()
+        .all()
+    )
+    foreign_keys = bind.exec_driver_sql(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        f"WHERE conrelid = '{table}'::regclass AND contype = 'f'"
+    ).all()
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_old_pkey")
+    return index_defs, foreign_keys
+
+
+def _attach(table, index_defs, foreign_keys):
+    """Move the rows and id sequence into the new table, then rebuild indexes and FKs."""
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {table}_old")
+
+    for index_def in index_defs:
+        op.execute(index_def)
+    for name, definition in foreign_keys:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+
+
+def _partition(table, key):
+    """Rebuild table as a monthly range-partitioned table."""
+    # The key joins the primary key below, so it can no longer hold NULLs
+    op.execute(f"UPDATE {table} SET {key} = now() WHERE {key} IS NULL")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN {key} SET NOT NULL")
+    index_defs, foreign_keys = _detach(table)
+
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE ({key})"
+    )
+    # Unique constraints on a partitioned table must include the partition key
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, {key})")
+
+    # One partition per month already holding rows, through next month
+    op.execute(
+        f"SELECT create_monthly_partition('{table}', month::date) "
+        "FROM generate_series("
+        f"date_trunc('month', COALESCE((SELECT min({key}) FROM {table}_old), now())), "
+        "date_trunc('month', now() + interval '1 month'), "
+        "interval '1 month') AS month"
+    )
+    # Catches rows outside the created months (e.g. if the maintenance task stalls)
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    _attach(table, index_defs, foreign_keys)
+
+
+def _unpartition(table):
+    """Merge a partitioned table back into a plain table."""
+    index_defs, foreign_keys = _detach(table)
+
+    op.execute(f"CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+
+    _attach(table, index_defs, foreign_keys)
+
+
+def upgrade():
+    """Convert the append-only log tables to monthly range partitions."""
+    op.execute(CREATE_MONTHLY_PARTITION)
+    for table, key in PARTITIONED_TABLES:
+        _partition(table, key)
+
+
+def downgrade():
+    """Merge the partitions back into plain tables."""
+    for table, key in PARTITIONED_TABLES:
+        _unpartition(table)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {key} DROP NOT NULL")
+    op.execute("DROP FUNCTION IF EXISTS create_monthly_partition(text, date)")
@@ -0,0 +1,76 @@
+"""store daily log cycle phase and productive period as native enums
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-18 19:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+PERIODO_PRODUTIVO = ("manha", "tarde", "noite", "madrugada")
+
+# Legacy Portuguese spellings written by the seed script; anything else becomes NULL
+CYCLE_PHASE_FROM_TEXT = """
+CASE lower(cycle_phase)
+    WHEN 'menstrual' THEN 'menstrual'
+    WHEN 'follicular' THEN 'follicular'
+    WHEN 'folicular' THEN 'follicular'
+    WHEN 'ovulation' THEN 'ovulation'
+    WHEN 'ovulatória' THEN 'ovulation'
+    WHEN 'luteal' THEN 'luteal'
+    WHEN 'lútea' THEN 'luteal'
+END::cycle_phase
+"""
+
+
+def upgrade():
+    """Replace the free-text columns with the cycle_phase and periodo_produtivo ENUMs."""
+    op.alter_column(
+        "daily_logs",
+        "cycle_phase",
+        type_=postgresql.ENUM(name="cycle_phase", create_type=False),
+        existing_type=sa.String(length=20),
+        postgresql_using=CYCLE_PHASE_FROM_TEXT,
+    )
+
+    postgresql.ENUM(*PERIODO_PRODUTIVO, name="periodo_produtivo").create(
+        op.get_bind(), checkfirst=True
+    )
+    allowed = ", ".join(f"'{value}'" for value in PERIODO_PRODUTIVO)
+    op.alter_column(
+        "global_context",
+        "periodo_produtivo",
+        type_=postgresql.ENUM(*PERIODO_PRODUTIVO, name="periodo_produtivo", create_type=False),
+        existing_type=sa.String(length=20),
+        postgresql_using=(
+            f"CASE WHEN periodo_produtivo IN ({allowed}) "
+            "THEN periodo_produtivo::periodo_produtivo END"
+        ),
+    )
+
+
+def downgrade():
+    """Restore VARCHAR columns."""
+    op.alter_column(
+        "global_context",
+        "periodo_produtivo",
+        type_=sa.String(length=20),
+        postgresql_using="periodo_produtivo::text",
+    )
+    postgresql.ENUM(name="periodo_produtivo").drop(op.get_bind(), checkfirst=True)
+
+    op.alter_column(
+        "daily_logs",
+        "cycle_phase",
+        type_=sa.String(length=20),
+        postgresql_using="cycle_phase::text",
+    )
@@ -0,0 +1,41 @@
+"""add mv_project_hours materialized view
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "030"
+down_revision = "029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the per-project hours/value view and its indexes."""
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_project_hours AS
+        SELECT p.id AS project_id,
+               p.user_id AS user_id,
+               COALESCE(SUM(w.hours), 0) AS actual_hours,
+               COALESCE(SUM(w.hours * p.hourly_rate), 0) AS actual_value
+        FROM freelance_projects p
+        LEFT JOIN work_logs w ON w.project_id = p.id
+        GROUP BY p.id, p.user_id
+        """
+    )
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        "ix_mv_project_hours_project_id", "mv_project_hours", ["project_id"], unique=True
+    )
+    op.create_index("ix_mv_project_hours_user_id", "mv_project_hours", ["user_id"])
+
+
+def downgrade():
+    """Drop the view (its indexes go with it)."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_project_hours")
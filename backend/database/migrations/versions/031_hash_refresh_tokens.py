@@ -0,0 +1,41 @@
+"""store refresh tokens as sha256 digests
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-18 20:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "031"
+down_revision = "030"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace the raw token column with its 32-byte SHA-256 digest."""
+    op.add_column("refresh_tokens", sa.Column("token_hash", sa.LargeBinary(length=32)))
+    op.execute("UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))")
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+    op.create_unique_constraint("refresh_tokens_token_hash_key", "refresh_tokens", ["token_hash"])
+
+    op.drop_index("ix_refresh_tokens_token", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "token")
+
+
+def downgrade():
+    """Restore the raw token column; digests cannot be reversed, so tokens are revoked."""
+    op.add_column("refresh_tokens", sa.Column("token", sa.String(length=500)))
+    op.execute(
+        "UPDATE refresh_tokens SET token = encode(token_hash, 'hex'), "
+        "revoked = true, revoked_at = COALESCE(revoked_at, now())"
+    )
+    op.alter_column("refresh_tokens", "token", nullable=False)
+    op.create_index("ix_refresh_tokens_token", "refresh_tokens", ["token"], unique=True)
+
+    op.drop_constraint("refresh_tokens_token_hash_key", "refresh_tokens", type_="unique")
+    op.drop_column("refresh_tokens", "token_hash")
@@ -0,0 +1,40 @@
+"""store calendar_conflicts.resolved_at as timestamptz
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "032"
+down_revision = "031"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert naive UTC resolved_at values to timestamptz."""
+    op.alter_column(
+        "calendar_conflicts",
+        "resolved_at",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        existing_nullable=True,
+        postgresql_using="resolved_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade():
+    """Restore naive UTC timestamps."""
+    op.alter_column(
+        "calendar_conflicts",
+        "resolved_at",
+        type_=sa.DateTime(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="resolved_at AT TIME ZONE 'UTC'",
+    )
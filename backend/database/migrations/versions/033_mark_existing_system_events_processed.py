@@ -0,0 +1,27 @@
+"""mark system events saved before claim-based processing as processed
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-18 21:15:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "033"
+down_revision = "032"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Retire the backlog so the first claim does not replay history to subscribers."""
+    # The old consumer never flagged rows (its filter was always false), so every
+    # existing event is still pending although its handlers already ran.
+    # processado_em stays NULL: when they were handled was never recorded.
+    op.execute("UPDATE system_events SET processado = true WHERE processado = false")
+
+
+def downgrade():
+    """Nothing to undo: the rows cannot be told apart from ones processed later."""
@@ -1,31 +1,168 @@
 """SQLAlchemy database models for Charlee V1."""
 
-from datetime import datetime, timezone
+import csv
+import functools
+import hashlib
+import io
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from typing import Any, Optional
 
 from sqlalchemy import (
+    DDL,
     JSON,
     Boolean,
     CheckConstraint,
     Column,
     Date,
     DateTime,
+    Enum,
+    FetchedValue,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
+    MetaData,
+    Numeric,
+    Sequence,
     String,
+    Table,
     Text,
+    Time,
+    TypeDecorator,
     UniqueConstraint,
+    event,
+    bindparam,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
 )
 from pgvector.sqlalchemy import Vector
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import (
+    Mapped,
+    attributes,
+    column_property,
+    deferred,
+    mapped_column,
+    relationship,
+)
+from sqlalchemy.sql.functions import FunctionElement
+
+from database.config import Base, json_serializer
+
+
+# Timezone-aware datetime default; a partial avoids an extra Python frame per INSERT
+utc_now = functools.partial(datetime.now, timezone.utc)
+
+
+class _SQLiteUTCDateTime(TypeDecorator):
+    """SQLite drops tzinfo on storage; hand values back as aware UTC datetimes."""
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
 
-from database.config import Base
+# Always-aware timestamp: timestamptz on PostgreSQL, UTC-tagged on SQLite (tests)
+AwareDateTime = DateTime(timezone=True).with_variant(_SQLiteUTCDateTime(), "sqlite")
 
+# Native text[] on PostgreSQL; stored as a JSON list on SQLite (tests)
+StringArray = ARRAY(String).with_variant(JSON(), "sqlite")
 
-# Helper function for timezone-aware datetime defaults
-def utc_now():
-    """Return current UTC datetime with timezone info."""
-    return datetime.now(timezone.utc)
+# Binary jsonb on PostgreSQL (no re-parse on read, GIN-indexable); plain JSON on SQLite
+JSONDocument = JSONB().with_variant(JSON(), "sqlite")
+
+
+# Values of the cycle_phase ENUM, shared by MenstrualCycle and DailyLog
+CYCLE_PHASES = ("menstrual", "follicular", "ovulation", "luteal")
+
+
+def rating_column(name: str, **kwargs) -> Column:
+    """Integer column constrained to a 1-10 self-reported scale."""
+    return Column(name, Integer, CheckConstraint(f"{name} BETWEEN 1 AND 10"), **kwargs)
+
+
+# Batches at least this large are streamed with COPY on PostgreSQL
+COPY_THRESHOLD = 100
+
+
+def bulk_insert_copy(db_session, model, rows: list[dict]) -> int:
+    """
+    Insert many plain-dict rows for ``model`` without per-object ORM overhead.
+
+    On PostgreSQL, batches of COPY_THRESHOLD rows or more are streamed with
+    COPY; smaller batches and other dialects use an ORM bulk INSERT. Neither
+    path fires mapper events, so callers maintain any derived columns.
+    Returns the number of rows inserted.
+    """
+    if not rows:
+        return 0
+    connection = db_session.connection()
+    if connection.dialect.name != "postgresql" or len(rows) < COPY_THRESHOLD:
+        db_session.execute(insert(model), rows)
+        return len(rows)
+
+    table = model.__table__
+    # COPY skips client-side defaults, so evaluate them once for the batch
+    defaults = {}
+    for column in table.columns:
+        default = column.default
+        if default is not None and (default.is_scalar or default.is_callable):
+            defaults[column.name] = default.arg(None) if default.is_callable else default.arg
+    columns = [c for c in table.columns if c.name in rows[0] or c.name in defaults]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(
+            [
+                _copy_value(column, row.get(column.name, defaults.get(column.name)))
+                for column in columns
+            ]
+        )
+    buffer.seek(0)
+
+    column_list = ", ".join(column.name for column in columns)
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            rf"COPY {table.name} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\N')",
+            buffer,
+        )
+    return len(rows)
+
+
+def _copy_value(column, value):
+    if value is None:
+        return r"\N"
+    if isinstance(column.type, JSON):
+        return json_serializer(value)
+    if isinstance(column.type, ARRAY):
+        return _array_literal(value)
+    return value
+
+
+def _array_literal(values) -> str:
+    """Render a list as a PostgreSQL array literal, e.g. ``{"a","b c",NULL}``."""
+    elements = []
+    for value in values:
+        if value is None:
+            elements.append("NULL")
+        else:
+            escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+            elements.append(f'"{escaped}"')
+    return "{" + ",".join(elements) + "}"
 
 
 # ==================== Authentication Models ====================
@@ -41,52 +178,90 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), unique=True, nullable=False, index=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    hashed_password = Column(String(255), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    username: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # User profile
-    full_name = Column(String(100), nullable=True)
-    is_active = Column(Boolean, default=True)
-    is_superuser = Column(Boolean, default=False)
+    full_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text("true"))
+    is_superuser: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text("false"))
 
     # OAuth fields
-    oauth_provider = Column(String(50), nullable=True)  # 'google', 'github', None (local)
-    oauth_id = Column(String(255), nullable=True, index=True)  # Provider's user ID
-    avatar_url = Column(String(500), nullable=True)
+    oauth_provider: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )  # 'google', 'github', None (local)
+    oauth_id: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True, index=True
+    )  # Provider's user ID
+    avatar_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Account lockout fields
-    failed_login_attempts = Column(Integer, default=0)
-    locked_until = Column(DateTime, nullable=True)
-    last_failed_login = Column(DateTime, nullable=True)
+    failed_login_attempts: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    locked_until: Mapped[Optional[datetime]] = mapped_column(AwareDateTime, nullable=True)
+    last_failed_login: Mapped[Optional[datetime]] = mapped_column(AwareDateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
-    last_login = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
+    last_login: Mapped[Optional[datetime]] = mapped_column(AwareDateTime, nullable=True)
 
     # Relationships
-    big_rocks = relationship("BigRock", back_populates="user", cascade="all, delete-orphan")
-    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan")
+    # The user row is loaded on every authenticated request, so its collections
+    # are never loaded implicitly: lazy="raise" fails loud on accidental per-user
+    # lazy loads and read paths opt in with selectinload() where they need them.
+    # passive_deletes leaves unloaded children to the FKs' ON DELETE CASCADE.
+    big_rocks = relationship(
+        "BigRock",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    tasks = relationship(
+        "Task",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
     menstrual_cycles = relationship(
-        "MenstrualCycle", back_populates="user", cascade="all, delete-orphan"
+        "MenstrualCycle",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    daily_logs = relationship(
+        "DailyLog",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
-    daily_logs = relationship("DailyLog", back_populates="user", cascade="all, delete-orphan")
     refresh_tokens = relationship(
-        "RefreshToken", back_populates="user", cascade="all, delete-orphan"
+        "RefreshToken",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    audit_logs = relationship(
+        "AuditLog",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
-    audit_logs = relationship("AuditLog", back_populates="user", cascade="all, delete-orphan")
 
     def is_locked(self) -> bool:
         """Check if account is currently locked."""
-        if self.locked_until is None:
-            return False
-        # Ensure locked_until is timezone-aware
-        locked_until = self.locked_until
-        if locked_until.tzinfo is None:
-            locked_until = locked_until.replace(tzinfo=timezone.utc)
-        return datetime.now(timezone.utc) < locked_until
+        return self.locked_until is not None and utc_now() < self.locked_until
 
     def reset_failed_attempts(self) -> None:
         """Reset failed login attempts counter."""
@@ -107,19 +282,24 @@ class RefreshToken(Base):
 
     __tablename__ = "refresh_tokens"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    token = Column(String(500), unique=True, nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    # SHA-256 of the issued token: a 32-byte unique key, and no usable tokens at rest
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, nullable=False)
 
     # Token metadata
-    expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=utc_now)
-    revoked = Column(Boolean, default=False)
-    revoked_at = Column(DateTime, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(AwareDateTime, nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    revoked: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text("false"))
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(AwareDateTime, nullable=True)
 
     # Device/session tracking
-    user_agent = Column(String(255), nullable=True)
-    ip_address = Column(String(50), nullable=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Relationships
     user = relationship("User", back_populates="refresh_tokens")
@@ -127,6 +307,11 @@ class RefreshToken(Base):
     def __repr__(self):
         return f"<RefreshToken(id={self.id}, user_id={self.user_id}, revoked={self.revoked})>"
 
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """Digest stored and looked up in place of the raw refresh token."""
+        return hashlib.sha256(token.encode()).digest()
+
 
 class AuditLog(Base):
     """
@@ -136,27 +321,46 @@ class AuditLog(Base):
     """
 
     __tablename__ = "audit_logs"
+    # Range-partitioned by month on created_at in PostgreSQL (migration 028, with
+    # primary key (id, created_at)) so old months can be dropped instead of deleted
+    __table_args__ = (
+        # Append-only timestamp: a BRIN summary per block range instead of a B-tree
+        Index(
+            "ix_audit_logs_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True
+    )
 
     # Event information
-    event_type = Column(
+    event_type: Mapped[str] = mapped_column(
         String(50), nullable=False, index=True
     )  # 'login', 'logout', 'register', etc.
-    event_status = Column(String(20), nullable=False)  # 'success', 'failure', 'blocked'
-    event_message = Column(Text, nullable=True)
+    event_status: Mapped[str] = mapped_column(
+        String(20), nullable=False
+    )  # 'success', 'failure', 'blocked'
+    event_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Request metadata
-    ip_address = Column(String(50), nullable=True, index=True)
-    user_agent = Column(String(255), nullable=True)
-    request_path = Column(String(255), nullable=True)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    request_path: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Additional data (JSON)
-    event_metadata = Column(JSON, nullable=True)  # Extra contextual information
+    event_metadata: Mapped[Optional[Any]] = mapped_column(
+        JSONDocument, nullable=True
+    )  # Extra contextual information
 
     # Timestamp
-    created_at = Column(DateTime, default=utc_now, index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
 
     # Relationships
     user = relationship("User", back_populates="audit_logs")
@@ -178,18 +382,20 @@ class BigRock(Base):
 
     __tablename__ = "big_rocks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    name = Column(String(100), nullable=False)
-    color = Column(String(20))  # For future UI (e.g., "#FF5733")
-    active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=utc_now)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    color: Mapped[Optional[str]] = mapped_column(String(20))  # For future UI (e.g., "#FF5733")
+    active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     # Relationships
     user = relationship("User", back_populates="big_rocks")
-    tasks = relationship("Task", back_populates="big_rock")
+    # Task.big_rock is joined-loaded; eager-loading the reverse side would pull
+    # every task of the rock back in whenever a single task is read.
+    tasks = relationship("Task", back_populates="big_rock", lazy="raise")
 
     def __repr__(self):
         return f"<BigRock(id={self.id}, name='{self.name}', user_id={self.user_id})>"
@@ -206,53 +412,77 @@ class Task(Base):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Per-user listings filter on status and sort by deadline
+        Index("ix_tasks_user_status_deadline", "user_id", "status", "deadline"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    description = Column(Text, nullable=False)
-    type = Column(
-        String(20),
-        CheckConstraint("type IN ('fixed_appointment', 'task', 'continuous')"),
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    # Closed value sets are native PostgreSQL ENUMs (4-byte, no collation on compare)
+    type: Mapped[Optional[str]] = mapped_column(
+        Enum("fixed_appointment", "task", "continuous", name="task_type", create_constraint=True),
         default="task",
     )
-    deadline = Column(Date, nullable=True)
-    big_rock_id = Column(Integer, ForeignKey("big_rocks.id"), nullable=True)
-    status = Column(
-        String(20),
-        CheckConstraint("status IN ('pending', 'in_progress', 'completed', 'cancelled')"),
+    deadline: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    big_rock_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("big_rocks.id"), nullable=True
+    )
+    status: Mapped[Optional[str]] = mapped_column(
+        Enum(
+            "pending",
+            "in_progress",
+            "completed",
+            "cancelled",
+            name="task_status",
+            create_constraint=True,
+        ),
         default="pending",
     )
 
     # Prioritization (V2)
-    calculated_priority = Column(Integer, default=5)  # 1 (most urgent) to 10 (least urgent)
-    priority_score = Column(Float, default=0.0)  # Score calculated by algorithm
+    calculated_priority: Mapped[Optional[int]] = mapped_column(
+        Integer, default=5
+    )  # 1 (most urgent) to 10 (least urgent)
+    priority_score: Mapped[Optional[float]] = mapped_column(
+        Float, default=0.0
+    )  # Score calculated by algorithm
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
-    completed_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     user = relationship("User", back_populates="tasks")
-    big_rock = relationship("BigRock", back_populates="tasks")
-    attachments = relationship("Attachment", back_populates="task", cascade="all, delete-orphan")
+    # Serialized with every task response; joined keeps it in the same SELECT
+    big_rock = relationship("BigRock", back_populates="tasks", lazy="joined")
+    attachments = relationship(
+        "Attachment", back_populates="task", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Task(id={self.id}, description='{self.description[:30]}...', status='{self.status}', user_id={self.user_id})>"
 
     def mark_as_completed(self):
         """Mark task as completed."""
+        now = utc_now()
         self.status = "completed"
-        self.completed_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.completed_at = now
+        self.updated_at = now
 
     def reopen(self):
         """Reopen a completed task."""
         self.status = "pending"
         self.completed_at = None
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = utc_now()
 
 
 class Attachment(Base):
@@ -268,43 +498,51 @@ class Attachment(Base):
 
     __tablename__ = "attachments"
 
-    id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    task_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    user_id = Column(
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # File information
-    file_type = Column(
+    file_type: Mapped[str] = mapped_column(
         String(20),
         CheckConstraint("file_type IN ('audio', 'image', 'document')"),
         nullable=False,
         index=True,
     )
-    file_name = Column(String(255), nullable=False)
-    file_size = Column(Integer, nullable=False)  # Size in bytes
-    file_url = Column(String(500), nullable=True)  # URL or path to stored file
-    mime_type = Column(String(100), nullable=True)  # e.g., 'audio/mp3', 'image/png'
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # Size in bytes
+    file_url: Mapped[Optional[str]] = mapped_column(
+        String(500), nullable=True
+    )  # URL or path to stored file
+    mime_type: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )  # e.g., 'audio/mp3', 'image/png'
 
     # Processing results
-    transcription = Column(Text, nullable=True)  # For audio files
-    analysis = Column(Text, nullable=True)  # For image files
-    processing_status = Column(
+    transcription: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # For audio files
+    analysis: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # For image files
+    processing_status: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint("processing_status IN ('pending', 'processing', 'completed', 'failed')"),
         default="completed",
         index=True,
     )
-    error_message = Column(Text, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Additional metadata (JSON)
-    file_metadata = Column(JSON, nullable=True)  # Language, detected entities, etc.
+    file_metadata: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Language, detected entities, etc.
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -332,29 +570,29 @@ class MenstrualCycle(Base):
     """
 
     __tablename__ = "menstrual_cycles"
+    __table_args__ = (
+        Index("ix_menstrual_cycles_symptoms_gin", "symptoms", postgresql_using="gin"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    start_date = Column(Date, nullable=False)
-    phase = Column(
-        String(20),
-        CheckConstraint("phase IN ('menstrual', 'follicular', 'ovulation', 'luteal')"),
-        nullable=False,
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    phase: Mapped[str] = mapped_column(
+        Enum(*CYCLE_PHASES, name="cycle_phase", create_constraint=True), nullable=False
     )
-    # Symptoms as comma-separated list
-    symptoms = Column(Text, nullable=True)  # 'fatigue,high_creativity,pain'
+    symptoms: Mapped[Optional[list[str]]] = mapped_column(
+        StringArray, nullable=True
+    )  # ['fatigue', 'high_creativity', 'pain']
 
     # Energy and mood levels (1-10)
-    energy_level = Column(Integer, CheckConstraint("energy_level BETWEEN 1 AND 10"), nullable=True)
-    focus_level = Column(Integer, CheckConstraint("focus_level BETWEEN 1 AND 10"), nullable=True)
-    creativity_level = Column(
-        Integer, CheckConstraint("creativity_level BETWEEN 1 AND 10"), nullable=True
-    )
+    energy_level = rating_column("energy_level", nullable=True)
+    focus_level = rating_column("focus_level", nullable=True)
+    creativity_level = rating_column("creativity_level", nullable=True)
 
-    notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=utc_now)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     # Relationships
     user = relationship("User", back_populates="menstrual_cycles")
@@ -373,21 +611,27 @@ class CyclePatterns(Base):
 
     __tablename__ = "cycle_patterns"
 
-    id = Column(Integer, primary_key=True, index=True)
-    phase = Column(String(20), nullable=False)
-    identified_pattern = Column(Text, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    phase: Mapped[str] = mapped_column(String(20), nullable=False)
+    identified_pattern: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Average metrics for this phase
-    average_productivity = Column(Float, default=1.0)  # Multiplier (1.0 = normal)
-    average_focus = Column(Float, default=1.0)
-    average_energy = Column(Float, default=1.0)
+    average_productivity: Mapped[Optional[float]] = mapped_column(
+        Float, default=1.0
+    )  # Multiplier (1.0 = normal)
+    average_focus: Mapped[Optional[float]] = mapped_column(Float, default=1.0)
+    average_energy: Mapped[Optional[float]] = mapped_column(Float, default=1.0)
 
-    confidence_score = Column(Float, default=0.0)  # 0.0 to 1.0
-    suggestions = Column(Text, nullable=True)  # Suggestions separated by ;
-    samples_used = Column(Integer, default=0)
+    confidence_score: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # 0.0 to 1.0
+    suggestions: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # Suggestions separated by ;
+    samples_used: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     def __repr__(self):
         return f"<CyclePatterns(phase='{self.phase}', confidence={self.confidence_score})>"
@@ -403,22 +647,26 @@ class Workload(Base):
 
     __tablename__ = "workloads"
 
-    id = Column(Integer, primary_key=True, index=True)
-    period_start = Column(Date, nullable=False)
-    period_end = Column(Date, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    period_end: Mapped[date] = mapped_column(Date, nullable=False)
 
-    big_rock_id = Column(Integer, ForeignKey("big_rocks.id"), nullable=True)
+    big_rock_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("big_rocks.id"), nullable=True
+    )
 
     # Load estimates
-    estimated_hours = Column(Float, default=0.0)
-    available_hours = Column(Float, default=0.0)
-    load_percentage = Column(Float, default=0.0)  # (estimated/available) * 100
+    estimated_hours: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    available_hours: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    load_percentage: Mapped[Optional[float]] = mapped_column(
+        Float, default=0.0
+    )  # (estimated/available) * 100
 
     # Alerts
-    at_risk = Column(Boolean, default=False)
-    risk_reason = Column(Text, nullable=True)
+    at_risk: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    risk_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    calculated_at = Column(DateTime, default=utc_now)
+    calculated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     # Relationships
     big_rock = relationship("BigRock")
@@ -437,41 +685,35 @@ class DailyLog(Base):
     __tablename__ = "daily_logs"
     __table_args__ = (UniqueConstraint("user_id", "date", name="uix_user_date"),)
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    date = Column(Date, nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
 
     # Sleep
-    wake_time = Column(String(5), nullable=True)  # HH:MM
-    sleep_time = Column(String(5), nullable=True)  # HH:MM
-    sleep_hours = Column(Float, nullable=True)
-    sleep_quality = Column(
-        Integer, CheckConstraint("sleep_quality BETWEEN 1 AND 10"), nullable=True
-    )
+    wake_time: Mapped[Optional[time]] = mapped_column(Time, nullable=True)
+    sleep_time: Mapped[Optional[time]] = mapped_column(Time, nullable=True)
+    sleep_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    sleep_quality = rating_column("sleep_quality", nullable=True)
 
     # Energy throughout the day
-    morning_energy = Column(
-        Integer, CheckConstraint("morning_energy BETWEEN 1 AND 10"), nullable=True
-    )
-    afternoon_energy = Column(
-        Integer, CheckConstraint("afternoon_energy BETWEEN 1 AND 10"), nullable=True
-    )
-    evening_energy = Column(
-        Integer, CheckConstraint("evening_energy BETWEEN 1 AND 10"), nullable=True
-    )
+    morning_energy = rating_column("morning_energy", nullable=True)
+    afternoon_energy = rating_column("afternoon_energy", nullable=True)
+    evening_energy = rating_column("evening_energy", nullable=True)
 
     # Productivity
-    deep_work_hours = Column(Float, default=0.0)
-    completed_tasks = Column(Integer, default=0)
+    deep_work_hours: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    completed_tasks: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Context
-    cycle_phase = Column(String(20), nullable=True)
-    special_events = Column(Text, nullable=True)  # Comma-separated
-    free_notes = Column(Text, nullable=True)
+    cycle_phase: Mapped[Optional[str]] = mapped_column(
+        Enum(*CYCLE_PHASES, name="cycle_phase", create_constraint=True), nullable=True
+    )
+    special_events: Mapped[Optional[list[str]]] = mapped_column(StringArray, nullable=True)
+    free_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at = Column(DateTime, default=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     # Relationships
     user = relationship("User", back_populates="daily_logs")
@@ -492,8 +734,8 @@ class UserSettings(Base):
 
     __tablename__ = "user_settings"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
@@ -502,32 +744,36 @@ class UserSettings(Base):
     )
 
     # Display preferences
-    theme = Column(String(20), default="auto")  # auto, light, dark
-    density = Column(String(20), default="comfortable")  # compact, comfortable, spacious
-    timezone = Column(String(50), default="America/Sao_Paulo")
-    language = Column(String(10), default="pt-BR")
+    theme: Mapped[Optional[str]] = mapped_column(String(20), default="auto")  # auto, light, dark
+    density: Mapped[Optional[str]] = mapped_column(
+        String(20), default="comfortable"
+    )  # compact, comfortable, spacious
+    timezone: Mapped[Optional[str]] = mapped_column(String(50), default="America/Sao_Paulo")
+    language: Mapped[Optional[str]] = mapped_column(String(10), default="pt-BR")
 
     # Notification preferences
-    notifications_enabled = Column(Boolean, default=True)
-    email_notifications = Column(Boolean, default=False)
-    push_notifications = Column(Boolean, default=True)
+    notifications_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    email_notifications: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    push_notifications: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
 
     # Work preferences
-    work_hours_per_day = Column(Integer, default=8)
-    work_days_per_week = Column(Integer, default=5)
-    planning_horizon_days = Column(Integer, default=7)
+    work_hours_per_day: Mapped[Optional[int]] = mapped_column(Integer, default=8)
+    work_days_per_week: Mapped[Optional[int]] = mapped_column(Integer, default=5)
+    planning_horizon_days: Mapped[Optional[int]] = mapped_column(Integer, default=7)
 
     # Wellness preferences
-    cycle_tracking_enabled = Column(Boolean, default=True)
-    cycle_length_days = Column(Integer, default=28)
+    cycle_tracking_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    cycle_length_days: Mapped[Optional[int]] = mapped_column(Integer, default=28)
 
     # Integration settings (JSON for flexibility)
-    integrations = Column(JSON, default={})
+    integrations: Mapped[Optional[Any]] = mapped_column(JSONDocument, default={})
     # Example: {"google_calendar": {"enabled": false}, "notion": {"enabled": false}}
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -548,32 +794,125 @@ class SystemEvent(Base):
     """
 
     __tablename__ = "system_events"
+    # Range-partitioned by month on criado_em in PostgreSQL (migration 028, with
+    # primary key (id, criado_em)) so old months can be dropped instead of deleted
+    __table_args__ = (
+        # jsonb_path_ops: smaller GIN index serving payload @> '{"task_id": 42}' lookups
+        Index(
+            "ix_system_events_payload_gin",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        # Append-only timestamp: a BRIN summary per block range instead of a B-tree
+        Index(
+            "ix_system_events_criado_brin",
+            "criado_em",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
+    )
+    # Fetch server defaults in the batched INSERT ... RETURNING, not a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     # Event identification
-    tipo = Column(String(100), nullable=False, index=True)
+    tipo: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     # Examples: 'task_created', 'project_accepted', 'focus_started',
     # 'cycle_phase_changed', 'capacity_alert', 'okr_updated'
 
-    modulo_origem = Column(String(50), nullable=False, index=True)
+    modulo_origem: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     # Examples: 'task_manager', 'projects', 'focus', 'wellness', 'capacity'
 
     # Event data
-    payload = Column(JSON, nullable=False)
+    payload: Mapped[Any] = mapped_column(JSONDocument, nullable=False)
     # Event-specific data
 
     # Processing
-    prioridade = Column(Integer, default=5, index=True)
-    processado = Column(Boolean, default=False, index=True)
+    prioridade: Mapped[Optional[int]] = mapped_column(Integer, server_default=text("5"), index=True)
+    processado: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text("false"))
 
     # Timestamps
-    criado_em = Column(DateTime, default=utc_now, index=True)
-    processado_em = Column(DateTime, nullable=True)
+    criado_em: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    processado_em: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     def __repr__(self):
         return f"<SystemEvent(id={self.id}, tipo='{self.tipo}', origem='{self.modulo_origem}')>"
 
+    @classmethod
+    def bulk_publish(cls, db_session, events: list[dict]) -> list[int]:
+        """
+        Persist a batch of events in one round trip and return their ids in order.
+
+        Small batches use a batched INSERT ... RETURNING. COPY cannot return
+        ids, so large PostgreSQL batches draw theirs from the sequence first.
+        """
+        if not events:
+            return []
+        if db_session.connection().dialect.name != "postgresql" or len(events) < COPY_THRESHOLD:
+            statement = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+            return list(db_session.scalars(statement, events))
+
+        event_ids = list(
+            db_session.scalars(
+                text(
+                    "SELECT nextval(pg_get_serial_sequence('system_events', 'id')) "
+                    "FROM generate_series(1, :count)"
+                ),
+                {"count": len(events)},
+            )
+        )
+        bulk_insert_copy(
+            db_session,
+            cls,
+            [{**event, "id": event_id} for event, event_id in zip(events, event_ids)],
+        )
+        return event_ids
+
+    @classmethod
+    def claim_batch(cls, db_session, limit: int = 100) -> list["SystemEvent"]:
+        """
+        Lock the next pending events for processing.
+
+        Rows are read through ix_system_events_unprocessed with FOR UPDATE SKIP
+        LOCKED, so concurrent workers never block on or double-claim the same
+        event. The locks last until the caller's transaction ends; call
+        mark_processed() once the handlers have run, then commit.
+        """
+        return list(
+            db_session.scalars(
+                select(cls)
+                .where(cls.processado.is_(False))
+                .order_by(cls.prioridade.desc(), cls.criado_em)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+        )
+
+    @classmethod
+    def mark_processed(cls, db_session, event_ids: list[int]) -> None:
+        """Mark claimed events as processed with a single UPDATE."""
+        if event_ids:
+            db_session.execute(
+                update(cls)
+                .where(cls.id.in_(event_ids))
+                .values(processado=True, processado_em=utc_now())
+            )
+
+
+# Event bus consumer queue: only pending events, in the order they are drained
+Index(
+    "ix_system_events_unprocessed",
+    SystemEvent.prioridade.desc(),
+    SystemEvent.criado_em,
+    postgresql_where=text("processado = false"),
+)
+
 
 class GlobalContext(Base):
     """
@@ -585,34 +924,44 @@ class GlobalContext(Base):
 
     __tablename__ = "global_context"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Current state
-    fase_ciclo = Column(String(20), nullable=True)
-    energia_atual = Column(Integer, CheckConstraint("energia_atual BETWEEN 1 AND 10"), default=7)
-    carga_trabalho_percentual = Column(Float, default=50.0)
-    em_sessao_foco = Column(Boolean, default=False)
+    fase_ciclo: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    energia_atual = rating_column("energia_atual", default=7)
+    carga_trabalho_percentual: Mapped[Optional[float]] = mapped_column(Float, default=50.0)
+    em_sessao_foco: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Aggregated metrics
-    tarefas_pendentes = Column(Integer, default=0)
-    projetos_ativos = Column(Integer, default=0)
-    notificacoes_nao_lidas = Column(Integer, default=0)
+    tarefas_pendentes: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    projetos_ativos: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    notificacoes_nao_lidas: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Temporal context
-    hora_dia = Column(Integer, CheckConstraint("hora_dia BETWEEN 0 AND 23"), nullable=True)
-    dia_semana = Column(Integer, CheckConstraint("dia_semana BETWEEN 0 AND 6"), nullable=True)
-    periodo_produtivo = Column(String(20), nullable=True)
-    # Examples: 'manha', 'tarde', 'noite'
+    hora_dia: Mapped[Optional[int]] = mapped_column(
+        Integer, CheckConstraint("hora_dia BETWEEN 0 AND 23"), nullable=True
+    )
+    dia_semana: Mapped[Optional[int]] = mapped_column(
+        Integer, CheckConstraint("dia_semana BETWEEN 0 AND 6"), nullable=True
+    )
+    periodo_produtivo: Mapped[Optional[str]] = mapped_column(
+        Enum(
+            "manha", "tarde", "noite", "madrugada", name="periodo_produtivo", create_constraint=True
+        ),
+        nullable=True,
+    )
 
     # Emotional state (inferred)
-    nivel_stress = Column(Integer, CheckConstraint("nivel_stress BETWEEN 1 AND 10"), default=5)
-    necessita_pausa = Column(Boolean, default=False)
+    nivel_stress = rating_column("nivel_stress", default=5)
+    necessita_pausa: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Timestamps
-    atualizado_em = Column(DateTime, default=utc_now, onupdate=utc_now)
+    atualizado_em: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -631,26 +980,26 @@ class CrossModuleRelation(Base):
 
     __tablename__ = "cross_module_relations"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     # Relation type
-    tipo_relacao = Column(String(50), nullable=False, index=True)
+    tipo_relacao: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     # Examples: 'project_to_task', 'notification_to_task',
     # 'task_to_okr', 'project_to_portfolio'
 
     # Origin entity
-    modulo_origem = Column(String(50), nullable=False, index=True)
-    entidade_origem_id = Column(Integer, nullable=False, index=True)
+    modulo_origem: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    entidade_origem_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
 
     # Destination entity
-    modulo_destino = Column(String(50), nullable=False, index=True)
-    entidade_destino_id = Column(Integer, nullable=False, index=True)
+    modulo_destino: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    entidade_destino_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
 
     # Additional metadata
-    relation_metadata = Column(JSON, nullable=True)
+    relation_metadata: Mapped[Optional[Any]] = mapped_column(JSONDocument, nullable=True)
 
     # Timestamps
-    criado_em = Column(DateTime, default=utc_now)
+    criado_em: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     def __repr__(self):
         return f"<CrossModuleRelation(tipo='{self.tipo_relacao}', {self.modulo_origem}→{self.modulo_destino})>"
@@ -665,32 +1014,40 @@ class IntegratedDecision(Base):
     """
 
     __tablename__ = "integrated_decisions"
+    __table_args__ = (
+        Index(
+            "ix_integrated_decisions_modulos_gin",
+            "modulos_envolvidos",
+            postgresql_using="gin",
+            postgresql_ops={"modulos_envolvidos": "jsonb_path_ops"},
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     # Decision context
-    situacao = Column(Text, nullable=False)
+    situacao: Mapped[str] = mapped_column(Text, nullable=False)
     # Description of the situation requiring decision
 
-    modulos_envolvidos = Column(JSON, nullable=False)
+    modulos_envolvidos: Mapped[Any] = mapped_column(JSONDocument, nullable=False)
     # List of modules involved in the decision
 
-    contexto_considerado = Column(JSON, nullable=False)
+    contexto_considerado: Mapped[Any] = mapped_column(JSON, nullable=False)
     # Snapshot of context at decision time
 
     # Decision process
-    opcoes_avaliadas = Column(JSON, nullable=True)
+    opcoes_avaliadas: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     # List of options that were considered
 
-    decisao_tomada = Column(Text, nullable=False)
-    justificativa = Column(Text, nullable=False)
+    decisao_tomada: Mapped[str] = mapped_column(Text, nullable=False)
+    justificativa: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Execution
-    executado = Column(Boolean, default=False)
-    resultado = Column(Text, nullable=True)
+    executado: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    resultado: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    criado_em = Column(DateTime, default=utc_now, index=True)
+    criado_em: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now, index=True)
 
     def __repr__(self):
         return f"<IntegratedDecision(id={self.id}, modulos={len(self.modulos_envolvidos)}, executado={self.executado})>"
@@ -720,67 +1077,100 @@ class FreelanceProject(Base):
     """
 
     __tablename__ = "freelance_projects"
+    __table_args__ = (Index("ix_freelance_projects_tags_gin", "tags", postgresql_using="gin"),)
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
-    )
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     # Project information
-    client_name = Column(String(200), nullable=False)
-    project_name = Column(String(200), nullable=False)
-    description = Column(Text, nullable=True)
+    client_name: Mapped[str] = mapped_column(String(200))
+    project_name: Mapped[str] = mapped_column(String(200))
+    description: Mapped[Optional[str]] = mapped_column(Text)
 
-    # Financial
-    hourly_rate = Column(Float, nullable=False)  # Rate per hour
-    estimated_hours = Column(Float, nullable=False)  # Estimated total hours
-    actual_hours = Column(Float, default=0.0)  # Actual hours worked (computed from WorkLog)
+    # Financial (exact decimals: SUM(hours * rate) needs no rounding fix-ups)
+    hourly_rate: Mapped[Decimal] = mapped_column(Numeric(8, 2))  # Rate per hour
+    estimated_hours: Mapped[Decimal] = mapped_column(Numeric(8, 2))  # Estimated total hours
+    # Actual hours worked (computed from WorkLog)
+    actual_hours: Mapped[Optional[Decimal]] = mapped_column(Numeric(8, 2), default=0)
 
     # Scheduling
-    start_date = Column(Date, nullable=True)
-    deadline = Column(Date, nullable=True)
-    completed_date = Column(Date, nullable=True)
+    start_date: Mapped[Optional[date]]
+    deadline: Mapped[Optional[date]]
+    completed_date: Mapped[Optional[date]]
 
     # Status tracking
-    status = Column(
-        String(20),
-        CheckConstraint("status IN ('proposal', 'active', 'completed', 'cancelled')"),
+    status: Mapped[Optional[str]] = mapped_column(
+        Enum(
+            "proposal",
+            "active",
+            "completed",
+            "cancelled",
+            name="freelance_project_status",
+            create_constraint=True,
+        ),
         default="proposal",
         index=True,
     )
 
     # Project metadata
-    notes = Column(Text, nullable=True)
-    tags = Column(Text, nullable=True)  # Comma-separated tags
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    tags: Mapped[Optional[list[str]]] = mapped_column(StringArray)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(default=utc_now, onupdate=utc_now)
 
     # Relationships
-    user = relationship("User")
-    work_logs = relationship("WorkLog", back_populates="project", cascade="all, delete-orphan")
-    invoices = relationship("Invoice", back_populates="project", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship()
+    # Unbounded history: never eager-loaded alongside the project (WorkLog.project
+    # is joined-loaded, so selectin here would drag every log in with a single one)
+    work_logs: Mapped[list["WorkLog"]] = relationship(
+        back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
+    invoices: Mapped[list["Invoice"]] = relationship(
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
 
     def __repr__(self):
         return f"<FreelanceProject(id={self.id}, client='{self.client_name}', project='{self.project_name}', status='{self.status}')>"
 
-    def calculate_total_value(self) -> float:
+    def calculate_total_value(self) -> Decimal:
         """Calculate total project value based on actual hours worked."""
         return self.actual_hours * self.hourly_rate
 
-    def calculate_estimated_value(self) -> float:
+    def calculate_estimated_value(self) -> Decimal:
         """Calculate estimated project value based on estimated hours."""
         return self.estimated_hours * self.hourly_rate
 
     def update_actual_hours(self, db_session):
         """Update actual_hours from work logs."""
-        from sqlalchemy import func
-
         total = (
             db_session.query(func.sum(WorkLog.hours)).filter(WorkLog.project_id == self.id).scalar()
         )
-        self.actual_hours = total or 0.0
+        self.actual_hours = total or 0
+
+    @classmethod
+    def recompute_actual_hours(cls, db_session, user_id: Optional[int] = None) -> int:
+        """
+        Recompute actual_hours for many projects in a single UPDATE.
+
+        Work logs keep the column up to date incrementally; this is the full
+        rebuild for repairing drift. Returns the number of projects updated.
+        """
+        total_hours = (
+            select(func.coalesce(func.sum(WorkLog.hours), 0))
+            .where(WorkLog.project_id == cls.id)
+            .scalar_subquery()
+        )
+        stmt = update(cls).values(actual_hours=total_hours)
+        if user_id is not None:
+            stmt = stmt.where(cls.user_id == user_id)
+        result = db_session.execute(stmt.execution_options(synchronize_session="fetch"))
+        return result.rowcount
 
 
 class WorkLog(Base):
@@ -792,49 +1182,143 @@ class WorkLog(Base):
     """
 
     __tablename__ = "work_logs"
-
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    __table_args__ = (
+        # Covers per-user timesheets (index-only scans for hours per project)
+        Index(
+            "ix_work_logs_user_date",
+            "user_id",
+            "work_date",
+            postgresql_include=["hours", "project_id"],
+        ),
+        # Serves the per-project hours SUM and billable filters
+        Index("ix_work_logs_project_id_billable", "project_id", "billable"),
+        # Logs arrive roughly in date order; user-scoped lookups use ix_work_logs_user_date
+        Index(
+            "ix_work_logs_work_date_brin",
+            "work_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
     )
-    project_id = Column(
-        Integer,
-        ForeignKey("freelance_projects.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+    # Fetch server defaults in the batched INSERT ... RETURNING, not a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    # active_history on project_id and hours so the incremental actual_hours
+    # listeners always see the previous values
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("freelance_projects.id", ondelete="CASCADE"), active_history=True
     )
 
     # Time tracking
-    work_date = Column(Date, nullable=False, index=True)
-    hours = Column(Float, nullable=False)
-    description = Column(Text, nullable=False)
+    work_date: Mapped[date]
+    hours: Mapped[Decimal] = mapped_column(Numeric(8, 2), active_history=True)
+    description: Mapped[str] = mapped_column(Text)
 
     # Optional categorization
-    task_type = Column(String(50), nullable=True)  # e.g., 'development', 'design', 'meeting'
+    # e.g., 'development', 'design', 'meeting'
+    task_type: Mapped[Optional[str]] = mapped_column(String(50))
 
     # Billing
-    billable = Column(Boolean, default=True)
-    invoiced = Column(Boolean, default=False, index=True)  # Has this been included in an invoice?
-    invoice_id = Column(Integer, ForeignKey("invoices.id"), nullable=True, index=True)
+    billable: Mapped[Optional[bool]] = mapped_column(server_default=text("true"))
+    # Has this been included in an invoice?
+    invoiced: Mapped[Optional[bool]] = mapped_column(server_default=text("false"), index=True)
+    invoice_id: Mapped[Optional[int]] = mapped_column(ForeignKey("invoices.id"), index=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
-    user = relationship("User")
-    project = relationship("FreelanceProject", back_populates="work_logs")
-    invoice = relationship("Invoice", back_populates="work_logs")
+    user: Mapped["User"] = relationship()
+    project: Mapped["FreelanceProject"] = relationship(back_populates="work_logs", lazy="joined")
+    invoice: Mapped[Optional["Invoice"]] = relationship(back_populates="work_logs", lazy="joined")
 
     def __repr__(self):
         return f"<WorkLog(id={self.id}, project_id={self.project_id}, date={self.work_date}, hours={self.hours})>"
 
-    def calculate_amount(self) -> float:
+    def calculate_amount(self) -> Decimal:
         """Calculate billable amount for this work log."""
         if not self.billable or not self.project:
-            return 0.0
+            return Decimal(0)
         return self.hours * self.project.hourly_rate
 
+    @classmethod
+    def bulk_mark_invoiced(cls, db_session, log_ids: list[int], invoice_id: int) -> int:
+        """
+        Attach work logs to an invoice with a single UPDATE.
+
+        In-session WorkLog objects are not synchronized; they pick up the new
+        values when expired on commit. Returns the number of logs updated.
+        """
+        if not log_ids:
+            return 0
+        result = db_session.execute(
+            update(cls)
+            .where(cls.id.in_(log_ids))
+            .values(invoiced=True, invoice_id=invoice_id, updated_at=utc_now()),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount
+
+
+def _bump_actual_hours(connection, project_id: int, delta: Decimal) -> None:
+    """Adjust FreelanceProject.actual_hours in-database."""
+    projects_table = FreelanceProject.__table__
+    connection.execute(
+        update(projects_table)
+        .where(projects_table.c.id == project_id)
+        .values(actual_hours=func.coalesce(projects_table.c.actual_hours, 0) + delta)
+    )
+
+
+@event.listens_for(WorkLog, "after_insert")
+def _work_log_inserted(mapper, connection, target):
+    _bump_actual_hours(connection, target.project_id, target.hours)
+
+
+@event.listens_for(WorkLog, "after_update")
+def _work_log_updated(mapper, connection, target):
+    hours = attributes.get_history(target, "hours")
+    project = attributes.get_history(target, "project_id")
+    if not hours.deleted and not project.deleted:
+        return
+    old_hours = hours.deleted[0] if hours.deleted else target.hours
+    old_project_id = project.deleted[0] if project.deleted else target.project_id
+    _bump_actual_hours(connection, old_project_id, -old_hours)
+    _bump_actual_hours(connection, target.project_id, target.hours)
+
+
+@event.listens_for(WorkLog, "after_delete")
+def _work_log_deleted(mapper, connection, target):
+    _bump_actual_hours(connection, target.project_id, -target.hours)
+
+
+invoice_number_seq = Sequence("invoice_number_seq", metadata=Base.metadata)
+
+
+class next_invoice_number(FunctionElement):
+    """Next "INV-00000042" number, computed inside the INSERT itself."""
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(next_invoice_number)
+def _next_invoice_number_postgresql(element, compiler, **kw):
+    return "'INV-' || lpad(nextval('invoice_number_seq')::text, 8, '0')"
+
+
+@compiles(next_invoice_number, "sqlite")
+def _next_invoice_number_sqlite(element, compiler, **kw):
+    # No sequences on SQLite (tests); number from the next rowid instead
+    return "'INV-' || printf('%08d', (SELECT COALESCE(MAX(id), 0) + 1 FROM invoices))"
+
 
 class Invoice(Base):
     """
@@ -845,56 +1329,157 @@ class Invoice(Base):
     """
 
     __tablename__ = "invoices"
+    __table_args__ = (Index("ix_invoices_user_status_issue", "user_id", "status", "issue_date"),)
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("freelance_projects.id", ondelete="CASCADE"), index=True
     )
-    project_id = Column(Integer, ForeignKey("freelance_projects.id"), nullable=False, index=True)
 
     # Invoice details
-    invoice_number = Column(String(50), unique=True, nullable=False, index=True)
-    issue_date = Column(Date, nullable=False, index=True)
-    due_date = Column(Date, nullable=True)
+    # Numbered by invoice_number_seq in the INSERT unless given explicitly
+    invoice_number: Mapped[str] = mapped_column(
+        String(50), default=next_invoice_number(), unique=True, index=True
+    )
+    issue_date: Mapped[date] = mapped_column(index=True)
+    due_date: Mapped[Optional[date]]
 
     # Financial
-    total_amount = Column(Float, nullable=False)
-    total_hours = Column(Float, nullable=False)
-    hourly_rate = Column(Float, nullable=False)  # Rate at time of invoicing
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    total_hours: Mapped[Decimal] = mapped_column(Numeric(8, 2))
+    hourly_rate: Mapped[Decimal] = mapped_column(Numeric(8, 2))  # Rate at time of invoicing
 
     # Payment tracking
-    status = Column(
-        String(20),
-        CheckConstraint("status IN ('draft', 'sent', 'paid', 'overdue', 'cancelled')"),
+    status: Mapped[Optional[str]] = mapped_column(
+        Enum(
+            "draft",
+            "sent",
+            "paid",
+            "overdue",
+            "cancelled",
+            name="invoice_status",
+            create_constraint=True,
+        ),
         default="draft",
         index=True,
     )
-    paid_date = Column(Date, nullable=True)
-    payment_method = Column(String(50), nullable=True)
+    paid_date: Mapped[Optional[date]]
+    payment_method: Mapped[Optional[str]] = mapped_column(String(50))
 
     # Additional info
-    notes = Column(Text, nullable=True)
-    payment_terms = Column(Text, nullable=True)  # e.g., "Net 30", "Due on receipt"
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    # e.g., "Net 30", "Due on receipt"
+    payment_terms: Mapped[Optional[str]] = mapped_column(Text)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(default=utc_now, onupdate=utc_now)
 
     # Relationships
-    user = relationship("User")
-    project = relationship("FreelanceProject", back_populates="invoices")
-    work_logs = relationship("WorkLog", back_populates="invoice")
+    user: Mapped["User"] = relationship()
+    project: Mapped["FreelanceProject"] = relationship(back_populates="invoices")
+    work_logs: Mapped[list["WorkLog"]] = relationship(back_populates="invoice", lazy="selectin")
 
     def __repr__(self):
         return f"<Invoice(id={self.id}, number='{self.invoice_number}', amount={self.total_amount}, status='{self.status}')>"
 
     def mark_as_paid(self, payment_date=None, payment_method=None):
         """Mark invoice as paid."""
+        now = utc_now()
         self.status = "paid"
-        self.paid_date = payment_date or datetime.now(timezone.utc).date()
+        self.paid_date = payment_date or now.date()
         if payment_method:
             self.payment_method = payment_method
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = now
+
+
+PROJECT_HOURS_SELECT = """
+SELECT p.id AS project_id,
+       p.user_id AS user_id,
+       COALESCE(SUM(w.hours), 0) AS actual_hours,
+       COALESCE(SUM(w.hours * p.hourly_rate), 0) AS actual_value
+FROM freelance_projects p
+LEFT JOIN work_logs w ON w.project_id = p.id
+GROUP BY p.id, p.user_id
+"""
+
+# Views live outside Base.metadata so create_all() never builds them as tables
+views_metadata = MetaData()
+
+
+class ProjectHoursMV(Base):
+    """
+    Per-project hour and value totals (read-only).
+
+    Backed by the mv_project_hours materialized view on PostgreSQL, refreshed
+    concurrently by a Celery beat task, so reports read one pre-aggregated
+    row per project instead of scanning work_logs. A plain view on SQLite.
+    """
+
+    project_id: Mapped[int]
+    user_id: Mapped[int]
+    actual_hours: Mapped[Decimal]
+    actual_value: Mapped[Decimal]
+
+    __table__ = Table(
+        "mv_project_hours",
+        views_metadata,
+        Column("project_id", Integer, primary_key=True),
+        Column("user_id", Integer),
+        Column("actual_hours", Numeric(8, 2)),
+        Column("actual_value", Numeric(12, 2)),
+    )
+
+    def __repr__(self):
+        return f"<ProjectHoursMV(project_id={self.project_id}, hours={self.actual_hours})>"
+
+    @classmethod
+    def refresh(cls, db_session) -> None:
+        """Recompute the materialized view without blocking readers (PostgreSQL only)."""
+        if db_session.get_bind().dialect.name == "postgresql":
+            db_session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_project_hours"))
+
+    @classmethod
+    def totals_for(cls, db_session, user_id: int) -> tuple[Decimal, Decimal]:
+        """Return the user's (hours, value) across all projects as of the last refresh."""
+        hours, value = (
+            db_session.query(
+                func.coalesce(func.sum(cls.actual_hours), 0),
+                func.coalesce(func.sum(cls.actual_value), 0),
+            )
+            .filter(cls.user_id == user_id)
+            .one()
+        )
+        return Decimal(hours), Decimal(value)
+
+
+# Build the view alongside the tables and drop it before them
+for _ddl in (
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS mv_project_hours AS {PROJECT_HOURS_SELECT}",
+    # CONCURRENTLY refreshes need a unique index
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_project_hours_project_id "
+    "ON mv_project_hours (project_id)",
+    "CREATE INDEX IF NOT EXISTS ix_mv_project_hours_user_id ON mv_project_hours (user_id)",
+):
+    event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="postgresql"))
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(f"CREATE VIEW IF NOT EXISTS mv_project_hours AS {PROJECT_HOURS_SELECT}").execute_if(
+        dialect="sqlite"
+    ),
+)
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP MATERIALIZED VIEW IF EXISTS mv_project_hours").execute_if(dialect="postgresql"),
+)
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP VIEW IF EXISTS mv_project_hours").execute_if(dialect="sqlite"),
+)
 
 
 # Additional indexes for Freelance System
@@ -919,35 +1504,45 @@ class FreelancePlatform(Base):
 
     __tablename__ = "freelance_platforms"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Platform information
-    name = Column(String(100), nullable=False)  # 'Upwork', 'Freelancer.com', 'Fiverr', etc.
-    platform_type = Column(String(50), nullable=True)  # 'marketplace', 'network', 'direct'
-    website_url = Column(String(255), nullable=True)
+    name: Mapped[str] = mapped_column(
+        String(100), nullable=False
+    )  # 'Upwork', 'Freelancer.com', 'Fiverr', etc.
+    platform_type: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )  # 'marketplace', 'network', 'direct'
+    website_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # API configuration (encrypted in production)
-    api_config = Column(JSON, nullable=True)  # API keys, OAuth tokens, webhooks, etc.
+    api_config: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # API keys, OAuth tokens, webhooks, etc.
 
     # Status
-    active = Column(Boolean, default=True, index=True)
-    last_collection_at = Column(DateTime, nullable=True)
-    last_collection_count = Column(Integer, default=0)
+    active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, index=True)
+    last_collection_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_collection_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Collection settings
-    collection_interval_minutes = Column(Integer, default=60)  # How often to collect
-    auto_collect = Column(Boolean, default=False)
+    collection_interval_minutes: Mapped[Optional[int]] = mapped_column(
+        Integer, default=60
+    )  # How often to collect
+    auto_collect: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Statistics
-    total_projects_collected = Column(Integer, default=0)
-    total_projects_accepted = Column(Integer, default=0)
+    total_projects_collected: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    total_projects_accepted: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -969,70 +1564,92 @@ class FreelanceOpportunity(Base):
 
     __tablename__ = "freelance_opportunities"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    platform_id = Column(Integer, ForeignKey("freelance_platforms.id"), nullable=True, index=True)
+    platform_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("freelance_platforms.id"), nullable=True, index=True
+    )
 
     # Original data from platform
-    external_id = Column(String(100), nullable=True, index=True)  # Platform's project ID
-    title = Column(String(300), nullable=False)
-    description = Column(Text, nullable=False)
+    external_id: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True, index=True
+    )  # Platform's project ID
+    title: Mapped[str] = mapped_column(String(300), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Client information
-    client_name = Column(String(200), nullable=True)
-    client_rating = Column(Float, nullable=True)
-    client_country = Column(String(100), nullable=True)
-    client_projects_count = Column(Integer, nullable=True)
+    client_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    client_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    client_country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    client_projects_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Technical requirements
-    required_skills = Column(JSON, nullable=True)  # List of required skills/technologies
-    skill_level = Column(String(20), nullable=True)  # 'junior', 'mid', 'senior', 'expert'
-    category = Column(
+    required_skills: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # List of required skills/technologies
+    skill_level: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True
+    )  # 'junior', 'mid', 'senior', 'expert'
+    category: Mapped[Optional[str]] = mapped_column(
         String(50), nullable=True
     )  # 'full_stack', 'backend', 'frontend', 'ai_ml', 'devops', etc.
 
     # Commercial conditions
-    client_budget = Column(Float, nullable=True)
-    client_currency = Column(String(10), default="USD")
-    client_deadline_days = Column(Integer, nullable=True)
-    contract_type = Column(String(20), nullable=True)  # 'fixed_price', 'hourly', 'milestone'
+    client_budget: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    client_currency: Mapped[Optional[str]] = mapped_column(String(10), default="USD")
+    client_deadline_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    contract_type: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True
+    )  # 'fixed_price', 'hourly', 'milestone'
 
     # AI Analysis - Estimations
-    estimated_complexity = Column(
-        Integer, CheckConstraint("estimated_complexity BETWEEN 1 AND 10"), nullable=True
-    )
-    estimated_hours = Column(Float, nullable=True)
-    suggested_price = Column(Float, nullable=True)
-    suggested_deadline_days = Column(Integer, nullable=True)
+    estimated_complexity = rating_column("estimated_complexity", nullable=True)
+    estimated_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    suggested_price: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    suggested_deadline_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # AI Analysis - Scoring (0.0 to 1.0)
-    viability_score = Column(Float, nullable=True)  # Financial viability
-    alignment_score = Column(Float, nullable=True)  # Skill alignment with user
-    strategic_score = Column(Float, nullable=True)  # Career value
-    final_score = Column(Float, nullable=True, index=True)  # Weighted average
+    viability_score: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # Financial viability
+    alignment_score: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # Skill alignment with user
+    strategic_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Career value
+    final_score: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True, index=True
+    )  # Weighted average
 
     # AI Analysis - Recommendation
-    recommendation = Column(
+    recommendation: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint("recommendation IN ('accept', 'negotiate', 'reject', 'pending')"),
         default="pending",
         index=True,
     )
-    recommendation_reason = Column(Text, nullable=True)
+    recommendation_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Semantic Analysis
-    client_intent = Column(String(50), nullable=True)  # 'serious_project', 'test', 'exploration'
-    red_flags = Column(JSON, nullable=True)  # List of warning signs
-    opportunities = Column(JSON, nullable=True)  # List of positive aspects
-    extracted_context = Column(JSON, nullable=True)  # Full semantic analysis
+    client_intent: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )  # 'serious_project', 'test', 'exploration'
+    red_flags: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # List of warning signs
+    opportunities: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # List of positive aspects
+    extracted_context: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Full semantic analysis
 
     # Embeddings for similarity search
-    description_embedding = Column(Vector(1536), nullable=True)  # OpenAI ada-002 embeddings
+    description_embedding: Mapped[Optional[Any]] = mapped_column(
+        Vector(1536), nullable=True
+    )  # OpenAI ada-002 embeddings
 
     # Status and decision
-    status = Column(
+    status: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint(
             "status IN ('new', 'analyzed', 'negotiating', 'accepted', 'rejected', 'expired')"
@@ -1040,17 +1657,23 @@ class FreelanceOpportunity(Base):
         default="new",
         index=True,
     )
-    final_decision = Column(String(20), nullable=True)  # 'accepted', 'rejected', 'no_response'
-    decision_reason = Column(Text, nullable=True)
+    final_decision: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True
+    )  # 'accepted', 'rejected', 'no_response'
+    decision_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    collected_at = Column(DateTime, default=utc_now, index=True)
-    analyzed_at = Column(DateTime, nullable=True)
-    responded_at = Column(DateTime, nullable=True)
-    expires_at = Column(DateTime, nullable=True)  # When opportunity expires on platform
+    collected_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now, index=True)
+    analyzed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    responded_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )  # When opportunity expires on platform
 
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -1074,58 +1697,64 @@ class ProjectExecution(Base):
 
     __tablename__ = "project_executions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    opportunity_id = Column(
+    opportunity_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("freelance_opportunities.id"), nullable=True, index=True
     )
-    freelance_project_id = Column(
+    freelance_project_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("freelance_projects.id"), nullable=True, index=True
     )
 
     # Planning
-    start_date = Column(Date, nullable=False)
-    planned_end_date = Column(Date, nullable=True)
-    actual_end_date = Column(Date, nullable=True)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    planned_end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    actual_end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
     # Time investment
-    planned_hours = Column(Float, nullable=True)
-    actual_hours = Column(Float, default=0.0)
-    hours_variance_percentage = Column(Float, nullable=True)  # Difference from estimate
+    planned_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    actual_hours: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    hours_variance_percentage: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # Difference from estimate
 
     # Financial
-    negotiated_value = Column(Float, nullable=False)
-    currency = Column(String(10), default="USD")
-    received_value = Column(Float, nullable=True)
-    payment_date = Column(Date, nullable=True)
+    negotiated_value: Mapped[float] = mapped_column(Float, nullable=False)
+    currency: Mapped[Optional[str]] = mapped_column(String(10), default="USD")
+    received_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    payment_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
     # Client evaluation
-    client_satisfaction = Column(
+    client_satisfaction: Mapped[Optional[int]] = mapped_column(
         Integer, CheckConstraint("client_satisfaction BETWEEN 1 AND 5"), nullable=True
     )
-    client_rating_received = Column(Float, nullable=True)
-    client_feedback = Column(Text, nullable=True)
-    client_testimonial = Column(Text, nullable=True)
+    client_rating_received: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    client_feedback: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    client_testimonial: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Personal evaluation
-    actual_difficulty = Column(
-        Integer, CheckConstraint("actual_difficulty BETWEEN 1 AND 10"), nullable=True
-    )
-    learnings = Column(JSON, nullable=True)  # List of key learnings
-    challenges_faced = Column(JSON, nullable=True)  # List of challenges
-    personal_notes = Column(Text, nullable=True)
+    actual_difficulty = rating_column("actual_difficulty", nullable=True)
+    learnings: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # List of key learnings
+    challenges_faced: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # List of challenges
+    personal_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Career impact
-    new_skills_acquired = Column(JSON, nullable=True)  # Skills learned during project
-    technologies_used = Column(JSON, nullable=True)  # Technologies actually used
-    portfolio_worthy = Column(Boolean, default=False)
-    testimonial_obtained = Column(Boolean, default=False)
-    referral_potential = Column(Boolean, default=False)
+    new_skills_acquired: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Skills learned during project
+    technologies_used: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Technologies actually used
+    portfolio_worthy: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    testimonial_obtained: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    referral_potential: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Status
-    status = Column(
+    status: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint(
             "status IN ('planned', 'in_progress', 'completed', 'cancelled', 'on_hold')"
@@ -1135,8 +1764,10 @@ class ProjectExecution(Base):
     )
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -1164,46 +1795,50 @@ class PricingParameter(Base):
 
     __tablename__ = "pricing_parameters"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    version = Column(Integer, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Base values
-    base_hourly_rate = Column(Float, nullable=False)  # Base hourly rate
-    minimum_margin = Column(Float, default=0.20)  # Minimum 20% margin
-    currency = Column(String(10), default="USD")
+    base_hourly_rate: Mapped[float] = mapped_column(Float, nullable=False)  # Base hourly rate
+    minimum_margin: Mapped[Optional[float]] = mapped_column(
+        Float, default=0.20
+    )  # Minimum 20% margin
+    currency: Mapped[Optional[str]] = mapped_column(String(10), default="USD")
 
     # Multiplier factors (stored as JSON for flexibility)
-    complexity_factors = Column(JSON, nullable=True)
+    complexity_factors: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     # Example: {"1-2": 0.8, "3-4": 1.0, "5-6": 1.3, "7-8": 1.6, "9-10": 2.0}
 
-    specialization_factors = Column(JSON, nullable=True)
+    specialization_factors: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     # Example: {"ai_ml": 1.5, "blockchain": 1.4, "full_stack": 1.2, "frontend": 1.0}
 
-    deadline_factors = Column(JSON, nullable=True)
+    deadline_factors: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     # Example: {"urgent_<7days": 1.5, "short_7-14days": 1.2, "normal_15-30days": 1.0}
 
-    client_factors = Column(JSON, nullable=True)
+    client_factors: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     # Example: {"new_no_rating": 1.1, "good_rating": 1.0, "excellent_rating": 0.95}
 
     # Limits
-    minimum_project_value = Column(Float, default=500.0)
-    minimum_deadline_days = Column(Integer, default=7)
+    minimum_project_value: Mapped[Optional[float]] = mapped_column(Float, default=500.0)
+    minimum_deadline_days: Mapped[Optional[int]] = mapped_column(Integer, default=7)
 
     # Learning metadata
-    auto_adjusted = Column(Boolean, default=False)
-    based_on_executions_count = Column(Integer, default=0)
-    adjustment_reason = Column(Text, nullable=True)
+    auto_adjusted: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    based_on_executions_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    adjustment_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Status
-    active = Column(Boolean, default=True, index=True)
+    active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, index=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
-    activated_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
+    activated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     user = relationship("User")
@@ -1222,42 +1857,44 @@ class Negotiation(Base):
 
     __tablename__ = "negotiations"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    opportunity_id = Column(
+    opportunity_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("freelance_opportunities.id"), nullable=False, index=True
     )
 
     # Original proposal
-    original_budget = Column(Float, nullable=True)
-    original_deadline_days = Column(Integer, nullable=True)
+    original_budget: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    original_deadline_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Counter-proposal
-    counter_proposal_budget = Column(Float, nullable=False)
-    counter_proposal_deadline_days = Column(Integer, nullable=True)
-    counter_proposal_justification = Column(Text, nullable=False)
-    generated_message = Column(Text, nullable=True)  # AI-generated diplomatic message
+    counter_proposal_budget: Mapped[float] = mapped_column(Float, nullable=False)
+    counter_proposal_deadline_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    counter_proposal_justification: Mapped[str] = mapped_column(Text, nullable=False)
+    generated_message: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # AI-generated diplomatic message
 
     # Client response
-    client_response = Column(Text, nullable=True)
-    final_agreed_budget = Column(Float, nullable=True)
-    final_agreed_deadline_days = Column(Integer, nullable=True)
+    client_response: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    final_agreed_budget: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    final_agreed_deadline_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Outcome
-    outcome = Column(
+    outcome: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint("outcome IN ('accepted', 'rejected', 'agreed', 'no_response', 'pending')"),
         default="pending",
         index=True,
     )
-    outcome_notes = Column(Text, nullable=True)
+    outcome_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    responded_at = Column(DateTime, nullable=True)
-    finalized_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    responded_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finalized_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     user = relationship("User")
@@ -1277,55 +1914,75 @@ class CareerInsight(Base):
 
     __tablename__ = "career_insights"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Report period
-    period_start = Column(Date, nullable=False, index=True)
-    period_end = Column(Date, nullable=False, index=True)
-    report_type = Column(
+    period_start: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    period_end: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    report_type: Mapped[str] = mapped_column(
         String(20), nullable=False, index=True
     )  # 'weekly', 'monthly', 'quarterly', 'annual'
 
     # Financial metrics
-    total_revenue = Column(Float, default=0.0)
-    average_project_value = Column(Float, nullable=True)
-    effective_hourly_rate = Column(Float, nullable=True)  # Total revenue / total hours
-    currency = Column(String(10), default="USD")
+    total_revenue: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    average_project_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    effective_hourly_rate: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # Total revenue / total hours
+    currency: Mapped[Optional[str]] = mapped_column(String(10), default="USD")
 
     # Productivity metrics
-    projects_completed = Column(Integer, default=0)
-    success_rate = Column(Float, nullable=True)  # % of successfully completed projects
-    total_hours_worked = Column(Float, default=0.0)
-    average_hours_per_project = Column(Float, nullable=True)
+    projects_completed: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    success_rate: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # % of successfully completed projects
+    total_hours_worked: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    average_hours_per_project: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # Technical evolution
-    average_complexity = Column(Float, nullable=True)
-    new_technologies = Column(JSON, nullable=True)  # Technologies learned this period
-    dominant_categories = Column(JSON, nullable=True)  # Most worked categories
+    average_complexity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    new_technologies: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Technologies learned this period
+    dominant_categories: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Most worked categories
 
     # Market positioning
-    most_profitable_categories = Column(JSON, nullable=True)  # Categories with best rates
-    preferred_clients = Column(JSON, nullable=True)  # Client profiles that work best
-    identified_trends = Column(JSON, nullable=True)  # Market trends observed
+    most_profitable_categories: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Categories with best rates
+    preferred_clients: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Client profiles that work best
+    identified_trends: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Market trends observed
 
     # Strategic recommendations
-    recommendations = Column(JSON, nullable=True)  # List of strategic recommendations
-    next_step_suggestion = Column(Text, nullable=True)  # Primary suggestion for next period
+    recommendations: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # List of strategic recommendations
+    next_step_suggestion: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # Primary suggestion for next period
 
     # Skills analysis
-    top_demanded_skills = Column(JSON, nullable=True)
-    skill_gaps = Column(JSON, nullable=True)  # Skills to develop
-    competitive_advantages = Column(JSON, nullable=True)  # Unique strengths
+    top_demanded_skills: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    skill_gaps: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # Skills to develop
+    competitive_advantages: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Unique strengths
 
     # Generated by AI
-    ai_generated_summary = Column(Text, nullable=True)
-    ai_confidence_score = Column(Float, nullable=True)  # 0.0 to 1.0
+    ai_generated_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_confidence_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # 0.0 to 1.0
 
     # Timestamps
-    generated_at = Column(DateTime, default=utc_now)
+    generated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     # Relationships
     user = relationship("User")
@@ -1344,37 +2001,45 @@ class PortfolioItem(Base):
 
     __tablename__ = "portfolio_items"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    execution_id = Column(Integer, ForeignKey("project_executions.id"), nullable=True, index=True)
+    execution_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("project_executions.id"), nullable=True, index=True
+    )
 
     # Portfolio content
-    title = Column(String(200), nullable=False)
-    optimized_description = Column(Text, nullable=False)  # AI-enhanced description
-    technologies_used = Column(JSON, nullable=True)
-    challenges_overcome = Column(JSON, nullable=True)
-    results_metrics = Column(JSON, nullable=True)  # Quantifiable results
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    optimized_description: Mapped[str] = mapped_column(
+        Text, nullable=False
+    )  # AI-enhanced description
+    technologies_used: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    challenges_overcome: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    results_metrics: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Quantifiable results
 
     # Media
-    images_urls = Column(JSON, nullable=True)
-    demo_url = Column(String(500), nullable=True)
-    case_study_url = Column(String(500), nullable=True)
-    repository_url = Column(String(500), nullable=True)
+    images_urls: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    demo_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    case_study_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    repository_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Categorization
-    featured = Column(Boolean, default=False, index=True)
-    category = Column(String(50), nullable=True)
-    tags = Column(JSON, nullable=True)
+    featured: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, index=True)
+    category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    tags: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
 
     # Visibility
-    public = Column(Boolean, default=True)
-    published_at = Column(DateTime, nullable=True)
+    public: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -1396,42 +2061,58 @@ class LearningRecord(Base):
 
     __tablename__ = "learning_records"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Learning type
-    learning_type = Column(
+    learning_type: Mapped[str] = mapped_column(
         String(50), nullable=False, index=True
     )  # 'pricing', 'classification', 'negotiation', 'time_estimation'
 
     # Model input/output
-    input_features = Column(JSON, nullable=False)  # Features used for prediction
-    predicted_output = Column(JSON, nullable=True)  # What the model predicted
-    actual_output = Column(JSON, nullable=True)  # What actually happened
+    input_features: Mapped[Any] = mapped_column(
+        JSON, nullable=False
+    )  # Features used for prediction
+    predicted_output: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # What the model predicted
+    actual_output: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # What actually happened
 
     # Performance metrics
-    accuracy_score = Column(Float, nullable=True)  # How accurate was the prediction
-    error_margin = Column(Float, nullable=True)  # Margin of error
+    accuracy_score: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # How accurate was the prediction
+    error_margin: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Margin of error
 
     # User feedback
-    user_feedback = Column(Text, nullable=True)  # Manual feedback from user
-    user_rating = Column(Integer, CheckConstraint("user_rating BETWEEN 1 AND 5"), nullable=True)
+    user_feedback: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # Manual feedback from user
+    user_rating: Mapped[Optional[int]] = mapped_column(
+        Integer, CheckConstraint("user_rating BETWEEN 1 AND 5"), nullable=True
+    )
 
     # Adjustment tracking
-    adjustment_applied = Column(Boolean, default=False)
-    adjustment_impact = Column(Text, nullable=True)  # Description of adjustment made
+    adjustment_applied: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    adjustment_impact: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # Description of adjustment made
 
     # Context
-    related_opportunity_id = Column(
+    related_opportunity_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("freelance_opportunities.id"), nullable=True
     )
-    related_execution_id = Column(Integer, ForeignKey("project_executions.id"), nullable=True)
+    related_execution_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("project_executions.id"), nullable=True
+    )
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now, index=True)
-    processed_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now, index=True)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     user = relationship("User")
@@ -1450,35 +2131,41 @@ class PersonalReflection(Base):
 
     __tablename__ = "personal_reflections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Reflection content
-    date = Column(Date, nullable=False, index=True)
-    category = Column(
+    date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    category: Mapped[Optional[str]] = mapped_column(
         String(50), nullable=True, index=True
     )  # 'learning', 'challenge', 'achievement', 'insight', 'goal'
-    content = Column(Text, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Sentiment analysis
-    sentiment = Column(
+    sentiment: Mapped[Optional[str]] = mapped_column(
         String(20), nullable=True
     )  # 'positive', 'neutral', 'challenging', 'frustrated'
-    tags = Column(JSON, nullable=True)
+    tags: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
 
     # Relations
-    related_to_type = Column(String(50), nullable=True)  # 'opportunity', 'execution', 'client'
-    related_to_id = Column(Integer, nullable=True)
+    related_to_type: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )  # 'opportunity', 'execution', 'client'
+    related_to_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Action tracking
-    action_taken = Column(Text, nullable=True)  # What was done about this reflection
-    action_result = Column(Text, nullable=True)
+    action_taken: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # What was done about this reflection
+    action_result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -1500,33 +2187,35 @@ class UserNotification(Base):
 
     __tablename__ = "user_notifications"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Notification type and content
-    type = Column(
+    type: Mapped[str] = mapped_column(
         String(50), nullable=False, index=True
     )  # 'opportunity', 'career_alert', 'daily_report', 'stagnation', etc.
-    title = Column(String(255), nullable=False)
-    message = Column(Text, nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Optional reference to related entity
-    reference_id = Column(String(100), nullable=True)  # Related opportunity ID, etc.
+    reference_id: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )  # Related opportunity ID, etc.
 
     # Priority and status
-    priority = Column(
+    priority: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint("priority IN ('low', 'medium', 'high')"),
         default="medium",
         index=True,
     )
-    read = Column(Boolean, default=False, index=True)
+    read: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, index=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now, index=True)
-    read_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now, index=True)
+    read_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     user = relationship("User")
@@ -1559,7 +2248,37 @@ class UserNotification(Base):
 # ==================== Calendar Integration Models ====================
 
 
-class CalendarConnection(Base):
+_sqlalchemy_engine_logger = logging.getLogger("sqlalchemy.engine")
+
+
+class ReprMixin:
+    """
+    Cheap __repr__ unless SQLAlchemy engine debug logging is enabled.
+
+    Normally only the class name and id are formatted. With the
+    sqlalchemy.engine logger at DEBUG every attribute in _repr_fields is
+    included. Values are read from the instance __dict__, so an expired or
+    deferred column is left out instead of being refreshed from the database.
+    """
+
+    _repr_fields: tuple[str, ...] = ("id",)
+
+    def __repr__(self):
+        loaded = self.__dict__
+        if "id" not in loaded:
+            # An expired persistent row still knows its primary key without a query
+            identity = inspect(self).identity
+            if identity:
+                loaded = {**loaded, "id": identity[0]}
+        if not _sqlalchemy_engine_logger.isEnabledFor(logging.DEBUG):
+            return f"<{type(self).__name__}(id={loaded.get('id')!r})>"
+        fields = ", ".join(
+            f"{name}={loaded[name]!r}" for name in self._repr_fields if name in loaded
+        )
+        return f"<{type(self).__name__}({fields})>"
+
+
+class CalendarConnection(ReprMixin, Base):
     """
     Calendar Connection - External calendar provider connections.
 
@@ -1568,57 +2287,65 @@ class CalendarConnection(Base):
     """
 
     __tablename__ = "calendar_connections"
+    _repr_fields = ("id", "provider", "user_id", "sync_enabled")
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Provider information
-    provider = Column(
+    provider: Mapped[str] = mapped_column(
         String(20),
         CheckConstraint("provider IN ('google', 'microsoft')"),
         nullable=False,
         index=True,
     )
-    calendar_id = Column(String(255), nullable=False)
-    calendar_name = Column(String(255), nullable=True)
+    calendar_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    calendar_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # OAuth credentials
-    access_token = Column(Text, nullable=False)
-    refresh_token = Column(Text, nullable=True)
-    token_expires_at = Column(DateTime, nullable=True)
+    access_token: Mapped[str] = mapped_column(Text, nullable=False)
+    refresh_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Sync configuration
-    sync_enabled = Column(Boolean, default=True, index=True)
-    sync_direction = Column(
+    sync_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, index=True)
+    sync_direction: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint("sync_direction IN ('both', 'to_calendar', 'from_calendar')"),
         default="both",
     )
-    last_sync_at = Column(DateTime, nullable=True)
-    sync_token = Column(String(500), nullable=True)
+    last_sync_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    sync_token: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Webhook configuration
-    webhook_id = Column(String(255), nullable=True)
-    webhook_expires_at = Column(DateTime, nullable=True)
+    webhook_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    webhook_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
+    )
 
     # Relationships
     user = relationship("User")
     events = relationship(
-        "CalendarEvent", back_populates="connection", cascade="all, delete-orphan"
+        "CalendarEvent",
+        back_populates="connection",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     sync_logs = relationship(
-        "CalendarSyncLog", back_populates="connection", cascade="all, delete-orphan"
+        "CalendarSyncLog",
+        back_populates="connection",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
-    def __repr__(self):
-        return f"<CalendarConnection(id={self.id}, provider='{self.provider}', user_id={self.user_id}, sync_enabled={self.sync_enabled})>"
-
     def is_token_expired(self) -> bool:
         """Check if access token is expired."""
         if self.token_expires_at is None:
@@ -1641,7 +2368,36 @@ class CalendarConnection(Base):
         return elapsed.total_seconds() > (sync_interval_minutes * 60)
 
 
-class CalendarEvent(Base):
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Tag a naive datetime (stored as UTC) with tzinfo; aware values are converted."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(slots=True, frozen=True)
+class EventSnapshot:
+    """
+    Immutable, hashable view of the comparable fields of a CalendarEvent.
+
+    Cheaper than to_dict() for conflict comparisons: no per-call dict, and
+    snapshots can be diffed as sets (``set(local) ^ set(remote)``).
+    """
+
+    title: str
+    description: Optional[str]
+    start_time: Optional[datetime]
+    end_time: Optional[datetime]
+    all_day: Optional[bool]
+    location: Optional[str]
+    attendees: Optional[str]
+    status: Optional[str]
+    source: Optional[str]
+
+
+class CalendarEvent(ReprMixin, Base):
     """
     Calendar Event - Events synchronized with external calendars.
 
@@ -1650,43 +2406,44 @@ class CalendarEvent(Base):
     """
 
     __tablename__ = "calendar_events"
+    _repr_fields = ("id", "title", "start_time", "source")
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    connection_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("calendar_connections.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    user_id = Column(
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # External event reference
-    external_event_id = Column(String(255), nullable=False)
+    external_event_id: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Charlee task reference
-    task_id = Column(
+    task_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("tasks.id", ondelete="SET NULL"), nullable=True, index=True
     )
 
     # Event details
-    title = Column(String(500), nullable=False)
-    description = Column(Text, nullable=True)
-    start_time = Column(DateTime, nullable=False, index=True)
-    end_time = Column(DateTime, nullable=False)
-    all_day = Column(Boolean, default=False)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    all_day: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Location and attendees
-    location = Column(String(500), nullable=True)
-    attendees = Column(Text, nullable=True)  # JSON string
+    location: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    attendees: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
 
     # Recurrence
-    is_recurring = Column(Boolean, default=False)
-    recurrence_rule = Column(Text, nullable=True)
+    is_recurring: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    recurrence_rule: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Status
-    status = Column(
+    status: Mapped[Optional[str]] = mapped_column(
         String(20),
         CheckConstraint("status IN ('confirmed', 'tentative', 'cancelled')"),
         default="confirmed",
@@ -1694,40 +2451,85 @@ class CalendarEvent(Base):
     )
 
     # Source tracking
-    source = Column(
+    source: Mapped[str] = mapped_column(
         String(20),
         CheckConstraint("source IN ('charlee', 'external')"),
         nullable=False,
     )
 
     # Modification tracking for conflict detection
-    last_modified_at = Column(DateTime, nullable=True)
-    charlee_modified_at = Column(DateTime, nullable=True)
-    external_modified_at = Column(DateTime, nullable=True)
+    last_modified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    charlee_modified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    external_modified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Denormalised count of conflicts with status != 'resolved'
+    # (maintained by the CalendarConflict mapper events below)
+    unresolved_conflict_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
+    )
 
     # Relationships
-    connection = relationship("CalendarConnection", back_populates="events")
-    user = relationship("User")
-    task = relationship("Task")
+    # lazy="raise" surfaces accidental per-row lazy loads; read paths must opt in
+    # explicitly with selectinload()/joinedload() for the relationships they touch.
+    connection = relationship("CalendarConnection", back_populates="events", lazy="raise")
+    user = relationship("User", lazy="raise")
+    task = relationship("Task", lazy="raise")
+    # Deletion is left to ON DELETE CASCADE on calendar_conflicts.event_id:
+    # the ORM neither loads nor deletes children row by row
     conflicts = relationship(
-        "CalendarConflict", back_populates="event", cascade="all, delete-orphan"
+        "CalendarConflict",
+        back_populates="event",
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="raise",
+    )
+    # Only open conflicts; served by the ix_calendar_conflicts_unresolved partial index
+    active_conflicts = relationship(
+        "CalendarConflict",
+        primaryjoin=(
+            "and_(CalendarEvent.id == foreign(CalendarConflict.event_id), "
+            "CalendarConflict.status != 'resolved')"
+        ),
+        viewonly=True,
+        lazy="raise",
     )
 
-    def __repr__(self):
-        return f"<CalendarEvent(id={self.id}, title='{self.title}', start={self.start_time}, source='{self.source}')>"
-
     def has_conflict(self) -> bool:
-        """Check if event has unresolved conflicts."""
-        if not self.conflicts:
-            return False
-        return any(c.status != "resolved" for c in self.conflicts)
+        """Check if event has unresolved conflicts (O(1), no relationship load)."""
+        return (self.unresolved_conflict_count or 0) > 0
+
+    def to_snapshot(self) -> EventSnapshot:
+        """
+        Build a hashable snapshot of the event for comparisons.
+
+        Times are tagged as UTC, so a freshly assigned aware value and the naive
+        one loaded back from the database compare equal.
+        """
+        return EventSnapshot(
+            self.title,
+            self.description,
+            _as_utc(self.start_time),
+            _as_utc(self.end_time),
+            self.all_day,
+            self.location,
+            self.attendees,
+            self.status,
+            self.source,
+        )
 
     def to_dict(self) -> dict:
-        """Convert event to dictionary for comparison."""
+        """
+        Convert event to dictionary for comparison.
+
+        Datetimes are ISO 8601 strings, as they read back from a JSON column,
+        so a freshly built dict and a stored version compare field by field.
+        """
         return {
             "title": self.title,
             "description": self.description,
@@ -1741,7 +2543,7 @@ class CalendarEvent(Base):
         }
 
 
-class CalendarSyncLog(Base):
+class CalendarSyncLog(ReprMixin, Base):
     """
     Calendar Sync Log - Track calendar synchronization history.
 
@@ -1750,61 +2552,80 @@ class CalendarSyncLog(Base):
     """
 
     __tablename__ = "calendar_sync_logs"
+    _repr_fields = ("id", "sync_type", "status", "duration_seconds")
+    __table_args__ = (
+        # Partial index: the monitoring dashboard only looks at unhealthy syncs
+        Index(
+            "ix_calendar_sync_logs_unhealthy",
+            "connection_id",
+            "started_at",
+            postgresql_where=text("status IN ('failed', 'partial')"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    connection_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("calendar_connections.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    user_id = Column(
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Sync metadata
-    sync_type = Column(
-        String(20),
-        CheckConstraint("sync_type IN ('manual', 'scheduled', 'webhook')"),
+    # Closed value sets are native PostgreSQL ENUMs (4-byte, no collation on compare)
+    sync_type: Mapped[str] = mapped_column(
+        Enum("manual", "scheduled", "webhook", name="calendar_sync_type", create_constraint=True),
         nullable=False,
     )
-    direction = Column(
-        String(20),
-        CheckConstraint("direction IN ('to_calendar', 'from_calendar', 'both')"),
+    direction: Mapped[str] = mapped_column(
+        Enum(
+            "to_calendar",
+            "from_calendar",
+            "both",
+            name="calendar_sync_direction",
+            create_constraint=True,
+        ),
         nullable=False,
     )
-    status = Column(
-        String(20),
-        CheckConstraint("status IN ('started', 'success', 'failed', 'partial')"),
+    status: Mapped[str] = mapped_column(
+        Enum(
+            "started",
+            "success",
+            "failed",
+            "partial",
+            name="calendar_sync_status",
+            create_constraint=True,
+        ),
         nullable=False,
-        index=True,
     )
 
     # Statistics
-    events_created = Column(Integer, default=0)
-    events_updated = Column(Integer, default=0)
-    events_deleted = Column(Integer, default=0)
-    conflicts_detected = Column(Integer, default=0)
-    conflicts_resolved = Column(Integer, default=0)
+    events_created: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    events_updated: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    events_deleted: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    conflicts_detected: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    conflicts_resolved: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Error tracking
-    error_message = Column(Text, nullable=True)
+    error_message = deferred(Column(Text, nullable=True), group="detail")
 
     # Timing
-    started_at = Column(DateTime, nullable=False, index=True)
-    completed_at = Column(DateTime, nullable=True)
-    duration_seconds = Column(Float, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    duration_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     # Relationships
     connection = relationship("CalendarConnection", back_populates="sync_logs")
     user = relationship("User")
 
-    def __repr__(self):
-        return f"<CalendarSyncLog(id={self.id}, type='{self.sync_type}', status='{self.status}', duration={self.duration_seconds}s)>"
-
     def mark_completed(self, status: str):
         """Mark sync as completed with given status."""
         self.completed_at = datetime.now(timezone.utc)
@@ -1820,7 +2641,7 @@ class CalendarSyncLog(Base):
         return self.status in ("success", "partial")
 
 
-class CalendarConflict(Base):
+class CalendarConflict(ReprMixin, Base):
     """
     Calendar Conflict - Track and resolve synchronization conflicts.
 
@@ -1829,81 +2650,377 @@ class CalendarConflict(Base):
     """
 
     __tablename__ = "calendar_conflicts"
+    _repr_fields = ("id", "conflict_type", "status", "event_id")
+    __table_args__ = (
+        # Partial index: only open conflicts are queried, and most rows end up resolved
+        Index(
+            "ix_calendar_conflicts_unresolved",
+            "event_id",
+            "user_id",
+            postgresql_where=text("status <> 'resolved'"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    event_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("calendar_events.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    user_id = Column(
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Conflict information
-    conflict_type = Column(
-        String(50),
-        CheckConstraint(
-            "conflict_type IN ('both_modified', 'time_conflict', 'duplicate', 'deletion_conflict')"
+    conflict_type: Mapped[str] = mapped_column(
+        Enum(
+            "both_modified",
+            "time_conflict",
+            "duplicate",
+            "deletion_conflict",
+            name="calendar_conflict_type",
+            create_constraint=True,
         ),
         nullable=False,
         index=True,
     )
 
-    # Conflicting versions
-    charlee_version = Column(JSON, nullable=True)
-    external_version = Column(JSON, nullable=True)
+    # Conflicting versions. The external version is stored as a shallow diff
+    # against charlee_version (see the external_version property), since the two
+    # snapshots usually differ in only a few fields.
+    charlee_version = deferred(Column(JSON, nullable=True), group="payload")
+    external_diff = deferred(Column(JSON, nullable=True), group="payload")
 
     # Resolution
-    resolution_strategy = Column(
+    resolution_strategy: Mapped[Optional[str]] = mapped_column(
         String(50),
         CheckConstraint(
             "resolution_strategy IN ('last_modified_wins', 'manual', 'charlee_wins', 'external_wins', 'merge')"
         ),
         default="last_modified_wins",
     )
-    status = Column(
-        String(20),
-        CheckConstraint("status IN ('detected', 'resolved', 'manual_review')"),
-        default="detected",
-        index=True,
+    # active_history loads the previous status on change so the mapper events can
+    # tell open->resolved transitions apart when maintaining the event counter
+    status: Mapped[Optional[str]] = column_property(
+        Column(
+            Enum(
+                "detected",
+                "resolved",
+                "manual_review",
+                name="calendar_conflict_status",
+                create_constraint=True,
+            ),
+            default="detected",
+        ),
+        active_history=True,
     )
-    resolved_version = Column(JSON, nullable=True)
-    resolved_at = Column(DateTime, nullable=True)
-    resolved_by = Column(String(50), nullable=True)  # 'system' or 'user'
-    notes = Column(Text, nullable=True)
+    resolved_version = deferred(Column(JSON, nullable=True), group="payload")
+    resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    resolved_by: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )  # 'system' or 'user'
+    notes = deferred(Column(Text, nullable=True), group="payload")
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
+    )
 
     # Relationships
     event = relationship("CalendarEvent", back_populates="conflicts")
     user = relationship("User")
 
-    def __repr__(self):
-        return f"<CalendarConflict(id={self.id}, type='{self.conflict_type}', status='{self.status}', event_id={self.event_id})>"
-
     def resolve(self, resolution: dict, resolved_by: str = "system"):
         """Mark conflict as resolved with given resolution."""
         self.status = "resolved"
         self.resolved_version = resolution
-        self.resolved_at = datetime.now(timezone.utc)
+        self.resolved_at = utc_now()
         self.resolved_by = resolved_by
-        self.updated_at = datetime.now(timezone.utc)
+
+    @classmethod
+    def resolve_many(
+        cls, session, ids_to_resolutions: dict[int, dict], resolved_by: str = "system"
+    ) -> int:
+        """
+        Resolve many conflicts with one executemany UPDATE, without loading them.
+
+        Bulk UPDATE by primary key bypasses the mapper events, so the events'
+        unresolved_conflict_count is adjusted here in a single statement first.
+
+        Args:
+            session: SQLAlchemy session
+            ids_to_resolutions: Mapping of conflict id to its resolved version
+            resolved_by: Who resolved the conflicts
+
+        Returns:
+            int: Number of conflicts submitted for resolution
+        """
+        if not ids_to_resolutions:
+            return 0
+
+        conflict_ids = list(ids_to_resolutions)
+        open_conflicts = (
+            select(func.count(cls.id))
+            .where(
+                cls.event_id == CalendarEvent.id,
+                cls.id.in_(conflict_ids),
+                cls.status != "resolved",
+            )
+            .scalar_subquery()
+        )
+        session.execute(
+            update(CalendarEvent)
+            .where(
+                CalendarEvent.id.in_(
+                    select(cls.event_id).where(cls.id.in_(conflict_ids), cls.status != "resolved")
+                )
+            )
+            .values(
+                unresolved_conflict_count=CalendarEvent.unresolved_conflict_count - open_conflicts
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        conflicts_table = cls.__table__
+        session.execute(
+            update(conflicts_table)
+            .where(conflicts_table.c.id == bindparam("conflict_key"))
+            .values(
+                status="resolved",
+                resolved_version=bindparam(
+                    "resolution", type_=conflicts_table.c.resolved_version.type
+                ),
+                resolved_at=func.now(),
+                resolved_by=resolved_by,
+            ),
+            [
+                {"conflict_key": conflict_id, "resolution": resolution}
+                for conflict_id, resolution in ids_to_resolutions.items()
+            ],
+        )
+        return len(ids_to_resolutions)
+
+    @property
+    def external_version(self) -> Optional[dict]:
+        """Full external version, rebuilt from charlee_version + external_diff."""
+        pending = self.__dict__.get("_pending_external_version")
+        if pending is not None:
+            return pending
+        if self.external_diff is None:
+            return None
+        return {**(self.charlee_version or {}), **self.external_diff}
+
+    @external_version.setter
+    def external_version(self, value: Optional[dict]) -> None:
+        # Keep the full value until flush so the diff is taken against the final
+        # charlee_version regardless of assignment order
+        self.__dict__["_pending_external_version"] = value
+        self.external_diff = _shallow_diff(self.charlee_version, value)
 
     def needs_manual_review(self) -> bool:
         """Check if conflict needs manual review."""
         return self.status == "manual_review" or self.resolution_strategy == "manual"
 
 
+def _shallow_diff(base: Optional[dict], other: Optional[dict]) -> Optional[dict]:
+    """Return the keys of ``other`` whose values differ from ``base``."""
+    if other is None:
+        return None
+    if not base:
+        return dict(other)
+    return {key: value for key, value in other.items() if key not in base or base[key] != value}
+
+
+@event.listens_for(CalendarConflict, "before_insert")
+@event.listens_for(CalendarConflict, "before_update")
+def _store_external_diff(mapper, connection, target):
+    pending = target.__dict__.pop("_pending_external_version", None)
+    if pending is not None:
+        target.external_diff = _shallow_diff(target.charlee_version, pending)
+
+
+def _bump_unresolved_conflicts(connection, event_id: int, delta: int) -> None:
+    """Adjust CalendarEvent.unresolved_conflict_count in-database."""
+    events_table = CalendarEvent.__table__
+    connection.execute(
+        update(events_table)
+        .where(events_table.c.id == event_id)
+        .values(unresolved_conflict_count=events_table.c.unresolved_conflict_count + delta)
+    )
+
+
+@event.listens_for(CalendarConflict, "after_insert")
+def _conflict_inserted(mapper, connection, target):
+    if target.status != "resolved":
+        _bump_unresolved_conflicts(connection, target.event_id, 1)
+
+
+@event.listens_for(CalendarConflict, "after_update")
+def _conflict_updated(mapper, connection, target):
+    history = attributes.get_history(target, "status")
+    if not history.deleted:
+        return
+    was_open = history.deleted[0] != "resolved"
+    is_open = target.status != "resolved"
+    if was_open != is_open:
+        _bump_unresolved_conflicts(connection, target.event_id, 1 if is_open else -1)
+
+
+@event.listens_for(CalendarConflict, "after_delete")
+def _conflict_deleted(mapper, connection, target):
+    if target.status != "resolved":
+        _bump_unresolved_conflicts(connection, target.event_id, -1)
+
+
+class UserConflictSummary(Base):
+    """
+    User Conflict Summary - Per-user count of unresolved calendar conflicts.
+
+    Maintained by triggers on calendar_conflicts (plpgsql on PostgreSQL, plain
+    SQL on SQLite) so the conflicts summary endpoint reads a single row by
+    primary key instead of counting conflicts on every request.
+    """
+
+    __tablename__ = "user_conflict_summary"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    unresolved_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    def __repr__(self):
+        return f"<UserConflictSummary(user_id={self.user_id}, unresolved_count={self.unresolved_count})>"
+
+    @classmethod
+    def unresolved_for(cls, db_session, user_id: int) -> int:
+        """Return the user's unresolved conflict count (0 if no row yet)."""
+        count = db_session.query(cls.unresolved_count).filter(cls.user_id == user_id).scalar()
+        return count or 0
+
+
+USER_CONFLICT_SUMMARY_TRIGGER = DDL(
+    """
+    CREATE OR REPLACE FUNCTION bump_user_conflict_summary() RETURNS trigger AS $$
+    DECLARE
+        delta integer := 0;
+        uid integer;
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            uid := NEW.user_id;
+            IF NEW.status IS DISTINCT FROM 'resolved' THEN delta := 1; END IF;
+        ELSIF TG_OP = 'UPDATE' THEN
+            uid := NEW.user_id;
+            IF OLD.status IS DISTINCT FROM 'resolved' AND NEW.status = 'resolved' THEN
+                delta := -1;
+            ELSIF OLD.status = 'resolved' AND NEW.status IS DISTINCT FROM 'resolved' THEN
+                delta := 1;
+            END IF;
+        ELSE
+            uid := OLD.user_id;
+            IF OLD.status IS DISTINCT FROM 'resolved' THEN delta := -1; END IF;
+        END IF;
+
+        IF delta <> 0 THEN
+            INSERT INTO user_conflict_summary (user_id, unresolved_count)
+            VALUES (uid, delta)
+            ON CONFLICT (user_id) DO UPDATE
+            SET unresolved_count = user_conflict_summary.unresolved_count + EXCLUDED.unresolved_count;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER trg_user_conflict_summary
+    AFTER INSERT OR UPDATE OF status OR DELETE ON calendar_conflicts
+    FOR EACH ROW EXECUTE FUNCTION bump_user_conflict_summary();
+    """
+)
+
+# Install the trigger when the schema is built with metadata.create_all() on PostgreSQL
+event.listen(
+    CalendarConflict.__table__,
+    "after_create",
+    USER_CONFLICT_SUMMARY_TRIGGER.execute_if(dialect="postgresql"),
+)
+
+# SQLite has no plpgsql: the same bookkeeping as one trigger per operation
+_SQLITE_BUMP_SUMMARY = """
+    INSERT INTO user_conflict_summary (user_id, unresolved_count) VALUES ({user_id}, {delta})
+    ON CONFLICT (user_id) DO UPDATE
+    SET unresolved_count = unresolved_count + excluded.unresolved_count;
+"""
+for _ddl in (
+    "CREATE TRIGGER trg_user_conflict_summary_insert AFTER INSERT ON calendar_conflicts "
+    "WHEN NEW.status IS NOT 'resolved' "
+    f"BEGIN {_SQLITE_BUMP_SUMMARY.format(user_id='NEW.user_id', delta=1)} END",
+    "CREATE TRIGGER trg_user_conflict_summary_update AFTER UPDATE OF status ON calendar_conflicts "
+    "WHEN (OLD.status IS 'resolved') <> (NEW.status IS 'resolved') "
+    "BEGIN "
+    + _SQLITE_BUMP_SUMMARY.format(
+        user_id="NEW.user_id", delta="CASE WHEN NEW.status IS 'resolved' THEN -1 ELSE 1 END"
+    )
+    + " END",
+    "CREATE TRIGGER trg_user_conflict_summary_delete AFTER DELETE ON calendar_conflicts "
+    "WHEN OLD.status IS NOT 'resolved' "
+    f"BEGIN {_SQLITE_BUMP_SUMMARY.format(user_id='OLD.user_id', delta=-1)} END",
+):
+    # After the whole schema exists, since the triggers span two tables
+    event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+
+
+SET_UPDATED_AT_FUNCTION = DDL(
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at := now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+)
+
+# updated_at is stamped by a BEFORE UPDATE trigger (server_onupdate=FetchedValue()),
+# so neither ORM flushes nor bulk UPDATEs evaluate a default per row
+for _table in (
+    CalendarConnection.__table__,
+    CalendarEvent.__table__,
+    CalendarConflict.__table__,
+):
+    event.listen(_table, "after_create", SET_UPDATED_AT_FUNCTION.execute_if(dialect="postgresql"))
+    event.listen(
+        _table,
+        "after_create",
+        DDL(
+            "CREATE TRIGGER trg_%(table)s_updated_at BEFORE UPDATE ON %(table)s "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        ).execute_if(dialect="postgresql"),
+    )
+    # SQLite (tests, local dev) has no BEFORE UPDATE assignment; re-stamp the row
+    # afterwards unless the statement set updated_at itself
+    event.listen(
+        _table,
+        "after_create",
+        DDL(
+            "CREATE TRIGGER trg_%(table)s_updated_at AFTER UPDATE ON %(table)s "
+            "FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at "
+            "BEGIN UPDATE %(table)s SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END"
+        ).execute_if(dialect="sqlite"),
+    )
+
+
 # Additional indexes for Calendar Integration
 # CREATE INDEX idx_calendar_connections_user_provider ON calendar_connections(user_id, provider);
 # CREATE INDEX idx_calendar_events_user_start ON calendar_events(user_id, start_time);
 # CREATE INDEX idx_calendar_events_connection_external ON calendar_events(connection_id, external_event_id);
 # CREATE INDEX idx_calendar_sync_logs_user_started ON calendar_sync_logs(user_id, started_at DESC);
-# CREATE INDEX idx_calendar_conflicts_event_status ON calendar_conflicts(event_id, status);
+# CREATE INDEX ix_calendar_conflicts_unresolved ON calendar_conflicts(event_id, user_id) WHERE status <> 'resolved';
+# CREATE INDEX ix_calendar_sync_logs_unhealthy ON calendar_sync_logs(connection_id, started_at) WHERE status IN ('failed', 'partial');
 
 
 # ==================== Notification System Models ====================
@@ -1919,20 +3036,20 @@ class Notification(Base):
 
     __tablename__ = "notifications"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # External source tracking
-    source_id = Column(
+    source_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("notification_sources.id", ondelete="SET NULL"), nullable=True
     )
-    external_id = Column(String(255), nullable=True, index=True)
-    thread_id = Column(String(255), nullable=True, index=True)
+    external_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    thread_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
 
     # Notification type and content
-    type = Column(
+    type: Mapped[str] = mapped_column(
         String(50),
         CheckConstraint(
             "type IN ('task_due_soon', 'capacity_overload', 'cycle_phase_change', "
@@ -1942,59 +3059,69 @@ class Notification(Base):
         nullable=False,
         index=True,
     )
-    title = Column(String(200), nullable=False)
-    message = Column(Text, nullable=False)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
 
     # AI Classification (automated by ClassifierAgent)
-    categoria = Column(
+    categoria: Mapped[Optional[str]] = mapped_column(
         String(50),
         CheckConstraint("categoria IN ('urgente', 'importante', 'informativo', 'spam')"),
         nullable=True,
         index=True,
     )
-    prioridade = Column(Integer, nullable=True, index=True)  # 1-5
-    contexto = Column(JSON, nullable=True)  # {projeto, tipo, stakeholder}
+    prioridade: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)  # 1-5
+    contexto: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # {projeto, tipo, stakeholder}
 
     # Semantic Analysis
-    intencao = Column(
+    intencao: Mapped[Optional[str]] = mapped_column(
         String(50),
         CheckConstraint("intencao IN ('solicitacao', 'informacao', 'convite', 'cobranca')"),
         nullable=True,
     )
-    tom_emocional = Column(
+    tom_emocional: Mapped[Optional[str]] = mapped_column(
         String(50),
         CheckConstraint("tom_emocional IN ('neutro', 'urgente', 'amigavel', 'formal')"),
         nullable=True,
     )
-    entidades_extraidas = Column(JSON, nullable=True)  # {pessoas, datas, locais, projetos}
-    embedding = Column(Vector(1536), nullable=True)  # OpenAI embeddings for semantic search
+    entidades_extraidas: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # {pessoas, datas, locais, projetos}
+    embedding: Mapped[Optional[Any]] = mapped_column(
+        Vector(1536), nullable=True
+    )  # OpenAI embeddings for semantic search
 
     # Automated Actions
-    acao_sugerida = Column(
+    acao_sugerida: Mapped[Optional[str]] = mapped_column(
         String(50),
         CheckConstraint("acao_sugerida IN ('responder', 'arquivar', 'criar_tarefa', 'snooze')"),
         nullable=True,
     )
-    acao_executada = Column(String(50), nullable=True)
-    rascunho_resposta = Column(Text, nullable=True)
+    acao_executada: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    rascunho_resposta: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Status (basic)
-    read = Column(Boolean, default=False, nullable=False, index=True)
-    arquivada = Column(Boolean, default=False, nullable=False, index=True)
-    respondida = Column(Boolean, default=False, nullable=False)
+    read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    arquivada: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    respondida: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Advanced Status
-    snooze_until = Column(DateTime, nullable=True, index=True)
-    tarefa_criada_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
-    evento_criado_id = Column(String(255), nullable=True)
+    snooze_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
+    tarefa_criada_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("tasks.id"), nullable=True
+    )
+    evento_criado_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Legacy field (for backward compatibility)
-    extra_data = Column(JSON, nullable=True)
+    extra_data: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now, index=True)
-    read_at = Column(DateTime, nullable=True)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now, index=True)
+    read_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -2027,13 +3154,13 @@ class NotificationPreference(Base):
         UniqueConstraint("user_id", "notification_type", name="uix_user_notification_type"),
     )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Notification type
-    notification_type = Column(
+    notification_type: Mapped[str] = mapped_column(
         String(50),
         CheckConstraint(
             "notification_type IN ('task_due_soon', 'capacity_overload', 'cycle_phase_change', 'freelance_invoice_ready', 'system', 'achievement', 'all')"
@@ -2042,13 +3169,13 @@ class NotificationPreference(Base):
     )
 
     # Delivery channels (each can be enabled/disabled independently)
-    enabled = Column(Boolean, default=True, nullable=False)
-    in_app_enabled = Column(Boolean, default=True, nullable=False)
-    email_enabled = Column(Boolean, default=False, nullable=False)
-    push_enabled = Column(Boolean, default=False, nullable=False)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    in_app_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    email_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    push_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Additional settings (JSON for flexibility)
-    settings = Column(JSON, nullable=True)
+    settings: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     # Example settings:
     # - quiet_hours_start: str (e.g., "22:00")
     # - quiet_hours_end: str (e.g., "08:00")
@@ -2056,8 +3183,10 @@ class NotificationPreference(Base):
     # - priority_threshold: str ('low', 'medium', 'high')
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -2075,13 +3204,13 @@ class NotificationSource(Base):
 
     __tablename__ = "notification_sources"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Source type
-    source_type = Column(
+    source_type: Mapped[str] = mapped_column(
         String(50),
         CheckConstraint(
             "source_type IN ('email', 'slack', 'linkedin', 'github', 'whatsapp', "
@@ -2092,27 +3221,31 @@ class NotificationSource(Base):
     )
 
     # Configuration (encrypted credentials, API keys, etc.)
-    name = Column(String(100), nullable=False)
-    credentials = Column(JSON, nullable=True)  # Encrypted in application layer
-    settings = Column(JSON, nullable=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    credentials: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Encrypted in application layer
+    settings: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     # Example settings:
     # - email: {imap_server, username, folders}
     # - slack: {workspace_id, channel_ids, token}
     # - github: {repos, token}
 
     # Status
-    enabled = Column(Boolean, default=True, nullable=False)
-    last_sync = Column(DateTime, nullable=True)
-    sync_frequency_minutes = Column(Integer, default=15, nullable=False)
-    last_error = Column(Text, nullable=True)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    last_sync: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    sync_frequency_minutes: Mapped[int] = mapped_column(Integer, default=15, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Statistics
-    total_collected = Column(Integer, default=0, nullable=False)
-    total_spam_filtered = Column(Integer, default=0, nullable=False)
+    total_collected: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_spam_filtered: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -2135,19 +3268,21 @@ class NotificationRule(Base):
 
     __tablename__ = "notification_rules"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Rule metadata
-    name = Column(String(100), nullable=False)
-    description = Column(Text, nullable=True)
-    enabled = Column(Boolean, default=True, nullable=False, index=True)
-    priority = Column(Integer, default=0, nullable=False)  # Higher priority runs first
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    priority: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )  # Higher priority runs first
 
     # Conditions (JSON structure for complex logic)
-    conditions = Column(JSON, nullable=False)
+    conditions: Mapped[Any] = mapped_column(JSON, nullable=False)
     # Example: {
     #   "all": [
     #     {"field": "sender", "operator": "contains", "value": "recruiter"},
@@ -2156,7 +3291,7 @@ class NotificationRule(Base):
     # }
 
     # Actions to execute when conditions match
-    actions = Column(JSON, nullable=False)
+    actions: Mapped[Any] = mapped_column(JSON, nullable=False)
     # Example: [
     #   {"type": "classify", "categoria": "spam"},
     #   {"type": "archive"},
@@ -2164,12 +3299,14 @@ class NotificationRule(Base):
     # ]
 
     # Statistics
-    times_triggered = Column(Integer, default=0, nullable=False)
-    last_triggered = Column(DateTime, nullable=True)
+    times_triggered: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_triggered: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -2187,39 +3324,43 @@ class NotificationDigest(Base):
 
     __tablename__ = "notification_digests"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Digest type and period
-    digest_type = Column(
+    digest_type: Mapped[str] = mapped_column(
         String(50),
         CheckConstraint("digest_type IN ('daily', 'weekly', 'monthly')"),
         nullable=False,
     )
-    period_start = Column(DateTime, nullable=False, index=True)
-    period_end = Column(DateTime, nullable=False)
+    period_start: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    period_end: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
     # Summary statistics
-    total_notifications = Column(Integer, nullable=False)
-    urgent_count = Column(Integer, default=0)
-    important_count = Column(Integer, default=0)
-    informativo_count = Column(Integer, default=0)
-    spam_count = Column(Integer, default=0)
-    archived_count = Column(Integer, default=0)
-    time_saved_minutes = Column(Integer, default=0)  # Estimated time saved by filtering
+    total_notifications: Mapped[int] = mapped_column(Integer, nullable=False)
+    urgent_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    important_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    informativo_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    spam_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    archived_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    time_saved_minutes: Mapped[Optional[int]] = mapped_column(
+        Integer, default=0
+    )  # Estimated time saved by filtering
 
     # Generated content
-    summary_text = Column(Text, nullable=True)  # AI-generated summary
-    highlights = Column(JSON, nullable=True)  # Top 5 important notifications
+    summary_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # AI-generated summary
+    highlights: Mapped[Optional[Any]] = mapped_column(
+        JSON, nullable=True
+    )  # Top 5 important notifications
 
     # Status
-    sent = Column(Boolean, default=False, nullable=False)
-    sent_at = Column(DateTime, nullable=True)
+    sent: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     # Relationships
     user = relationship("User")
@@ -2240,34 +3381,34 @@ class FocusSession(Base):
 
     __tablename__ = "focus_sessions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Session details
-    start_time = Column(DateTime, nullable=False, index=True)
-    end_time = Column(DateTime, nullable=True)
-    planned_duration_minutes = Column(Integer, nullable=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    planned_duration_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Session type
-    session_type = Column(
+    session_type: Mapped[Optional[str]] = mapped_column(
         String(50),
         CheckConstraint("session_type IN ('deep_work', 'meeting', 'break', 'custom')"),
         default="deep_work",
     )
 
     # Suppression rules during focus
-    suppress_all = Column(Boolean, default=False)
-    allow_urgent_only = Column(Boolean, default=True)
-    custom_rules = Column(JSON, nullable=True)
+    suppress_all: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    allow_urgent_only: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    custom_rules: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
 
     # Statistics
-    notifications_suppressed = Column(Integer, default=0)
-    notifications_allowed = Column(Integer, default=0)
+    notifications_suppressed: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    notifications_allowed: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
 
     # Relationships
     user = relationship("User")
@@ -2289,13 +3430,13 @@ class NotificationPattern(Base):
 
     __tablename__ = "notification_patterns"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Pattern identification
-    pattern_type = Column(
+    pattern_type: Mapped[str] = mapped_column(
         String(50),
         CheckConstraint(
             "pattern_type IN ('sender_preference', 'time_preference', 'topic_preference', "
@@ -2303,14 +3444,14 @@ class NotificationPattern(Base):
         ),
         nullable=False,
     )
-    pattern_key = Column(String(255), nullable=False, index=True)
+    pattern_key: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     # Examples:
     # - sender:recruiter@company.com
     # - time:morning_emails
     # - topic:project_updates
 
     # Pattern data
-    pattern_data = Column(JSON, nullable=False)
+    pattern_data: Mapped[Any] = mapped_column(JSON, nullable=False)
     # Example: {
     #   "typical_action": "archive",
     #   "typical_response_time_hours": 24,
@@ -2318,13 +3459,15 @@ class NotificationPattern(Base):
     # }
 
     # Pattern confidence
-    confidence_score = Column(Float, default=0.0)  # 0-1
-    occurrences = Column(Integer, default=1)
-    last_occurrence = Column(DateTime, nullable=False)
+    confidence_score: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # 0-1
+    occurrences: Mapped[Optional[int]] = mapped_column(Integer, default=1)
+    last_occurrence: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
@@ -2346,33 +3489,37 @@ class ResponseTemplate(Base):
 
     __tablename__ = "response_templates"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Template metadata
-    name = Column(String(100), nullable=False)
-    description = Column(Text, nullable=True)
-    category = Column(String(50), nullable=True, index=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
     # Examples: "meeting_response", "project_update", "decline_politely"
 
     # Template content
-    template_text = Column(Text, nullable=False)
-    variables = Column(JSON, nullable=True)  # Placeholder variables
+    template_text: Mapped[str] = mapped_column(Text, nullable=False)
+    variables: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # Placeholder variables
     # Example: {"recipient_name": "{{name}}", "project": "{{project}}"}
 
     # Usage statistics
-    times_used = Column(Integer, default=0)
-    last_used = Column(DateTime, nullable=True)
+    times_used: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    last_used: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # AI-generated flag
-    ai_generated = Column(Boolean, default=False)
-    confidence_score = Column(Float, nullable=True)  # If AI-generated
+    ai_generated: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    confidence_score: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # If AI-generated
 
     # Timestamps
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utc_now)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=utc_now, onupdate=utc_now
+    )
 
     # Relationships
     user = relationship("User")
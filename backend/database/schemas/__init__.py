@@ -1,43 +1,252 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import date, datetime
-from typing import Literal, Optional
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from functools import cache
+from typing import Annotated, Iterator, Literal, Optional, get_args, get_origin
+
+# Imported from their defining modules; top-level `pydantic` names resolve through
+# its lazy module __getattr__, which this hot import path can skip
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+from pydantic.functional_validators import AfterValidator, field_validator
+from pydantic.main import BaseModel
+from pydantic.type_adapter import TypeAdapter
+from pydantic.types import StrictFloat, StringConstraints
 
 from api.security import sanitize_string, validate_color_hex
 
+# Closed value sets, matched by pydantic-core's hashed literal lookup
+TaskType = Literal["fixed_appointment", "task", "continuous"]
+TaskStatus = Literal["pending", "in_progress", "completed", "cancelled"]
+OpportunityStatus = Literal["new", "analyzed", "evaluated", "accepted", "rejected"]
+OpportunityRecommendation = Literal["accept", "negotiate", "reject", "pending"]
+ExecutionStatus = Literal["planned", "in_progress", "completed", "cancelled", "on_hold"]
+NegotiationOutcome = Literal["accepted", "rejected", "agreed", "no_response", "pending"]
+CalendarProvider = Literal["google", "microsoft"]
+SyncDirection = Literal["both", "to_calendar", "from_calendar"]
+CalendarEventStatus = Literal["confirmed", "tentative", "cancelled"]
+SyncStatus = Literal["started", "success", "failed", "partial"]
+ConflictStatus = Literal["detected", "resolved", "manual_review"]
+ConflictResolution = Literal[
+    "last_modified_wins", "manual", "charlee_wins", "external_wins", "merge"
+]
+
+# Recurring string constraints, declared once and shared by every field using them
+ShortName = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+MediumName = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+LongName = Annotated[str, StringConstraints(min_length=1, max_length=300)]
+NonEmptyText = Annotated[str, StringConstraints(min_length=1)]
+
+
+_MISSING = object()
+
+
+class ORMResponse(BaseModel):
+    """Base for response schemas read from ORM rows."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj, _shared: Optional[dict] = None):
+        """Build the response from an ORM row without re-running field validators.
+
+        Nested responses are looked up in ``_shared`` (keyed by ORM object) first,
+        so rows pointing at the same related object reuse one frozen instance.
+        """
+        if obj is None:
+            return None
+        values = {}
+        for name, nested, members in _orm_fields(cls):
+            value = getattr(obj, name, _MISSING)
+            if value is _MISSING:
+                continue  # model_construct applies the field default, as from_attributes does
+            if nested:
+                value = nested._from_related(value, _shared)
+            elif members:
+                # One shared str per Literal member instead of a fresh copy per row
+                value = members.get(value, value)
+            values[name] = value
+        field_names = _orm_field_names(cls)
+        # Complete rows share one fields-set instead of allocating a set per instance
+        return cls.model_construct(
+            field_names if len(values) == len(field_names) else None, **values
+        )
+
+    @classmethod
+    def _from_related(cls, obj, shared: Optional[dict]):
+        if obj is None or shared is None:
+            return cls.from_orm_fast(obj, shared)
+        # The session identity map yields one object per row, so id() is stable here
+        key = (cls, id(obj))
+        response = shared.get(key)
+        if response is None:
+            response = shared[key] = cls.from_orm_fast(obj, shared)
+        return response
+
+    @classmethod
+    def from_orm_list(cls, rows) -> list:
+        """Build responses for a list of ORM rows, sharing nested responses between rows."""
+        shared: dict = {}
+        return [cls.from_orm_fast(obj, shared) for obj in rows]
+
+    @classmethod
+    def dump_list_json(cls, rows, key: str, total: Optional[int] = None) -> bytes:
+        """Serialize ORM rows straight to a ``{"total": n, key: [...]}`` JSON payload.
+
+        ``total`` defaults to the number of rows; paginated lists pass their full count.
+        """
+        items = _list_adapter(cls).dump_json(cls.from_orm_list(rows))
+        if total is None:
+            total = len(rows)
+        return b'{"total":%d,"%s":%s}' % (total, key.encode(), items)
+
+    @classmethod
+    def iter_list_json(cls, rows, key: str, chunk_size: int = 500) -> Iterator[bytes]:
+        """Yield the dump_list_json payload in pieces, for a StreamingResponse.
+
+        Only chunk_size responses exist at a time, instead of one per row.
+        """
+        adapter = _list_adapter(cls)
+        shared: dict = {}
+        yield b'{"total":%d,"%s":[' % (len(rows), key.encode())
+        for start in range(0, len(rows), chunk_size):
+            chunk = [cls.from_orm_fast(obj, shared) for obj in rows[start : start + chunk_size]]
+            # Strip the chunk's own brackets; chunks after the first continue the array
+            yield (b"," if start else b"") + adapter.dump_json(chunk)[1:-1]
+        yield b"]}"
+
+
+@cache
+def _orm_fields(
+    cls: type[ORMResponse],
+) -> tuple[tuple[str, Optional[type[ORMResponse]], Optional[dict]], ...]:
+    """Return (field name, nested response schema, Literal members) triples for an ORMResponse.
+
+    The nested schema is None for plain fields; the members map, from each
+    allowed value to itself, is None for fields not typed as a Literal.
+    """
+    fields = []
+    for name, field in cls.model_fields.items():
+        args = (field.annotation, *get_args(field.annotation))
+        nested = next(
+            (arg for arg in args if isinstance(arg, type) and issubclass(arg, ORMResponse)),
+            None,
+        )
+        literal = next((arg for arg in args if get_origin(arg) is Literal), None)
+        members = {value: value for value in get_args(literal)} if literal else None
+        fields.append((name, nested, members))
+    return tuple(fields)
+
+
+def warm_up() -> None:
+    """Prepare the per-schema caches of every loaded ORMResponse ahead of the first request.
+
+    Models compile their validators at class creation; what is otherwise built
+    lazily on a schema's first list response is its field layout and list adapter.
+    """
+    pending = ORMResponse.__subclasses__()
+    while pending:
+        cls = pending.pop()
+        _orm_fields(cls)
+        _orm_field_names(cls)
+        _list_adapter(cls)
+        pending.extend(cls.__subclasses__())
+
+
+def apply_patch(obj, patch: BaseModel) -> None:
+    """Copy the fields explicitly set on an update schema onto an ORM row.
+
+    Equivalent to ``patch.model_dump(exclude_unset=True)`` for the flat update
+    schemas, but reads the validated values directly instead of serializing them.
+    """
+    for name in patch.model_fields_set:
+        setattr(obj, name, getattr(patch, name))
+
+
+@cache
+def _orm_field_names(cls: type[ORMResponse]) -> set[str]:
+    """Return the field names of an ORMResponse as a set shared by its instances.
+
+    Safe to share: instances are frozen, so pydantic never adds to it, and
+    model_copy works on a copy.
+    """
+    return set(cls.model_fields)
+
+
+@cache
+def _list_adapter(cls: type[ORMResponse]) -> TypeAdapter:
+    """Return the list[cls] adapter, built on the first list serialized for a schema."""
+    return TypeAdapter(list[cls])
+
+
+def _sanitize_required(v: str, label: str, max_length: int, allow_newlines: bool) -> str:
+    """Sanitize a required text field, rejecting values that end up blank.
+
+    Emptiness itself is rejected earlier by the field's min_length=1 constraint.
+    """
+    sanitized = sanitize_string(
+        v, max_length=max_length, allow_newlines=allow_newlines, none_if_blank=True
+    )
+    if sanitized is None:
+        raise ValueError(f"{label} cannot be empty after sanitization")
+    return sanitized
+
+
+def _sanitize_optional(v: str) -> Optional[str]:
+    """Sanitize an optional free-text field, mapping blank results to None."""
+    return sanitize_string(v, max_length=5000, allow_newlines=True, none_if_blank=True)
+
+
+@cache
+def _required_text(label: str, max_length: int, allow_newlines: bool) -> AfterValidator:
+    """Return the validator sanitizing a required text field, shared per settings."""
+
+    def sanitize(v: str) -> str:
+        return _sanitize_required(v, label, max_length, allow_newlines)
+
+    return AfterValidator(sanitize)
+
+
+# The rejected value is already reported in pydantic's error (input=...)
+_INVALID_HEX_COLOR = "Invalid hex color format. Expected format: #RRGGBB"
+
+
+def _validate_hex_color(v: str) -> str:
+    """Validate color is a valid hex code."""
+    if not validate_color_hex(v):
+        raise ValueError(_INVALID_HEX_COLOR)
+    return v
+
+
+def _validate_big_rock_id(v: int) -> int:
+    """Validate big_rock_id is positive."""
+    if v <= 0:
+        raise ValueError("big_rock_id must be a positive integer")
+    return v
+
+
+# Value checks bound to the type; under Optional[...] pydantic skips them for None
+SanitizedText = Annotated[str, AfterValidator(_sanitize_optional)]
+HexColor = Annotated[str, StringConstraints(max_length=20), AfterValidator(_validate_hex_color)]
+BigRockId = Annotated[int, AfterValidator(_validate_big_rock_id)]
+# Pricing multipliers; strict, so numeric strings are rejected rather than coerced
+FactorMap = dict[str, Annotated[StrictFloat, Field(gt=0)]]
+
+# Required text fields, sanitized against XSS and rejected if nothing is left
+RequiredName = Annotated[ShortName, _required_text("Name", 100, False)]
+RequiredDescription = Annotated[NonEmptyText, _required_text("Description", 5000, True)]
+
+
 # ==================== Big Rock Schemas ====================
 
 
 class BigRockBase(BaseModel):
     """Base schema for BigRock."""
 
-    name: str = Field(..., min_length=1, max_length=100)
-    color: Optional[str] = Field(None, max_length=20)
+    name: RequiredName
+    color: Optional[HexColor] = None
     active: bool = True
 
-    @field_validator("name")
-    @classmethod
-    def sanitize_name(cls, v: str) -> str:
-        """Sanitize name to prevent XSS."""
-        if not v:
-            raise ValueError("Name cannot be empty")
-        sanitized = sanitize_string(v, max_length=100, allow_newlines=False)
-        if not sanitized.strip():
-            raise ValueError("Name cannot be empty after sanitization")
-        return sanitized
-
-    @field_validator("color")
-    @classmethod
-    def validate_color(cls, v: Optional[str]) -> Optional[str]:
-        """Validate color is a valid hex code."""
-        if v is None:
-            return v
-        if not validate_color_hex(v):
-            raise ValueError(f"Invalid hex color format: {v}. Expected format: #RRGGBB")
-        return v
-
 
 class BigRockCreate(BigRockBase):
     """Schema for creating a BigRock."""
@@ -48,19 +257,17 @@ class BigRockCreate(BigRockBase):
 class BigRockUpdate(BaseModel):
     """Schema for updating a BigRock."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[ShortName] = None
     color: Optional[str] = Field(None, max_length=20)
     active: Optional[bool] = None
 
 
-class BigRockResponse(BigRockBase):
+class BigRockResponse(BigRockBase, ORMResponse):
     """Schema for BigRock response."""
 
     id: int
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ==================== Task Schemas ====================
 
@@ -68,29 +275,10 @@ class BigRockResponse(BigRockBase):
 class TaskBase(BaseModel):
     """Base schema for Task."""
 
-    description: str = Field(..., min_length=1)
-    type: Literal["fixed_appointment", "task", "continuous"] = "task"
+    description: RequiredDescription
+    type: TaskType = "task"
     deadline: Optional[date] = None
-    big_rock_id: Optional[int] = None
-
-    @field_validator("description")
-    @classmethod
-    def sanitize_description(cls, v: str) -> str:
-        """Sanitize description to prevent XSS."""
-        if not v:
-            raise ValueError("Description cannot be empty")
-        sanitized = sanitize_string(v, max_length=5000, allow_newlines=True)
-        if not sanitized.strip():
-            raise ValueError("Description cannot be empty after sanitization")
-        return sanitized
-
-    @field_validator("big_rock_id")
-    @classmethod
-    def validate_big_rock_id(cls, v: Optional[int]) -> Optional[int]:
-        """Validate big_rock_id is positive if provided."""
-        if v is not None and v <= 0:
-            raise ValueError("big_rock_id must be a positive integer")
-        return v
+    big_rock_id: Optional[BigRockId] = None
 
 
 class TaskCreate(TaskBase):
@@ -102,14 +290,14 @@ class TaskCreate(TaskBase):
 class TaskUpdate(BaseModel):
     """Schema for updating a Task."""
 
-    description: Optional[str] = Field(None, min_length=1)
-    type: Optional[Literal["fixed_appointment", "task", "continuous"]] = None
+    description: Optional[NonEmptyText] = None
+    type: Optional[TaskType] = None
     deadline: Optional[date] = None
     big_rock_id: Optional[int] = None
-    status: Optional[Literal["pending", "in_progress", "completed", "cancelled"]] = None
+    status: Optional[TaskStatus] = None
 
 
-class TaskResponse(TaskBase):
+class TaskResponse(TaskBase, ORMResponse):
     """Schema for Task response."""
 
     id: int
@@ -119,8 +307,6 @@ class TaskResponse(TaskBase):
     completed_at: Optional[datetime] = None
     big_rock: Optional[BigRockResponse] = None
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ==================== List Responses ====================
 
@@ -141,205 +327,38 @@ class BigRockListResponse(BaseModel):
 
 # ==================== Freelance System Schemas ====================
 
-
-class FreelanceProjectBase(BaseModel):
-    """Base schema for FreelanceProject."""
-
-    client_name: str = Field(..., min_length=1, max_length=200)
-    project_name: str = Field(..., min_length=1, max_length=200)
-    description: Optional[str] = None
-    hourly_rate: float = Field(..., gt=0)
-    estimated_hours: float = Field(..., gt=0)
-    start_date: Optional[date] = None
-    deadline: Optional[date] = None
-    notes: Optional[str] = None
-    tags: Optional[str] = None
-
-    @field_validator("client_name", "project_name")
-    @classmethod
-    def sanitize_names(cls, v: str) -> str:
-        """Sanitize names to prevent XSS."""
-        if not v:
-            raise ValueError("Field cannot be empty")
-        sanitized = sanitize_string(v, max_length=200, allow_newlines=False)
-        if not sanitized.strip():
-            raise ValueError("Field cannot be empty after sanitization")
-        return sanitized
-
-    @field_validator("description", "notes")
-    @classmethod
-    def sanitize_text_fields(cls, v: Optional[str]) -> Optional[str]:
-        """Sanitize text fields to prevent XSS."""
-        if v is None:
-            return v
-        sanitized = sanitize_string(v, max_length=5000, allow_newlines=True)
-        return sanitized if sanitized.strip() else None
-
-
-class FreelanceProjectCreate(FreelanceProjectBase):
-    """Schema for creating a FreelanceProject."""
-
-    pass
-
-
-class FreelanceProjectUpdate(BaseModel):
-    """Schema for updating a FreelanceProject."""
-
-    client_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    project_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = None
-    hourly_rate: Optional[float] = Field(None, gt=0)
-    estimated_hours: Optional[float] = Field(None, gt=0)
-    start_date: Optional[date] = None
-    deadline: Optional[date] = None
-    status: Optional[Literal["proposal", "active", "completed", "cancelled"]] = None
-    notes: Optional[str] = None
-    tags: Optional[str] = None
-
-
-class FreelanceProjectResponse(FreelanceProjectBase):
-    """Schema for FreelanceProject response."""
-
-    id: int
-    status: str
-    actual_hours: float
-    completed_date: Optional[date] = None
-    created_at: datetime
-    updated_at: datetime
-
-    model_config = ConfigDict(from_attributes=True)
-
-
-class WorkLogBase(BaseModel):
-    """Base schema for WorkLog."""
-
-    project_id: int = Field(..., gt=0)
-    hours: float = Field(..., gt=0)
-    description: str = Field(..., min_length=1)
-    work_date: Optional[date] = None
-    task_type: Optional[str] = Field(None, max_length=50)
-    billable: bool = True
-
-    @field_validator("description")
-    @classmethod
-    def sanitize_description(cls, v: str) -> str:
-        """Sanitize description to prevent XSS."""
-        if not v:
-            raise ValueError("Description cannot be empty")
-        sanitized = sanitize_string(v, max_length=5000, allow_newlines=True)
-        if not sanitized.strip():
-            raise ValueError("Description cannot be empty after sanitization")
-        return sanitized
-
-
-class WorkLogCreate(WorkLogBase):
-    """Schema for creating a WorkLog."""
-
-    pass
-
-
-class WorkLogUpdate(BaseModel):
-    """Schema for updating a WorkLog."""
-
-    hours: Optional[float] = Field(None, gt=0)
-    description: Optional[str] = Field(None, min_length=1)
-    work_date: Optional[date] = None
-    task_type: Optional[str] = Field(None, max_length=50)
-    billable: Optional[bool] = None
-
-
-class WorkLogResponse(WorkLogBase):
-    """Schema for WorkLog response."""
-
-    id: int
-    user_id: int
-    invoiced: bool
-    invoice_id: Optional[int] = None
-    created_at: datetime
-    updated_at: datetime
-
-    model_config = ConfigDict(from_attributes=True)
-
-
-class InvoiceBase(BaseModel):
-    """Base schema for Invoice."""
-
-    project_id: int = Field(..., gt=0)
-    invoice_number: str = Field(..., min_length=1, max_length=50)
-    issue_date: date
-    due_date: Optional[date] = None
-    payment_terms: Optional[str] = None
-    notes: Optional[str] = None
-
-    @field_validator("invoice_number")
-    @classmethod
-    def sanitize_invoice_number(cls, v: str) -> str:
-        """Sanitize invoice number."""
-        sanitized = sanitize_string(v, max_length=50, allow_newlines=False)
-        if not sanitized.strip():
-            raise ValueError("Invoice number cannot be empty")
-        return sanitized
-
-
-class InvoiceCreate(BaseModel):
-    """Schema for creating an Invoice."""
-
-    project_id: int = Field(..., gt=0)
-    invoice_number: Optional[str] = None  # Auto-generated if not provided
-    payment_terms: Optional[str] = Field(None, max_length=200)
-    notes: Optional[str] = None
-    include_unbilled_only: bool = True
-
-
-class InvoiceUpdate(BaseModel):
-    """Schema for updating an Invoice."""
-
-    status: Optional[Literal["draft", "sent", "paid", "overdue", "cancelled"]] = None
-    due_date: Optional[date] = None
-    paid_date: Optional[date] = None
-    payment_method: Optional[str] = Field(None, max_length=50)
-    notes: Optional[str] = None
-
-
-class InvoiceResponse(InvoiceBase):
-    """Schema for Invoice response."""
-
-    id: int
-    user_id: int
-    total_amount: float
-    total_hours: float
-    hourly_rate: float
-    status: str
-    paid_date: Optional[date] = None
-    payment_method: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
-
-    model_config = ConfigDict(from_attributes=True)
-
-
-# ==================== Freelance List Responses ====================
-
-
-class FreelanceProjectListResponse(BaseModel):
-    """Schema for list of freelance projects."""
-
-    total: int
-    projects: list[FreelanceProjectResponse]
-
-
-class WorkLogListResponse(BaseModel):
-    """Schema for list of work logs."""
-
-    total: int
-    work_logs: list[WorkLogResponse]
-
-
-class InvoiceListResponse(BaseModel):
-    """Schema for list of invoices."""
-
-    total: int
-    invoices: list[InvoiceResponse]
+# Defined in database.schemas.freelance, which is only built when one is first used
+_FREELANCE_SCHEMAS = frozenset(
+    {
+        "FreelanceProjectBase",
+        "FreelanceProjectCreate",
+        "FreelanceProjectUpdate",
+        "FreelanceProjectResponse",
+        "WorkLogBase",
+        "WorkLogCreate",
+        "WorkLogUpdate",
+        "WorkLogResponse",
+        "InvoiceBase",
+        "InvoiceCreate",
+        "InvoiceUpdate",
+        "InvoiceResponse",
+        "FreelanceHoursSummaryResponse",
+        "FreelanceProjectListResponse",
+        "WorkLogListResponse",
+        "InvoiceListResponse",
+        "FreelanceProjectStatus",
+        "InvoiceStatus",
+    }
+)
+
+
+def __getattr__(name):
+    """Resolve freelance schema names lazily (PEP 562)."""
+    if name in _FREELANCE_SCHEMAS:
+        from database.schemas import freelance
+
+        return getattr(freelance, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ==================== Projects Intelligence System Schemas ====================
@@ -351,7 +370,7 @@ class InvoiceListResponse(BaseModel):
 class FreelancePlatformBase(BaseModel):
     """Base schema for FreelancePlatform."""
 
-    name: str = Field(..., min_length=1, max_length=100)
+    name: RequiredName
     platform_type: Optional[str] = Field(None, max_length=50)
     website_url: Optional[str] = Field(None, max_length=255)
     api_config: Optional[dict] = None
@@ -359,17 +378,6 @@ class FreelancePlatformBase(BaseModel):
     active: bool = True
     collection_interval_minutes: Optional[int] = Field(None, ge=1)
 
-    @field_validator("name")
-    @classmethod
-    def sanitize_name(cls, v: str) -> str:
-        """Sanitize name to prevent XSS."""
-        if not v:
-            raise ValueError("Name cannot be empty")
-        sanitized = sanitize_string(v, max_length=100, allow_newlines=False)
-        if not sanitized.strip():
-            raise ValueError("Name cannot be empty after sanitization")
-        return sanitized
-
 
 class FreelancePlatformCreate(FreelancePlatformBase):
     """Schema for creating a FreelancePlatform."""
@@ -380,7 +388,7 @@ class FreelancePlatformCreate(FreelancePlatformBase):
 class FreelancePlatformUpdate(BaseModel):
     """Schema for updating a FreelancePlatform."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[ShortName] = None
     platform_type: Optional[str] = Field(None, max_length=50)
     website_url: Optional[str] = Field(None, max_length=255)
     api_config: Optional[dict] = None
@@ -389,7 +397,7 @@ class FreelancePlatformUpdate(BaseModel):
     collection_interval_minutes: Optional[int] = Field(None, ge=1)
 
 
-class FreelancePlatformResponse(FreelancePlatformBase):
+class FreelancePlatformResponse(FreelancePlatformBase, ORMResponse):
     """Schema for FreelancePlatform response."""
 
     id: int
@@ -399,8 +407,6 @@ class FreelancePlatformResponse(FreelancePlatformBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ----- FreelanceOpportunity Schemas -----
 
@@ -408,8 +414,8 @@ class FreelancePlatformResponse(FreelancePlatformBase):
 class FreelanceOpportunityBase(BaseModel):
     """Base schema for FreelanceOpportunity."""
 
-    title: str = Field(..., min_length=1, max_length=300)
-    description: str = Field(..., min_length=1)
+    title: Annotated[LongName, _required_text("Title", 300, False)]
+    description: Annotated[NonEmptyText, _required_text("Description", 10000, True)]
     platform_id: Optional[int] = Field(None, gt=0)
     external_id: Optional[str] = Field(None, max_length=100)
     client_name: Optional[str] = Field(None, max_length=200)
@@ -422,28 +428,6 @@ class FreelanceOpportunityBase(BaseModel):
     client_deadline_days: Optional[int] = Field(None, gt=0)
     contract_type: Optional[str] = Field(None, max_length=50)
 
-    @field_validator("title")
-    @classmethod
-    def sanitize_title(cls, v: str) -> str:
-        """Sanitize title to prevent XSS."""
-        if not v:
-            raise ValueError("Title cannot be empty")
-        sanitized = sanitize_string(v, max_length=300, allow_newlines=False)
-        if not sanitized.strip():
-            raise ValueError("Title cannot be empty after sanitization")
-        return sanitized
-
-    @field_validator("description")
-    @classmethod
-    def sanitize_description(cls, v: str) -> str:
-        """Sanitize description to prevent XSS."""
-        if not v:
-            raise ValueError("Description cannot be empty")
-        sanitized = sanitize_string(v, max_length=10000, allow_newlines=True)
-        if not sanitized.strip():
-            raise ValueError("Description cannot be empty after sanitization")
-        return sanitized
-
 
 class FreelanceOpportunityCreate(FreelanceOpportunityBase):
     """Schema for creating a FreelanceOpportunity."""
@@ -454,8 +438,8 @@ class FreelanceOpportunityCreate(FreelanceOpportunityBase):
 class FreelanceOpportunityUpdate(BaseModel):
     """Schema for updating a FreelanceOpportunity."""
 
-    title: Optional[str] = Field(None, min_length=1, max_length=300)
-    description: Optional[str] = Field(None, min_length=1)
+    title: Optional[LongName] = None
+    description: Optional[NonEmptyText] = None
     client_name: Optional[str] = Field(None, max_length=200)
     client_rating: Optional[float] = Field(None, ge=0, le=5)
     client_country: Optional[str] = Field(None, max_length=100)
@@ -465,11 +449,11 @@ class FreelanceOpportunityUpdate(BaseModel):
     client_currency: Optional[str] = Field(None, max_length=3)
     client_deadline_days: Optional[int] = Field(None, gt=0)
     contract_type: Optional[str] = Field(None, max_length=50)
-    status: Optional[Literal["new", "analyzed", "evaluated", "accepted", "rejected"]] = None
-    recommendation: Optional[Literal["accept", "negotiate", "reject", "pending"]] = None
+    status: Optional[OpportunityStatus] = None
+    recommendation: Optional[OpportunityRecommendation] = None
 
 
-class FreelanceOpportunityResponse(FreelanceOpportunityBase):
+class FreelanceOpportunityResponse(FreelanceOpportunityBase, ORMResponse):
     """Schema for FreelanceOpportunity response."""
 
     id: int
@@ -493,8 +477,6 @@ class FreelanceOpportunityResponse(FreelanceOpportunityBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ----- PricingParameter Schemas -----
 
@@ -505,28 +487,12 @@ class PricingParameterBase(BaseModel):
     base_hourly_rate: float = Field(..., gt=0)
     minimum_margin: float = Field(default=0.20, ge=0, le=1)
     minimum_project_value: float = Field(default=100.0, gt=0)
-    complexity_factors: Optional[dict] = None
-    specialization_factors: Optional[dict] = None
-    deadline_factors: Optional[dict] = None
-    client_factors: Optional[dict] = None
+    complexity_factors: Optional[FactorMap] = None
+    specialization_factors: Optional[FactorMap] = None
+    deadline_factors: Optional[FactorMap] = None
+    client_factors: Optional[FactorMap] = None
     active: bool = True
 
-    @field_validator(
-        "complexity_factors",
-        "specialization_factors",
-        "deadline_factors",
-        "client_factors",
-    )
-    @classmethod
-    def validate_factors(cls, v: Optional[dict]) -> Optional[dict]:
-        """Validate factor dictionaries contain positive multipliers."""
-        if v is None:
-            return v
-        for key, value in v.items():
-            if not isinstance(value, (int, float)) or value <= 0:
-                raise ValueError(f"Factor '{key}' must be a positive number, got {value}")
-        return v
-
 
 class PricingParameterCreate(PricingParameterBase):
     """Schema for creating a PricingParameter."""
@@ -540,14 +506,14 @@ class PricingParameterUpdate(BaseModel):
     base_hourly_rate: Optional[float] = Field(None, gt=0)
     minimum_margin: Optional[float] = Field(None, ge=0, le=1)
     minimum_project_value: Optional[float] = Field(None, gt=0)
-    complexity_factors: Optional[dict] = None
-    specialization_factors: Optional[dict] = None
-    deadline_factors: Optional[dict] = None
-    client_factors: Optional[dict] = None
+    complexity_factors: Optional[FactorMap] = None
+    specialization_factors: Optional[FactorMap] = None
+    deadline_factors: Optional[FactorMap] = None
+    client_factors: Optional[FactorMap] = None
     active: Optional[bool] = None
 
 
-class PricingParameterResponse(PricingParameterBase):
+class PricingParameterResponse(PricingParameterBase, ORMResponse):
     """Schema for PricingParameter response."""
 
     id: int
@@ -558,8 +524,6 @@ class PricingParameterResponse(PricingParameterBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ----- ProjectExecution Schemas -----
 
@@ -583,19 +547,10 @@ class ProjectExecutionBase(BaseModel):
 
     # Client evaluation
     client_satisfaction: Optional[int] = Field(None, ge=1, le=5)
-    client_feedback: Optional[str] = None
+    client_feedback: Optional[SanitizedText] = None
 
     # Personal notes
-    personal_notes: Optional[str] = None
-
-    @field_validator("client_feedback", "personal_notes")
-    @classmethod
-    def sanitize_text_fields(cls, v: Optional[str]) -> Optional[str]:
-        """Sanitize text fields to prevent XSS."""
-        if v is None:
-            return v
-        sanitized = sanitize_string(v, max_length=5000, allow_newlines=True)
-        return sanitized if sanitized.strip() else None
+    personal_notes: Optional[SanitizedText] = None
 
 
 class ProjectExecutionCreate(ProjectExecutionBase):
@@ -616,10 +571,10 @@ class ProjectExecutionUpdate(BaseModel):
     client_satisfaction: Optional[int] = Field(None, ge=1, le=5)
     client_feedback: Optional[str] = None
     personal_notes: Optional[str] = None
-    status: Optional[Literal["planned", "in_progress", "completed", "cancelled", "on_hold"]] = None
+    status: Optional[ExecutionStatus] = None
 
 
-class ProjectExecutionResponse(ProjectExecutionBase):
+class ProjectExecutionResponse(ProjectExecutionBase, ORMResponse):
     """Schema for ProjectExecution response."""
 
     id: int
@@ -631,8 +586,6 @@ class ProjectExecutionResponse(ProjectExecutionBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ----- Negotiation Schemas -----
 
@@ -649,21 +602,14 @@ class NegotiationBase(BaseModel):
     # Counter-proposal
     counter_proposal_budget: float = Field(..., gt=0)
     counter_proposal_deadline_days: Optional[int] = Field(None, gt=0)
-    counter_proposal_justification: str = Field(..., min_length=1)
+    counter_proposal_justification: Annotated[
+        NonEmptyText, _required_text("Justification", 5000, True)
+    ]
 
     # Client response
     final_agreed_budget: Optional[float] = Field(None, gt=0)
     final_agreed_deadline_days: Optional[int] = Field(None, gt=0)
 
-    @field_validator("counter_proposal_justification")
-    @classmethod
-    def sanitize_text_fields(cls, v: str) -> str:
-        """Sanitize text fields to prevent XSS."""
-        sanitized = sanitize_string(v, max_length=5000, allow_newlines=True)
-        if not sanitized.strip():
-            raise ValueError("Justification cannot be empty")
-        return sanitized
-
 
 class NegotiationCreate(NegotiationBase):
     """Schema for creating a Negotiation."""
@@ -680,11 +626,11 @@ class NegotiationUpdate(BaseModel):
     client_response: Optional[str] = None
     final_agreed_budget: Optional[float] = Field(None, gt=0)
     final_agreed_deadline_days: Optional[int] = Field(None, gt=0)
-    outcome: Optional[Literal["accepted", "rejected", "agreed", "no_response", "pending"]] = None
+    outcome: Optional[NegotiationOutcome] = None
     outcome_notes: Optional[str] = None
 
 
-class NegotiationResponse(NegotiationBase):
+class NegotiationResponse(NegotiationBase, ORMResponse):
     """Schema for Negotiation response."""
 
     id: int
@@ -697,8 +643,6 @@ class NegotiationResponse(NegotiationBase):
     responded_at: Optional[datetime] = None
     finalized_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ==================== Projects Intelligence List Responses ====================
 
@@ -744,24 +688,24 @@ class NegotiationListResponse(BaseModel):
 class CalendarConnectionBase(BaseModel):
     """Base schema for CalendarConnection."""
 
-    provider: Literal["google", "microsoft"]
+    provider: CalendarProvider
     calendar_id: str = Field(..., min_length=1, max_length=255)
     calendar_name: Optional[str] = Field(None, max_length=255)
     sync_enabled: bool = True
-    sync_direction: Literal["both", "to_calendar", "from_calendar"] = "both"
+    sync_direction: SyncDirection = "both"
 
 
 class CalendarConnectionCreate(BaseModel):
     """Schema for creating a CalendarConnection."""
 
-    provider: Literal["google", "microsoft"]
+    provider: CalendarProvider
     calendar_id: str = Field(..., min_length=1, max_length=255)
     calendar_name: Optional[str] = Field(None, max_length=255)
-    access_token: str = Field(..., min_length=1)
+    access_token: NonEmptyText
     refresh_token: Optional[str] = None
     token_expires_at: Optional[datetime] = None
     sync_enabled: bool = True
-    sync_direction: Literal["both", "to_calendar", "from_calendar"] = "both"
+    sync_direction: SyncDirection = "both"
 
 
 class CalendarConnectionUpdate(BaseModel):
@@ -769,13 +713,13 @@ class CalendarConnectionUpdate(BaseModel):
 
     calendar_name: Optional[str] = Field(None, max_length=255)
     sync_enabled: Optional[bool] = None
-    sync_direction: Optional[Literal["both", "to_calendar", "from_calendar"]] = None
+    sync_direction: Optional[SyncDirection] = None
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
     token_expires_at: Optional[datetime] = None
 
 
-class CalendarConnectionResponse(CalendarConnectionBase):
+class CalendarConnectionResponse(CalendarConnectionBase, ORMResponse):
     """Schema for CalendarConnection response."""
 
     id: int
@@ -786,28 +730,21 @@ class CalendarConnectionResponse(CalendarConnectionBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class CalendarEventBase(BaseModel):
     """Base schema for CalendarEvent."""
 
-    title: str = Field(..., min_length=1, max_length=500)
-    description: Optional[str] = None
+    title: Annotated[
+        str, StringConstraints(min_length=1, max_length=500), AfterValidator(_sanitize_optional)
+    ]
+    description: Optional[SanitizedText] = None
     start_time: datetime
     end_time: datetime
     all_day: bool = False
-    location: Optional[str] = Field(None, max_length=500)
-    status: Literal["confirmed", "tentative", "cancelled"] = "confirmed"
-
-    @field_validator("title", "description", "location")
-    @classmethod
-    def sanitize_text(cls, v: Optional[str]) -> Optional[str]:
-        """Sanitize text fields to prevent XSS."""
-        if v is None:
-            return v
-        sanitized = sanitize_string(v, max_length=5000, allow_newlines=True)
-        return sanitized if sanitized.strip() else None
+    location: Optional[
+        Annotated[str, StringConstraints(max_length=500), AfterValidator(_sanitize_optional)]
+    ] = None
+    status: CalendarEventStatus = "confirmed"
 
     @field_validator("end_time")
     @classmethod
@@ -834,7 +771,7 @@ class CalendarEventCreate(BaseModel):
     attendees: Optional[str] = None
     is_recurring: bool = False
     recurrence_rule: Optional[str] = None
-    status: Literal["confirmed", "tentative", "cancelled"] = "confirmed"
+    status: CalendarEventStatus = "confirmed"
     source: Literal["charlee", "external"]
 
 
@@ -850,10 +787,10 @@ class CalendarEventUpdate(BaseModel):
     attendees: Optional[str] = None
     is_recurring: Optional[bool] = None
     recurrence_rule: Optional[str] = None
-    status: Optional[Literal["confirmed", "tentative", "cancelled"]] = None
+    status: Optional[CalendarEventStatus] = None
 
 
-class CalendarEventResponse(CalendarEventBase):
+class CalendarEventResponse(CalendarEventBase, ORMResponse):
     """Schema for CalendarEvent response."""
 
     id: int
@@ -871,15 +808,13 @@ class CalendarEventResponse(CalendarEventBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class CalendarSyncLogBase(BaseModel):
     """Base schema for CalendarSyncLog."""
 
     sync_type: Literal["manual", "scheduled", "webhook"]
-    direction: Literal["to_calendar", "from_calendar", "both"]
-    status: Literal["started", "success", "failed", "partial"]
+    direction: SyncDirection
+    status: SyncStatus
 
 
 class CalendarSyncLogCreate(CalendarSyncLogBase):
@@ -892,7 +827,7 @@ class CalendarSyncLogCreate(CalendarSyncLogBase):
 class CalendarSyncLogUpdate(BaseModel):
     """Schema for updating a CalendarSyncLog."""
 
-    status: Literal["started", "success", "failed", "partial"]
+    status: SyncStatus
     events_created: Optional[int] = Field(None, ge=0)
     events_updated: Optional[int] = Field(None, ge=0)
     events_deleted: Optional[int] = Field(None, ge=0)
@@ -903,7 +838,7 @@ class CalendarSyncLogUpdate(BaseModel):
     duration_seconds: Optional[float] = Field(None, ge=0)
 
 
-class CalendarSyncLogResponse(CalendarSyncLogBase):
+class CalendarSyncLogResponse(CalendarSyncLogBase, ORMResponse):
     """Schema for CalendarSyncLog response."""
 
     id: int
@@ -920,17 +855,13 @@ class CalendarSyncLogResponse(CalendarSyncLogBase):
     duration_seconds: Optional[float] = None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class CalendarConflictBase(BaseModel):
     """Base schema for CalendarConflict."""
 
     conflict_type: Literal["both_modified", "time_conflict", "duplicate", "deletion_conflict"]
-    resolution_strategy: Literal[
-        "last_modified_wins", "manual", "charlee_wins", "external_wins", "merge"
-    ] = "last_modified_wins"
-    status: Literal["detected", "resolved", "manual_review"] = "detected"
+    resolution_strategy: ConflictResolution = "last_modified_wins"
+    status: ConflictStatus = "detected"
 
 
 class CalendarConflictCreate(CalendarConflictBase):
@@ -944,17 +875,15 @@ class CalendarConflictCreate(CalendarConflictBase):
 class CalendarConflictUpdate(BaseModel):
     """Schema for updating a CalendarConflict."""
 
-    resolution_strategy: Optional[
-        Literal["last_modified_wins", "manual", "charlee_wins", "external_wins", "merge"]
-    ] = None
-    status: Optional[Literal["detected", "resolved", "manual_review"]] = None
+    resolution_strategy: Optional[ConflictResolution] = None
+    status: Optional[ConflictStatus] = None
     resolved_version: Optional[dict] = None
     resolved_at: Optional[datetime] = None
     resolved_by: Optional[str] = Field(None, max_length=50)
     notes: Optional[str] = None
 
 
-class CalendarConflictResponse(CalendarConflictBase):
+class CalendarConflictResponse(CalendarConflictBase, ORMResponse):
     """Schema for CalendarConflict response."""
 
     id: int
@@ -969,8 +898,6 @@ class CalendarConflictResponse(CalendarConflictBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ==================== Calendar Integration List Responses ====================
 
@@ -1003,6 +930,12 @@ class CalendarConflictListResponse(BaseModel):
     conflicts: list[CalendarConflictResponse]
 
 
+class CalendarConflictSummaryResponse(BaseModel):
+    """Schema for a user's unresolved conflict count."""
+
+    unresolved: int
+
+
 # ==================== Calendar OAuth Schemas ====================
 
 
@@ -1031,13 +964,13 @@ class CalendarSyncRequest(BaseModel):
     """Schema for manual calendar sync request."""
 
     connection_id: int = Field(..., gt=0)
-    direction: Optional[Literal["to_calendar", "from_calendar", "both"]] = "both"
+    direction: Optional[SyncDirection] = "both"
 
 
 class CalendarSyncDirection(BaseModel):
     """Schema for sync direction only (when connection_id is in path)."""
 
-    direction: Optional[Literal["to_calendar", "from_calendar", "both"]] = "both"
+    direction: Optional[SyncDirection] = "both"
 
 
 # ==================== Attachment Schemas ====================
@@ -1050,7 +983,7 @@ class AttachmentBase(BaseModel):
     file_type: str  # 'audio' | 'image'
 
 
-class AttachmentResponse(AttachmentBase):
+class AttachmentResponse(AttachmentBase, ORMResponse):
     """Schema for Attachment response."""
 
     id: int
@@ -1060,8 +993,6 @@ class AttachmentResponse(AttachmentBase):
     file_metadata: Optional[dict] = None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class AttachmentListResponse(BaseModel):
     """Schema for list of attachments."""
@@ -1093,32 +1024,10 @@ class NotificationBase(BaseModel):
         "trello",
         "notion",
     ]
-    title: str = Field(..., min_length=1, max_length=200)
-    message: str = Field(..., min_length=1)
+    title: Annotated[MediumName, _required_text("Title", 200, False)]
+    message: Annotated[NonEmptyText, _required_text("Message", 2000, True)]
     extra_data: Optional[dict] = None
 
-    @field_validator("title")
-    @classmethod
-    def sanitize_title(cls, v: str) -> str:
-        """Sanitize title to prevent XSS."""
-        if not v:
-            raise ValueError("Title cannot be empty")
-        sanitized = sanitize_string(v, max_length=200, allow_newlines=False)
-        if not sanitized.strip():
-            raise ValueError("Title cannot be empty after sanitization")
-        return sanitized
-
-    @field_validator("message")
-    @classmethod
-    def sanitize_message(cls, v: str) -> str:
-        """Sanitize message to prevent XSS."""
-        if not v:
-            raise ValueError("Message cannot be empty")
-        sanitized = sanitize_string(v, max_length=2000, allow_newlines=True)
-        if not sanitized.strip():
-            raise ValueError("Message cannot be empty after sanitization")
-        return sanitized
-
 
 class NotificationCreate(NotificationBase):
     """Schema for creating a Notification."""
@@ -1132,7 +1041,7 @@ class NotificationUpdate(BaseModel):
     read: Optional[bool] = None
 
 
-class NotificationResponse(NotificationBase):
+class NotificationResponse(NotificationBase, ORMResponse):
     """Schema for Notification response."""
 
     id: int
@@ -1141,8 +1050,6 @@ class NotificationResponse(NotificationBase):
     created_at: datetime
     read_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class NotificationListResponse(BaseModel):
     """Schema for list of notifications."""
@@ -1187,7 +1094,7 @@ class NotificationPreferenceUpdate(BaseModel):
     settings: Optional[dict] = None
 
 
-class NotificationPreferenceResponse(NotificationPreferenceBase):
+class NotificationPreferenceResponse(NotificationPreferenceBase, ORMResponse):
     """Schema for NotificationPreference response."""
 
     id: int
@@ -1195,8 +1102,6 @@ class NotificationPreferenceResponse(NotificationPreferenceBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class NotificationPreferenceListResponse(BaseModel):
     """Schema for list of notification preferences."""
@@ -1222,7 +1127,7 @@ class NotificationSourceBase(BaseModel):
         "trello",
         "notion",
     ]
-    name: str = Field(..., min_length=1, max_length=100)
+    name: ShortName
     credentials: Optional[dict] = None
     settings: Optional[dict] = None
     enabled: bool = True
@@ -1238,14 +1143,14 @@ class NotificationSourceCreate(NotificationSourceBase):
 class NotificationSourceUpdate(BaseModel):
     """Schema for updating a NotificationSource."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[ShortName] = None
     credentials: Optional[dict] = None
     settings: Optional[dict] = None
     enabled: Optional[bool] = None
     sync_frequency_minutes: Optional[int] = Field(None, ge=1, le=1440)
 
 
-class NotificationSourceResponse(NotificationSourceBase):
+class NotificationSourceResponse(NotificationSourceBase, ORMResponse):
     """Schema for NotificationSource response."""
 
     id: int
@@ -1257,8 +1162,6 @@ class NotificationSourceResponse(NotificationSourceBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class NotificationSourceListResponse(BaseModel):
     """Schema for list of notification sources."""
@@ -1270,7 +1173,7 @@ class NotificationSourceListResponse(BaseModel):
 class NotificationRuleBase(BaseModel):
     """Base schema for NotificationRule."""
 
-    name: str = Field(..., min_length=1, max_length=100)
+    name: ShortName
     description: Optional[str] = None
     enabled: bool = True
     priority: int = Field(default=0, ge=0, le=100)
@@ -1287,7 +1190,7 @@ class NotificationRuleCreate(NotificationRuleBase):
 class NotificationRuleUpdate(BaseModel):
     """Schema for updating a NotificationRule."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[ShortName] = None
     description: Optional[str] = None
     enabled: Optional[bool] = None
     priority: Optional[int] = Field(None, ge=0, le=100)
@@ -1295,7 +1198,7 @@ class NotificationRuleUpdate(BaseModel):
     actions: Optional[list[dict]] = None
 
 
-class NotificationRuleResponse(NotificationRuleBase):
+class NotificationRuleResponse(NotificationRuleBase, ORMResponse):
     """Schema for NotificationRule response."""
 
     id: int
@@ -1305,8 +1208,6 @@ class NotificationRuleResponse(NotificationRuleBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class NotificationRuleListResponse(BaseModel):
     """Schema for list of notification rules."""
@@ -1332,7 +1233,7 @@ class NotificationDigestBase(BaseModel):
     highlights: Optional[list[dict]] = None
 
 
-class NotificationDigestResponse(NotificationDigestBase):
+class NotificationDigestResponse(NotificationDigestBase, ORMResponse):
     """Schema for NotificationDigest response."""
 
     id: int
@@ -1341,8 +1242,6 @@ class NotificationDigestResponse(NotificationDigestBase):
     sent_at: Optional[datetime] = None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class NotificationDigestListResponse(BaseModel):
     """Schema for list of notification digests."""
@@ -1367,7 +1266,7 @@ class NotificationPatternBase(BaseModel):
     last_occurrence: datetime
 
 
-class NotificationPatternResponse(NotificationPatternBase):
+class NotificationPatternResponse(NotificationPatternBase, ORMResponse):
     """Schema for NotificationPattern responses."""
 
     id: int
@@ -1375,8 +1274,6 @@ class NotificationPatternResponse(NotificationPatternBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class NotificationPatternListResponse(BaseModel):
     """Schema for list of notification patterns."""
@@ -1413,7 +1310,7 @@ class FocusSessionUpdate(BaseModel):
     custom_rules: Optional[dict] = None
 
 
-class FocusSessionResponse(FocusSessionBase):
+class FocusSessionResponse(FocusSessionBase, ORMResponse):
     """Schema for FocusSession response."""
 
     id: int
@@ -1422,8 +1319,6 @@ class FocusSessionResponse(FocusSessionBase):
     notifications_allowed: int
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class FocusSessionListResponse(BaseModel):
     """Schema for list of focus sessions."""
@@ -1435,10 +1330,10 @@ class FocusSessionListResponse(BaseModel):
 class ResponseTemplateBase(BaseModel):
     """Base schema for ResponseTemplate."""
 
-    name: str = Field(..., min_length=1, max_length=100)
+    name: ShortName
     description: Optional[str] = None
     category: Optional[str] = Field(None, max_length=50)
-    template_text: str = Field(..., min_length=1)
+    template_text: NonEmptyText
     variables: Optional[dict] = None
 
 
@@ -1451,14 +1346,14 @@ class ResponseTemplateCreate(ResponseTemplateBase):
 class ResponseTemplateUpdate(BaseModel):
     """Schema for updating a ResponseTemplate."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[ShortName] = None
     description: Optional[str] = None
     category: Optional[str] = Field(None, max_length=50)
-    template_text: Optional[str] = Field(None, min_length=1)
+    template_text: Optional[NonEmptyText] = None
     variables: Optional[dict] = None
 
 
-class ResponseTemplateResponse(ResponseTemplateBase):
+class ResponseTemplateResponse(ResponseTemplateBase, ORMResponse):
     """Schema for ResponseTemplate response."""
 
     id: int
@@ -1470,8 +1365,6 @@ class ResponseTemplateResponse(ResponseTemplateBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class ResponseTemplateListResponse(BaseModel):
     """Schema for list of response templates."""
@@ -0,0 +1,212 @@
+"""Pydantic schemas for the freelance system: projects, work logs and invoices.
+
+Loaded on first access through ``database.schemas``; import names from there.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, Literal, Optional
+
+from pydantic.fields import Field
+from pydantic.functional_serializers import PlainSerializer
+from pydantic.functional_validators import field_validator
+from pydantic.main import BaseModel
+from pydantic.types import StringConstraints
+
+from database.schemas import (
+    MediumName,
+    NonEmptyText,
+    ORMResponse,
+    RequiredDescription,
+    SanitizedText,
+    _required_text,
+)
+
+FreelanceProjectStatus = Literal["proposal", "active", "completed", "cancelled"]
+InvoiceStatus = Literal["draft", "sent", "paid", "overdue", "cancelled"]
+
+# Hours, rates and amounts match the NUMERIC columns exactly; JSON still carries numbers
+DecimalNumber = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+
+def _split_tags(v):
+    if isinstance(v, str):
+        return [tag.strip() for tag in v.split(",") if tag.strip()]
+    return v
+
+
+class FreelanceProjectBase(BaseModel):
+    """Base schema for FreelanceProject."""
+
+    client_name: Annotated[MediumName, _required_text("Field", 200, False)]
+    project_name: Annotated[MediumName, _required_text("Field", 200, False)]
+    description: Optional[SanitizedText] = None
+    hourly_rate: DecimalNumber = Field(..., gt=0, max_digits=8, decimal_places=2)
+    estimated_hours: DecimalNumber = Field(..., gt=0, max_digits=8, decimal_places=2)
+    start_date: Optional[date] = None
+    deadline: Optional[date] = None
+    notes: Optional[SanitizedText] = None
+    tags: Optional[list[str]] = None
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, v):
+        """Accept tags as a list or a comma-separated string."""
+        return _split_tags(v)
+
+
+class FreelanceProjectCreate(FreelanceProjectBase):
+    """Schema for creating a FreelanceProject."""
+
+    pass
+
+
+class FreelanceProjectUpdate(BaseModel):
+    """Schema for updating a FreelanceProject."""
+
+    client_name: Optional[MediumName] = None
+    project_name: Optional[MediumName] = None
+    description: Optional[str] = None
+    hourly_rate: Optional[DecimalNumber] = Field(None, gt=0, max_digits=8, decimal_places=2)
+    estimated_hours: Optional[DecimalNumber] = Field(None, gt=0, max_digits=8, decimal_places=2)
+    start_date: Optional[date] = None
+    deadline: Optional[date] = None
+    status: Optional[FreelanceProjectStatus] = None
+    notes: Optional[str] = None
+    tags: Optional[list[str]] = None
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, v):
+        """Accept tags as a list or a comma-separated string."""
+        return _split_tags(v)
+
+
+class FreelanceProjectResponse(FreelanceProjectBase, ORMResponse):
+    """Schema for FreelanceProject response."""
+
+    id: int
+    status: str
+    actual_hours: DecimalNumber = Field(..., ge=0, max_digits=8, decimal_places=2)
+    completed_date: Optional[date] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class WorkLogBase(BaseModel):
+    """Base schema for WorkLog."""
+
+    project_id: int = Field(..., gt=0)
+    hours: DecimalNumber = Field(..., gt=0, max_digits=8, decimal_places=2)
+    description: RequiredDescription
+    work_date: Optional[date] = None
+    task_type: Optional[str] = Field(None, max_length=50)
+    billable: bool = True
+
+
+class WorkLogCreate(WorkLogBase):
+    """Schema for creating a WorkLog."""
+
+    pass
+
+
+class WorkLogUpdate(BaseModel):
+    """Schema for updating a WorkLog."""
+
+    hours: Optional[DecimalNumber] = Field(None, gt=0, max_digits=8, decimal_places=2)
+    description: Optional[NonEmptyText] = None
+    work_date: Optional[date] = None
+    task_type: Optional[str] = Field(None, max_length=50)
+    billable: Optional[bool] = None
+
+
+class WorkLogResponse(WorkLogBase, ORMResponse):
+    """Schema for WorkLog response."""
+
+    id: int
+    user_id: int
+    invoiced: bool
+    invoice_id: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class InvoiceBase(BaseModel):
+    """Base schema for Invoice."""
+
+    project_id: int = Field(..., gt=0)
+    invoice_number: Annotated[
+        str,
+        StringConstraints(min_length=1, max_length=50),
+        _required_text("Invoice number", 50, False),
+    ]
+    issue_date: date
+    due_date: Optional[date] = None
+    payment_terms: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class InvoiceCreate(BaseModel):
+    """Schema for creating an Invoice."""
+
+    project_id: int = Field(..., gt=0)
+    invoice_number: Optional[str] = None  # Auto-generated if not provided
+    payment_terms: Optional[str] = Field(None, max_length=200)
+    notes: Optional[str] = None
+    include_unbilled_only: bool = True
+
+
+class InvoiceUpdate(BaseModel):
+    """Schema for updating an Invoice."""
+
+    status: Optional[InvoiceStatus] = None
+    due_date: Optional[date] = None
+    paid_date: Optional[date] = None
+    payment_method: Optional[str] = Field(None, max_length=50)
+    notes: Optional[str] = None
+
+
+class InvoiceResponse(InvoiceBase, ORMResponse):
+    """Schema for Invoice response."""
+
+    id: int
+    user_id: int
+    total_amount: DecimalNumber = Field(..., ge=0, max_digits=12, decimal_places=2)
+    total_hours: DecimalNumber = Field(..., ge=0, max_digits=8, decimal_places=2)
+    hourly_rate: DecimalNumber = Field(..., gt=0, max_digits=8, decimal_places=2)
+    status: str
+    paid_date: Optional[date] = None
+    payment_method: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class FreelanceHoursSummaryResponse(BaseModel):
+    """Schema for the user's hour and value totals across freelance projects."""
+
+    total_hours: DecimalNumber
+    total_value: DecimalNumber
+
+
+# ==================== Freelance List Responses ====================
+
+
+class FreelanceProjectListResponse(BaseModel):
+    """Schema for list of freelance projects."""
+
+    total: int
+    projects: list[FreelanceProjectResponse]
+
+
+class WorkLogListResponse(BaseModel):
+    """Schema for list of work logs."""
+
+    total: int
+    work_logs: list[WorkLogResponse]
+
+
+class InvoiceListResponse(BaseModel):
+    """Schema for list of invoices."""
+
+    total: int
+    invoices: list[InvoiceResponse]
@@ -11,7 +11,7 @@ Usage:
 
 import sys
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, text, update
 from sqlalchemy.orm import sessionmaker
 
 from api.auth.password import hash_password
@@ -21,7 +21,8 @@ from database.models import BigRock, DailyLog, MenstrualCycle, Task, User
 
 def create_default_user(db):
     """Create a default user if none exists."""
-    existing_user = db.query(User).first()
+    # Callers only read id, username and email; skip loading the rest of the row
+    existing_user = db.query(User.id, User.username, User.email).first()
 
     if existing_user:
         print(f"✓ User already exists: {existing_user.username}")
@@ -51,43 +52,28 @@ def create_default_user(db):
 
 def migrate_existing_data(db, user):
     """Migrate existing data to the default user."""
-    # Count existing data
-    big_rocks_count = db.query(BigRock).filter(BigRock.user_id is None).count()
-    tasks_count = db.query(Task).filter(Task.user_id is None).count()
-    cycles_count = db.query(MenstrualCycle).filter(MenstrualCycle.user_id is None).count()
-    logs_count = db.query(DailyLog).filter(DailyLog.user_id is None).count()
+    # One UPDATE per table; rowcount replaces a separate COUNT query
+    migrated = {
+        label: db.execute(
+            update(model).where(model.user_id.is_(None)).values(user_id=user.id)
+        ).rowcount
+        for label, model in (
+            ("Big Rocks", BigRock),
+            ("Tasks", Task),
+            ("Menstrual Cycles", MenstrualCycle),
+            ("Daily Logs", DailyLog),
+        )
+    }
+    db.commit()
 
-    if big_rocks_count == 0 and tasks_count == 0 and cycles_count == 0 and logs_count == 0:
+    if not any(migrated.values()):
         print("\n✓ No existing data to migrate")
         return
 
-    print(f"\n📦 Migrating existing data to user '{user.username}':")
-    print(f"  - Big Rocks: {big_rocks_count}")
-    print(f"  - Tasks: {tasks_count}")
-    print(f"  - Menstrual Cycles: {cycles_count}")
-    print(f"  - Daily Logs: {logs_count}")
-
-    # Migrate Big Rocks
-    db.query(BigRock).filter(BigRock.user_id is None).update(
-        {BigRock.user_id: user.id}, synchronize_session=False
-    )
-
-    # Migrate Tasks
-    db.query(Task).filter(Task.user_id is None).update(
-        {Task.user_id: user.id}, synchronize_session=False
-    )
+    print(f"\n📦 Migrated existing data to user '{user.username}':")
+    for label, count in migrated.items():
+        print(f"  - {label}: {count}")
 
-    # Migrate Menstrual Cycles
-    db.query(MenstrualCycle).filter(MenstrualCycle.user_id is None).update(
-        {MenstrualCycle.user_id: user.id}, synchronize_session=False
-    )
-
-    # Migrate Daily Logs
-    db.query(DailyLog).filter(DailyLog.user_id is None).update(
-        {DailyLog.user_id: user.id}, synchronize_session=False
-    )
-
-    db.commit()
     print("\n✓ Data migration completed successfully")
 
 
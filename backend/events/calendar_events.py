@@ -4,8 +4,9 @@ Publishes calendar-related events to the Event Bus for system-wide notifications
 and integrations with other modules like Task Manager and Capacity Guardian.
 """
 
+import asyncio
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
@@ -15,6 +16,74 @@ from integration.event_types import EventType, ModuleName
 
 logger = logging.getLogger(__name__)
 
+# Queued events are saved in batches of up to this many...
+QUEUE_BATCH_SIZE = 500
+# ...collected for at most this long after the first one arrives
+QUEUE_BATCH_WINDOW_SECONDS = 0.05
+
+
+def _sync_completed_event(connection_id: int, stats: dict[str, Any]) -> Event:
+    return Event(
+        tipo=EventType.CALENDAR_SYNCED,
+        modulo_origem=ModuleName.CALENDAR,
+        payload={
+            "connection_id": connection_id,
+            "events_created": stats.get("events_created", 0),
+            "events_updated": stats.get("events_updated", 0),
+            "events_deleted": stats.get("events_deleted", 0),
+            "conflicts_detected": stats.get("conflicts_detected", 0),
+        },
+        prioridade=5,
+    )
+
+
+def _calendar_event_event(
+    event_type: EventType, calendar_event: CalendarEvent, prioridade: int
+) -> Event:
+    return Event(
+        tipo=event_type,
+        modulo_origem=ModuleName.CALENDAR,
+        payload={
+            "event_id": calendar_event.id,
+            "connection_id": calendar_event.connection_id,
+            "user_id": calendar_event.user_id,
+            "task_id": calendar_event.task_id,
+            "title": calendar_event.title,
+            "start_time": calendar_event.start_time.isoformat(),
+            "end_time": calendar_event.end_time.isoformat(),
+            "source": calendar_event.source,
+        },
+        prioridade=prioridade,
+    )
+
+
+def _event_deleted_event(event_id: int, user_id: int, title: str) -> Event:
+    return Event(
+        tipo=EventType.CALENDAR_EVENT_DELETED,
+        modulo_origem=ModuleName.CALENDAR,
+        payload={
+            "event_id": event_id,
+            "user_id": user_id,
+            "title": title,
+        },
+        prioridade=5,
+    )
+
+
+def _conflict_detected_event(conflict: CalendarConflict) -> Event:
+    return Event(
+        tipo=EventType.CALENDAR_CONFLICT_DETECTED,
+        modulo_origem=ModuleName.CALENDAR,
+        payload={
+            "conflict_id": conflict.id,
+            "event_id": conflict.event_id,
+            "user_id": conflict.user_id,
+            "conflict_type": conflict.conflict_type,
+            "resolution_strategy": conflict.resolution_strategy,
+        },
+        prioridade=8,  # High priority for conflicts
+    )
+
 
 class CalendarEventPublisher:
     """Publishes calendar events to the Event Bus."""
@@ -29,6 +98,8 @@ class CalendarEventPublisher:
         """
         self.db = db_session
         self.event_bus = event_bus or EventBus(db_session)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
 
     async def publish_connection_created(self, connection: CalendarConnection) -> int:
         """
@@ -56,10 +127,11 @@ class CalendarEventPublisher:
         )
 
         event_id = await self.event_bus.publish(event)
-        logger.info(
-            "Published CALENDAR_CONNECTED event",
-            extra={"connection_id": connection.id, "provider": connection.provider},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published CALENDAR_CONNECTED event",
+                extra={"connection_id": connection.id, "provider": connection.provider},
+            )
         return event_id
 
     async def publish_connection_deleted(
@@ -88,10 +160,11 @@ class CalendarEventPublisher:
         )
 
         event_id = await self.event_bus.publish(event)
-        logger.info(
-            "Published CALENDAR_DISCONNECTED event",
-            extra={"connection_id": connection_id, "provider": provider},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published CALENDAR_DISCONNECTED event",
+                extra={"connection_id": connection_id, "provider": provider},
+            )
         return event_id
 
     async def publish_sync_completed(self, connection_id: int, stats: dict[str, Any]) -> int:
@@ -105,26 +178,127 @@ class CalendarEventPublisher:
         Returns:
             Event ID from database
         """
-        event = Event(
-            tipo=EventType.CALENDAR_SYNCED,
-            modulo_origem=ModuleName.CALENDAR,
-            payload={
-                "connection_id": connection_id,
-                "events_created": stats.get("events_created", 0),
-                "events_updated": stats.get("events_updated", 0),
-                "events_deleted": stats.get("events_deleted", 0),
-                "conflicts_detected": stats.get("conflicts_detected", 0),
-            },
-            prioridade=5,
-        )
+        event = _sync_completed_event(connection_id, stats)
 
         event_id = await self.event_bus.publish(event)
-        logger.info(
-            "Published CALENDAR_SYNCED event",
-            extra={"connection_id": connection_id, "stats": stats},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published CALENDAR_SYNCED event",
+                extra={"connection_id": connection_id, "stats": stats},
+            )
         return event_id
 
+    def queue_sync_completed(self, connection_id: int, stats: dict[str, Any]) -> None:
+        """
+        Queue CALENDAR_SYNCED without waiting for it to be saved.
+
+        Queued events are saved together by a background task, in batches of up
+        to QUEUE_BATCH_SIZE collected over QUEUE_BATCH_WINDOW_SECONDS. Use
+        publish_sync_completed when the event ID is needed, and flush() to wait
+        for queued events.
+
+        Args:
+            connection_id: Calendar connection ID
+            stats: Sync statistics
+        """
+        self._queue.put_nowait(_sync_completed_event(connection_id, stats))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain_queue())
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been published."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Publish the remaining queued events and stop the background task."""
+        await self.flush()
+        if self._drain_task:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+    async def _drain_queue(self) -> None:
+        """Publish queued events in batches, one publish_many per batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + QUEUE_BATCH_WINDOW_SECONDS
+            while len(batch) < QUEUE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.event_bus.publish_many(batch)
+            except Exception as e:
+                logger.error(f"Failed to publish {len(batch)} queued calendar events: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def publish_sync_results(
+        self,
+        connection_id: int,
+        created: Sequence[CalendarEvent] = (),
+        updated: Sequence[CalendarEvent] = (),
+        deleted: Sequence[CalendarEvent] = (),
+        conflicts: Sequence[CalendarConflict] = (),
+    ) -> list[int]:
+        """
+        Publish everything a sync produced as one batch.
+
+        Emits the same events as the individual publish_* methods, one per
+        created, updated and deleted calendar event and per detected conflict,
+        followed by CALENDAR_SYNCED, all saved with a single commit.
+
+        Args:
+            connection_id: Calendar connection ID
+            created: Calendar events created by the sync
+            updated: Calendar events updated by the sync
+            deleted: Calendar events removed by the sync
+            conflicts: Conflicts detected by the sync
+
+        Returns:
+            Event IDs from database, in publish order
+        """
+        events = [
+            *(
+                _calendar_event_event(EventType.CALENDAR_EVENT_CREATED, calendar_event, 6)
+                for calendar_event in created
+            ),
+            *(
+                _calendar_event_event(EventType.CALENDAR_EVENT_UPDATED, calendar_event, 5)
+                for calendar_event in updated
+            ),
+            *(
+                _event_deleted_event(deleted_event.id, deleted_event.user_id, deleted_event.title)
+                for deleted_event in deleted
+            ),
+            *(_conflict_detected_event(conflict) for conflict in conflicts),
+        ]
+        stats = {
+            "events_created": len(created),
+            "events_updated": len(updated),
+            "events_deleted": len(deleted),
+            "conflicts_detected": len(conflicts),
+        }
+        events.append(_sync_completed_event(connection_id, stats))
+
+        event_ids = await self.event_bus.publish_many(events)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published calendar sync results",
+                extra={"connection_id": connection_id, "stats": stats},
+            )
+        return event_ids
+
     async def publish_sync_failed(self, connection_id: int, error_message: str) -> int:
         """
         Publish event when calendar sync fails.
@@ -163,27 +337,14 @@ class CalendarEventPublisher:
         Returns:
             Event ID from database
         """
-        event = Event(
-            tipo=EventType.CALENDAR_EVENT_CREATED,
-            modulo_origem=ModuleName.CALENDAR,
-            payload={
-                "event_id": calendar_event.id,
-                "connection_id": calendar_event.connection_id,
-                "user_id": calendar_event.user_id,
-                "task_id": calendar_event.task_id,
-                "title": calendar_event.title,
-                "start_time": calendar_event.start_time.isoformat(),
-                "end_time": calendar_event.end_time.isoformat(),
-                "source": calendar_event.source,
-            },
-            prioridade=6,
-        )
+        event = _calendar_event_event(EventType.CALENDAR_EVENT_CREATED, calendar_event, 6)
 
         event_id = await self.event_bus.publish(event)
-        logger.info(
-            "Published CALENDAR_EVENT_CREATED event",
-            extra={"event_id": calendar_event.id, "title": calendar_event.title},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published CALENDAR_EVENT_CREATED event",
+                extra={"event_id": calendar_event.id, "title": calendar_event.title},
+            )
         return event_id
 
     async def publish_event_updated(self, calendar_event: CalendarEvent) -> int:
@@ -196,27 +357,14 @@ class CalendarEventPublisher:
         Returns:
             Event ID from database
         """
-        event = Event(
-            tipo=EventType.CALENDAR_EVENT_UPDATED,
-            modulo_origem=ModuleName.CALENDAR,
-            payload={
-                "event_id": calendar_event.id,
-                "connection_id": calendar_event.connection_id,
-                "user_id": calendar_event.user_id,
-                "task_id": calendar_event.task_id,
-                "title": calendar_event.title,
-                "start_time": calendar_event.start_time.isoformat(),
-                "end_time": calendar_event.end_time.isoformat(),
-                "source": calendar_event.source,
-            },
-            prioridade=5,
-        )
+        event = _calendar_event_event(EventType.CALENDAR_EVENT_UPDATED, calendar_event, 5)
 
         event_id = await self.event_bus.publish(event)
-        logger.info(
-            "Published CALENDAR_EVENT_UPDATED event",
-            extra={"event_id": calendar_event.id, "title": calendar_event.title},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published CALENDAR_EVENT_UPDATED event",
+                extra={"event_id": calendar_event.id, "title": calendar_event.title},
+            )
         return event_id
 
     async def publish_event_deleted(self, event_id: int, user_id: int, title: str) -> int:
@@ -231,22 +379,14 @@ class CalendarEventPublisher:
         Returns:
             Event ID from database
         """
-        event = Event(
-            tipo=EventType.CALENDAR_EVENT_DELETED,
-            modulo_origem=ModuleName.CALENDAR,
-            payload={
-                "event_id": event_id,
-                "user_id": user_id,
-                "title": title,
-            },
-            prioridade=5,
-        )
+        event = _event_deleted_event(event_id, user_id, title)
 
         db_event_id = await self.event_bus.publish(event)
-        logger.info(
-            "Published CALENDAR_EVENT_DELETED event",
-            extra={"event_id": event_id, "title": title},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published CALENDAR_EVENT_DELETED event",
+                extra={"event_id": event_id, "title": title},
+            )
         return db_event_id
 
     async def publish_conflict_detected(self, conflict: CalendarConflict) -> int:
@@ -259,18 +399,7 @@ class CalendarEventPublisher:
         Returns:
             Event ID from database
         """
-        event = Event(
-            tipo=EventType.CALENDAR_CONFLICT_DETECTED,
-            modulo_origem=ModuleName.CALENDAR,
-            payload={
-                "conflict_id": conflict.id,
-                "event_id": conflict.event_id,
-                "user_id": conflict.user_id,
-                "conflict_type": conflict.conflict_type,
-                "resolution_strategy": conflict.resolution_strategy,
-            },
-            prioridade=8,  # High priority for conflicts
-        )
+        event = _conflict_detected_event(conflict)
 
         event_id = await self.event_bus.publish(event)
         logger.warning(
@@ -307,13 +436,14 @@ class CalendarEventPublisher:
         )
 
         event_id = await self.event_bus.publish(event)
-        logger.info(
-            "Published CALENDAR_CONFLICT_RESOLVED event",
-            extra={
-                "conflict_id": conflict.id,
-                "resolved_by": conflict.resolved_by,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Published CALENDAR_CONFLICT_RESOLVED event",
+                extra={
+                    "conflict_id": conflict.id,
+                    "resolved_by": conflict.resolved_by,
+                },
+            )
         return event_id
 
 
@@ -1,8 +1,11 @@
 """Integration for Capacity Guardian with other modules."""
 
 import logging
-from typing import List, Dict, Any
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from database.models import Task
@@ -12,6 +15,16 @@ from integration.context_manager import ContextManager
 
 logger = logging.getLogger(__name__)
 
+# Projected load (%) above which each next band applies
+_LOAD_THRESHOLDS = (75, 90, 100)
+# (recommendation, reason) per band, from safe to over capacity
+_LOAD_BANDS = (
+    ("accept", "Capacity within safe limits"),
+    ("accept_with_caution", "Capacity would be high"),
+    ("negotiate", "Capacity would be critical"),
+    ("reject", "Capacity would exceed 100%"),
+)
+
 
 class CapacityIntegration:
     """
@@ -84,30 +97,29 @@ class CapacityIntegration:
         Args:
             event: Task creation event
         """
-        context = self.context.get_context()
+        carga = self.context.get_workload()
 
         # If capacity is high, warn about new task
-        if context["carga_trabalho_percentual"] > 80:
+        if carga > 80:
             task_id = event.payload.get("task_id")
-            logger.warning(
-                f"⚠️ New task created (ID: {task_id}) while capacity is {context['carga_trabalho_percentual']:.0f}%"
-            )
+            logger.warning(f"⚠️ New task created (ID: {task_id}) while capacity is {carga:.0f}%")
 
-    def _suggest_task_postponements(self) -> List[Task]:
+    def _suggest_task_postponements(self) -> List[Tuple[int, str, date]]:
         """
         Suggest tasks that could be postponed.
 
+        Only the columns needed to present a suggestion are loaded; the
+        filters and ordering are served by ix_tasks_user_status_deadline.
+
         Returns:
-            List of tasks that could be postponed
+            (id, description, deadline) rows of tasks that could be postponed
         """
-        from datetime import datetime, timedelta
-
         # Get non-urgent tasks
         later_date = datetime.now() + timedelta(days=3)
 
-        tasks = (
-            self.db.query(Task)
-            .filter(
+        return self.db.execute(
+            select(Task.id, Task.description, Task.deadline)
+            .where(
                 Task.user_id == self.context.user_id,
                 Task.status == "pending",
                 Task.type != "fixed_appointment",
@@ -115,10 +127,7 @@ class CapacityIntegration:
             )
             .order_by(Task.deadline.desc())
             .limit(10)
-            .all()
-        )
-
-        return tasks
+        ).all()
 
     def check_capacity_before_accept(self, estimated_hours: float) -> Dict[str, Any]:
         """
@@ -139,19 +148,10 @@ class CapacityIntegration:
 
         new_load = current_load + impact
 
-        # Decision logic
-        if new_load > 100:
-            recommendation = "reject"
-            reason = f"Capacity would exceed 100% (current: {current_load:.0f}%, +{impact:.0f}% = {new_load:.0f}%)"
-        elif new_load > 90:
-            recommendation = "negotiate"
-            reason = f"Capacity would be critical (current: {current_load:.0f}%, +{impact:.0f}% = {new_load:.0f}%)"
-        elif new_load > 75:
-            recommendation = "accept_with_caution"
-            reason = f"Capacity would be high (current: {current_load:.0f}%, +{impact:.0f}% = {new_load:.0f}%)"
-        else:
-            recommendation = "accept"
-            reason = f"Capacity within safe limits (current: {current_load:.0f}%, +{impact:.0f}% = {new_load:.0f}%)"
+        # Decision logic: the number of thresholds strictly below new_load picks the band
+        band = bisect_left(_LOAD_THRESHOLDS, new_load)
+        recommendation, summary = _LOAD_BANDS[band]
+        reason = f"{summary} (current: {current_load:.0f}%, +{impact:.0f}% = {new_load:.0f}%)"
 
         return {
             "recommendation": recommendation,
@@ -159,17 +159,21 @@ class CapacityIntegration:
             "current_load": current_load,
             "estimated_impact": impact,
             "projected_load": new_load,
-            "wellness_consideration": self._get_wellness_consideration(),
+            "wellness_consideration": self._get_wellness_consideration(context),
         }
 
-    def _get_wellness_consideration(self) -> str:
+    def _get_wellness_consideration(self, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Get wellness consideration for capacity decisions.
 
+        Args:
+            context: Context already read by the caller (read from the manager if omitted)
+
         Returns:
             Wellness consideration message
         """
-        context = self.context.get_context()
+        if context is None:
+            context = self.context.get_context()
 
         if context["fase_ciclo"] == "menstrual" and context["energia_atual"] < 5:
             return "⚠️ Fase menstrual com baixa energia - seja mais seletiva"
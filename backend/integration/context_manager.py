@@ -256,22 +256,15 @@ class ContextManager:
         self.db.commit()
         self.db.refresh(self.current_context)
 
-        # Publish context update event
-        try:
-            import asyncio
-
-            asyncio.create_task(
-                self.event_bus.publish(
-                    Event(
-                        tipo=EventType.CONTEXT_UPDATED,
-                        modulo_origem=ModuleName.CONTEXT_MANAGER,
-                        payload=updates,
-                        prioridade=7,
-                    )
-                )
+        # Publish context update event with the bus's next batched write
+        self.event_bus.publish_nowait(
+            Event(
+                tipo=EventType.CONTEXT_UPDATED,
+                modulo_origem=ModuleName.CONTEXT_MANAGER,
+                payload=updates,
+                prioridade=7,
             )
-        except Exception as e:
-            logger.error(f"Failed to publish context update event: {e}")
+        )
 
         logger.debug(f"Context updated: {updates}")
 
@@ -301,6 +294,20 @@ class ContextManager:
             "atualizado_em": self.current_context.atualizado_em.isoformat(),
         }
 
+    def get_workload(self) -> float:
+        """
+        Get the current workload percentage.
+
+        Reads the one field instead of building the get_context() dictionary.
+
+        Returns:
+            Current workload percentage (carga_trabalho_percentual)
+        """
+        if not self.current_context:
+            self.current_context = self.load_context()
+
+        return self.current_context.carga_trabalho_percentual
+
     # ==================== Decision Helpers ====================
 
     def should_accept_interruption(self) -> bool:
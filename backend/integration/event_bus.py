@@ -1,12 +1,12 @@
 """Event Bus - Pub/Sub system for inter-module communication."""
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
 from redis import Redis
 from sqlalchemy.orm import Session
 
@@ -15,10 +15,17 @@ from integration.event_types import EventType, ModuleName
 
 logger = logging.getLogger(__name__)
 
+# Saved events claimed per transaction by process_events
+CLAIM_BATCH_SIZE = 100
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
-    """Event data structure for the Event Bus."""
+    """Event data structure for the Event Bus.
+
+    Slotted: publishers create one per notification, and no per-instance
+    __dict__ is needed for the five fixed fields.
+    """
 
     tipo: EventType
     modulo_origem: ModuleName
@@ -46,6 +53,26 @@ class Event:
         }
 
 
+def _event_from_row(row: SystemEvent) -> Event:
+    """Rebuild the Event handed to subscribers from its saved row."""
+    # Rows may carry free-form values published as plain strings
+    try:
+        tipo: Any = EventType(row.tipo)
+    except ValueError:
+        tipo = row.tipo
+    try:
+        modulo_origem: Any = ModuleName(row.modulo_origem)
+    except ValueError:
+        modulo_origem = row.modulo_origem
+    return Event(
+        tipo=tipo,
+        modulo_origem=modulo_origem,
+        payload=row.payload,
+        prioridade=row.prioridade,
+        timestamp=row.criado_em.isoformat() if row.criado_em else None,
+    )
+
+
 class EventBus:
     """
     Event Bus for inter-module communication.
@@ -64,10 +91,14 @@ class EventBus:
         """
         self.db = db_session
         self.redis = redis_client
-        self.subscribers: Dict[EventType, List[Callable]] = {}
+        # Handler tuples are replaced, not mutated, so dispatch iterates a fixed snapshot
+        self.subscribers: Dict[EventType, Tuple[Callable, ...]] = {}
         self.event_queue: asyncio.Queue = asyncio.Queue()
         self._processing_task: Optional[asyncio.Task] = None
         self._is_running = False
+        # Events waiting for the next batched write, with the ID future of their publish() call
+        self._pending: List[Tuple[Event, Optional[asyncio.Future]]] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     def subscribe(self, event_type: EventType, handler: Callable) -> None:
         """
@@ -77,10 +108,7 @@ class EventBus:
             event_type: Type of event to subscribe to
             handler: Callback function to handle the event
         """
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-
-        self.subscribers[event_type].append(handler)
+        self.subscribers[event_type] = (*self.subscribers.get(event_type, ()), handler)
         logger.info(f"📡 {handler.__name__} subscribed to {event_type.value}")
 
     def unsubscribe(self, event_type: EventType, handler: Callable) -> None:
@@ -91,39 +119,115 @@ class EventBus:
             event_type: Type of event to unsubscribe from
             handler: Handler to remove
         """
-        if event_type in self.subscribers and handler in self.subscribers[event_type]:
-            self.subscribers[event_type].remove(handler)
+        handlers = self.subscribers.get(event_type, ())
+        if handler in handlers:
+            index = handlers.index(handler)
+            self.subscribers[event_type] = handlers[:index] + handlers[index + 1 :]
             logger.info(f"📡 {handler.__name__} unsubscribed from {event_type.value}")
 
     async def publish(self, event: Event) -> int:
         """
         Publish an event to the bus.
 
+        Events published during the same event loop iteration, such as from
+        tasks created together or gathered publishes, are saved together by
+        one publish_many call.
+
         Args:
             event: Event to publish
 
         Returns:
             Event ID from database
         """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((event, future))
+        self._schedule_flush()
+        return await future
+
+    def publish_nowait(self, event: Event) -> None:
+        """
+        Queue an event for the next batched write without waiting for its ID.
+
+        For fire-and-forget notifications from synchronous code: no task or
+        coroutine is created per event. Outside a running event loop there is
+        no batch to join, so the event is saved right away.
+
+        Args:
+            event: Event to publish
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._publish_batch([event])
+            return
+        self._pending.append((event, None))
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            # Runs after the publishes already scheduled, so it sees all of them
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_pending())
+
+    async def _flush_pending(self) -> None:
+        """Save the events queued by publish() and resolve their ID futures."""
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                event_ids = await self.publish_many([event for event, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), event_id in zip(batch, event_ids):
+                    if future is not None and not future.done():
+                        future.set_result(event_id)
+
+    async def publish_many(self, events: List[Event]) -> List[int]:
+        """
+        Publish a batch of events, saving them with one commit.
+
+        The rows go out through SystemEvent.bulk_publish (a batched INSERT ...
+        RETURNING, or COPY for large batches), instead of a commit and refresh
+        per event.
+
+        Args:
+            events: Events to publish, in order
+
+        Returns:
+            Event IDs from database, in the same order
+        """
+        return self._publish_batch(events)
+
+    def _publish_batch(self, events: List[Event]) -> List[int]:
+        """Save events with one commit, then hand them to Redis and the processing queue."""
+        if not events:
+            return []
+
         try:
             # Save to database
-            db_event = SystemEvent(
-                tipo=(event.tipo.value if isinstance(event.tipo, EventType) else event.tipo),
-                modulo_origem=(
-                    event.modulo_origem.value
-                    if isinstance(event.modulo_origem, ModuleName)
-                    else event.modulo_origem
-                ),
-                payload=event.payload,
-                prioridade=event.prioridade,
-            )
-
-            self.db.add(db_event)
+            rows = [
+                {
+                    "tipo": (event.tipo.value if isinstance(event.tipo, EventType) else event.tipo),
+                    "modulo_origem": (
+                        event.modulo_origem.value
+                        if isinstance(event.modulo_origem, ModuleName)
+                        else event.modulo_origem
+                    ),
+                    "payload": event.payload,
+                    "prioridade": event.prioridade,
+                }
+                for event in events
+            ]
+            event_ids = SystemEvent.bulk_publish(self.db, rows)
             self.db.commit()
-            self.db.refresh(db_event)
 
-            event_id = db_event.id
+        except Exception as e:
+            logger.error(f"Error publishing event: {e}")
+            self.db.rollback()
+            raise
 
+        for event, event_id in zip(events, event_ids):
             # Publish to Redis for real-time processing (if available)
             if self.redis:
                 try:
@@ -133,75 +237,69 @@ class EventBus:
                         "payload": event.payload,
                         "timestamp": event.timestamp,
                     }
-                    self.redis.publish(channel, json.dumps(message))
+                    # Same encoder as the payload column; Redis takes the bytes as-is
+                    self.redis.publish(channel, orjson.dumps(message))
                 except Exception as e:
                     logger.warning(f"Failed to publish to Redis: {e}")
 
-            # Add to processing queue
-            await self.event_queue.put(event)
-
-            logger.info(
-                f"📤 Event published: {event.tipo.value if isinstance(event.tipo, EventType) else event.tipo} "
-                f"from {event.modulo_origem.value if isinstance(event.modulo_origem, ModuleName) else event.modulo_origem} "
-                f"(ID: {event_id})"
-            )
+            # Add to processing queue (unbounded, so this never waits)
+            self.event_queue.put_nowait(event)
 
-            return event_id
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"📤 Event published: {event.tipo.value if isinstance(event.tipo, EventType) else event.tipo} "
+                    f"from {event.modulo_origem.value if isinstance(event.modulo_origem, ModuleName) else event.modulo_origem} "
+                    f"(ID: {event_id})"
+                )
 
-        except Exception as e:
-            logger.error(f"Error publishing event: {e}")
-            self.db.rollback()
-            raise
+        return event_ids
 
     async def process_events(self) -> None:
-        """Event processing loop - runs continuously to process queued events."""
+        """
+        Event processing loop - runs continuously to process saved events.
+
+        The in-memory queue only wakes the loop up. Events are claimed from
+        system_events in batches (SystemEvent.claim_batch) and marked processed
+        in the same transaction once their handlers have run, so a crash
+        mid-batch leaves them pending for the next claim. Claims use their own
+        session: handlers that publish commit self.db, which must not release
+        the claim's row locks.
+        """
         logger.info("🔄 Event Bus processing started")
         self._is_running = True
 
         while self._is_running:
-            try:
-                # Get event from queue
-                event = await self.event_queue.get()
-
-                # Get event type
-                event_type = (
-                    event.tipo if isinstance(event.tipo, EventType) else EventType(event.tipo)
-                )
-
-                # Notify subscribers
-                if event_type in self.subscribers:
-                    for handler in self.subscribers[event_type]:
-                        try:
-                            # Execute handler (async or sync)
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(event)
-                            else:
-                                handler(event)
-                        except Exception as e:
-                            logger.error(f"Error in event handler {handler.__name__}: {e}")
-
-                # Mark as processed in database
-                self.db.query(SystemEvent).filter(
-                    SystemEvent.tipo
-                    == (event.tipo.value if isinstance(event.tipo, EventType) else event.tipo),
-                    SystemEvent.modulo_origem
-                    == (
-                        event.modulo_origem.value
-                        if isinstance(event.modulo_origem, ModuleName)
-                        else event.modulo_origem
-                    ),
-                    SystemEvent.criado_em == event.timestamp,
-                    not SystemEvent.processado,
-                ).update({"processado": True, "processado_em": datetime.now(timezone.utc)})
-
-                self.db.commit()
-
-                # Mark task as done
-                self.event_queue.task_done()
+            # Wait for a publish, then take every wake-up queued so far
+            await self.event_queue.get()
+            woken = 1
+            while not self.event_queue.empty():
+                self.event_queue.get_nowait()
+                woken += 1
 
+            try:
+                with Session(self.db.get_bind()) as claims:
+                    while claimed := SystemEvent.claim_batch(claims, CLAIM_BATCH_SIZE):
+                        for row in claimed:
+                            await self._dispatch(_event_from_row(row))
+                        SystemEvent.mark_processed(claims, [row.id for row in claimed])
+                        claims.commit()
             except Exception as e:
                 logger.error(f"Error processing event: {e}")
-                self.db.rollback()
+            finally:
+                for _ in range(woken):
+                    self.event_queue.task_done()
+
+    async def _dispatch(self, event: Event) -> None:
+        """Run every subscriber of the event's type; handler errors are logged, not raised."""
+        for handler in self.subscribers.get(event.tipo, ()):
+            try:
+                # Execute handler (async or sync)
+                if asyncio.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    handler(event)
+            except Exception as e:
+                logger.error(f"Error in event handler {handler.__name__}: {e}")
 
     def start_processing(self) -> None:
         """Start the event processing loop."""
@@ -531,6 +531,7 @@ def sync_calendar_to_tasks(
 
             if existing_event:
                 # Update existing event
+                before = existing_event.to_snapshot()
                 existing_event.title = event.get("summary", "Untitled")
                 existing_event.description = event.get("description")
                 existing_event.start_time = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
@@ -538,8 +539,10 @@ def sync_calendar_to_tasks(
                 existing_event.all_day = all_day
                 existing_event.location = event.get("location")
                 existing_event.status = event.get("status", "confirmed")
-                existing_event.external_modified_at = datetime.now(timezone.utc)
-                existing_event.last_modified_at = datetime.now(timezone.utc)
+                # Only real changes count as external edits for conflict detection
+                if existing_event.to_snapshot() != before:
+                    existing_event.external_modified_at = datetime.now(timezone.utc)
+                    existing_event.last_modified_at = datetime.now(timezone.utc)
 
                 synced_events.append(existing_event)
             else:
@@ -580,6 +580,7 @@ async def sync_calendar_to_tasks(
 
                 if existing_event:
                     # Update existing event
+                    before = existing_event.to_snapshot()
                     existing_event.title = event.get("subject", "Untitled")
                     existing_event.description = event.get("body", {}).get("content")
                     existing_event.start_time = start_dt
@@ -587,8 +588,10 @@ async def sync_calendar_to_tasks(
                     existing_event.all_day = all_day
                     existing_event.location = event.get("location", {}).get("displayName")
                     existing_event.status = "confirmed"
-                    existing_event.external_modified_at = datetime.now(timezone.utc)
-                    existing_event.last_modified_at = datetime.now(timezone.utc)
+                    # Only real changes count as external edits for conflict detection
+                    if existing_event.to_snapshot() != before:
+                        existing_event.external_modified_at = datetime.now(timezone.utc)
+                        existing_event.last_modified_at = datetime.now(timezone.utc)
 
                     synced_events.append(existing_event)
                 else:
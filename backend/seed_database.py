@@ -8,7 +8,7 @@ O script detecta automaticamente se está usando SQLite ou PostgreSQL
 e ajusta as queries conforme necessário.
 """
 
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 
 from sqlalchemy.orm import Session
 
@@ -503,7 +503,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[0].id,
             start_date=today - timedelta(days=3),
             phase="menstrual",
-            symptoms="fadiga,dor_leve",
+            symptoms=["fadiga", "dor_leve"],
             energy_level=4,
             focus_level=5,
             creativity_level=6,
@@ -514,7 +514,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[0].id,
             start_date=today - timedelta(days=2),
             phase="menstrual",
-            symptoms="fadiga",
+            symptoms=["fadiga"],
             energy_level=5,
             focus_level=6,
             creativity_level=7,
@@ -525,7 +525,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[0].id,
             start_date=today - timedelta(days=31),
             phase="menstrual",
-            symptoms="fadiga,dor_moderada",
+            symptoms=["fadiga", "dor_moderada"],
             energy_level=3,
             focus_level=4,
             creativity_level=5,
@@ -535,7 +535,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[0].id,
             start_date=today - timedelta(days=27),
             phase="follicular",
-            symptoms="energia_alta",
+            symptoms=["energia_alta"],
             energy_level=8,
             focus_level=9,
             creativity_level=8,
@@ -546,7 +546,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[0].id,
             start_date=today - timedelta(days=17),
             phase="ovulation",
-            symptoms="criatividade_alta,energia_alta",
+            symptoms=["criatividade_alta", "energia_alta"],
             energy_level=9,
             focus_level=8,
             creativity_level=10,
@@ -557,7 +557,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[0].id,
             start_date=today - timedelta(days=10),
             phase="luteal",
-            symptoms="leve_fadiga",
+            symptoms=["leve_fadiga"],
             energy_level=6,
             focus_level=7,
             creativity_level=6,
@@ -568,7 +568,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[1].id,
             start_date=today - timedelta(days=5),
             phase="menstrual",
-            symptoms="fadiga,dor_moderada",
+            symptoms=["fadiga", "dor_moderada"],
             energy_level=3,
             focus_level=4,
             creativity_level=5,
@@ -579,7 +579,7 @@ def seed_menstrual_cycles(db: Session, users: list[User]):
             user_id=users[1].id,
             start_date=today - timedelta(days=20),
             phase="follicular",
-            symptoms="energia_alta,foco_intenso",
+            symptoms=["energia_alta", "foco_intenso"],
             energy_level=9,
             focus_level=9,
             creativity_level=8,
@@ -661,8 +661,8 @@ def seed_daily_logs(db: Session, users: list[User]):
         DailyLog(
             user_id=users[0].id,
             date=today - timedelta(days=6),
-            wake_time="07:00",
-            sleep_time="23:30",
+            wake_time=time(7, 0),
+            sleep_time=time(23, 30),
             sleep_hours=7.5,
             sleep_quality=8,
             morning_energy=7,
@@ -670,15 +670,15 @@ def seed_daily_logs(db: Session, users: list[User]):
             evening_energy=6,
             deep_work_hours=4.5,
             completed_tasks=8,
-            cycle_phase="folicular",
+            cycle_phase="follicular",
             free_notes="Dia produtivo",
             created_at=datetime.now(timezone.utc) - timedelta(days=6),
         ),
         DailyLog(
             user_id=users[0].id,
             date=today - timedelta(days=5),
-            wake_time="07:15",
-            sleep_time="00:00",
+            wake_time=time(7, 15),
+            sleep_time=time(0, 0),
             sleep_hours=7.25,
             sleep_quality=6,
             morning_energy=6,
@@ -686,15 +686,15 @@ def seed_daily_logs(db: Session, users: list[User]):
             evening_energy=5,
             deep_work_hours=3.0,
             completed_tasks=6,
-            cycle_phase="folicular",
+            cycle_phase="follicular",
             free_notes="Um pouco cansada",
             created_at=datetime.now(timezone.utc) - timedelta(days=5),
         ),
         DailyLog(
             user_id=users[0].id,
             date=today - timedelta(days=4),
-            wake_time="06:45",
-            sleep_time="23:00",
+            wake_time=time(6, 45),
+            sleep_time=time(23, 0),
             sleep_hours=7.75,
             sleep_quality=9,
             morning_energy=8,
@@ -702,15 +702,15 @@ def seed_daily_logs(db: Session, users: list[User]):
             evening_energy=8,
             deep_work_hours=5.5,
             completed_tasks=10,
-            cycle_phase="ovulatória",
+            cycle_phase="ovulation",
             free_notes="Melhor dia!",
             created_at=datetime.now(timezone.utc) - timedelta(days=4),
         ),
         DailyLog(
             user_id=users[0].id,
             date=today - timedelta(days=3),
-            wake_time="07:30",
-            sleep_time="00:30",
+            wake_time=time(7, 30),
+            sleep_time=time(0, 30),
             sleep_hours=7.0,
             sleep_quality=5,
             morning_energy=5,
@@ -719,15 +719,15 @@ def seed_daily_logs(db: Session, users: list[User]):
             deep_work_hours=2.0,
             completed_tasks=4,
             cycle_phase="menstrual",
-            special_events="Menstruação começou",
+            special_events=["Menstruação começou"],
             free_notes="Baixa energia",
             created_at=datetime.now(timezone.utc) - timedelta(days=3),
         ),
         DailyLog(
             user_id=users[0].id,
             date=today - timedelta(days=2),
-            wake_time="08:00",
-            sleep_time="00:00",
+            wake_time=time(8, 0),
+            sleep_time=time(0, 0),
             sleep_hours=8.0,
             sleep_quality=7,
             morning_energy=6,
@@ -742,8 +742,8 @@ def seed_daily_logs(db: Session, users: list[User]):
         DailyLog(
             user_id=users[0].id,
             date=today - timedelta(days=1),
-            wake_time="07:00",
-            sleep_time="23:30",
+            wake_time=time(7, 0),
+            sleep_time=time(23, 30),
             sleep_hours=7.5,
             sleep_quality=8,
             morning_energy=7,
@@ -751,20 +751,20 @@ def seed_daily_logs(db: Session, users: list[User]):
             evening_energy=7,
             deep_work_hours=4.0,
             completed_tasks=7,
-            cycle_phase="folicular",
+            cycle_phase="follicular",
             free_notes="Energia voltando",
             created_at=datetime.now(timezone.utc) - timedelta(days=1),
         ),
         DailyLog(
             user_id=users[0].id,
             date=today,
-            wake_time="07:15",
+            wake_time=time(7, 15),
             morning_energy=7,
             afternoon_energy=8,
             evening_energy=7,
             deep_work_hours=0.0,
             completed_tasks=0,
-            cycle_phase="folicular",
+            cycle_phase="follicular",
             free_notes="Dia começando bem",
             created_at=datetime.now(timezone.utc),
         ),
@@ -772,8 +772,8 @@ def seed_daily_logs(db: Session, users: list[User]):
         DailyLog(
             user_id=users[1].id,
             date=today - timedelta(days=2),
-            wake_time="06:30",
-            sleep_time="22:30",
+            wake_time=time(6, 30),
+            sleep_time=time(22, 30),
             sleep_hours=8.0,
             sleep_quality=9,
             morning_energy=8,
@@ -781,15 +781,15 @@ def seed_daily_logs(db: Session, users: list[User]):
             evening_energy=7,
             deep_work_hours=5.0,
             completed_tasks=9,
-            cycle_phase="lútea",
+            cycle_phase="luteal",
             free_notes="Ótimo dia",
             created_at=datetime.now(timezone.utc) - timedelta(days=2),
         ),
         DailyLog(
             user_id=users[1].id,
             date=today - timedelta(days=1),
-            wake_time="06:45",
-            sleep_time="23:00",
+            wake_time=time(6, 45),
+            sleep_time=time(23, 0),
             sleep_hours=7.75,
             sleep_quality=7,
             morning_energy=7,
@@ -797,20 +797,20 @@ def seed_daily_logs(db: Session, users: list[User]):
             evening_energy=6,
             deep_work_hours=4.0,
             completed_tasks=7,
-            cycle_phase="lútea",
+            cycle_phase="luteal",
             free_notes="Dia normal",
             created_at=datetime.now(timezone.utc) - timedelta(days=1),
         ),
         DailyLog(
             user_id=users[1].id,
             date=today,
-            wake_time="06:30",
+            wake_time=time(6, 30),
             morning_energy=8,
             afternoon_energy=8,
             evening_energy=7,
             deep_work_hours=0.0,
             completed_tasks=0,
-            cycle_phase="lútea",
+            cycle_phase="luteal",
             free_notes="Começando bem",
             created_at=datetime.now(timezone.utc),
         ),
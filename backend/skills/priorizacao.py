@@ -139,7 +139,7 @@ class SistemaPriorizacao:
 
     def priorizar_tarefas(
         self,
-        status: str = "Pendente",
+        status: str = "pending",
         big_rock_id: Optional[int] = None,
         limite: int = 20,
     ) -> List[Task]:
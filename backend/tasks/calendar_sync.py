@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 from typing import Optional, cast
 
 from celery import shared_task
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from database.config import SessionLocal
 from database.models import CalendarConnection, CalendarConflict, CalendarEvent, CalendarSyncLog
@@ -182,7 +182,7 @@ def sync_connection(self, connection_id: int, direction: str = "both") -> dict[s
                     .filter(
                         Task.user_id == connection.user_id,
                         Task.deadline.isnot(None),
-                        Task.status != "Concluída",
+                        Task.status != "completed",
                     )
                     .all()
                 )
@@ -289,63 +289,35 @@ def detect_conflicts(self, connection_id: int) -> int:
             logger.error("Connection not found", extra={"connection_id": connection_id})
             return 0
 
-        # Get events that might have conflicts
+        # Both sides modified since the last sync and no open conflict yet:
+        # evaluated in a single query instead of per-event Python checks
         events = (
             db.query(CalendarEvent)
+            .join(CalendarConnection, CalendarEvent.connection_id == CalendarConnection.id)
             .filter(
                 CalendarEvent.connection_id == connection_id,
-                CalendarEvent.charlee_modified_at.isnot(None),
-                CalendarEvent.external_modified_at.isnot(None),
+                CalendarEvent.charlee_modified_at > CalendarConnection.last_sync_at,
+                CalendarEvent.external_modified_at > CalendarConnection.last_sync_at,
+                CalendarEvent.unresolved_conflict_count == 0,
             )
             .all()
         )
 
-        conflicts_detected = 0
-
-        for event in events:
-            # Check if both sides were modified since last sync
-            if event.charlee_modified_at and event.external_modified_at:
-                # Compare modification times
-                charlee_time = event.charlee_modified_at
-                external_time = event.external_modified_at
-
-                # Ensure timezone aware
-                if charlee_time.tzinfo is None:
-                    charlee_time = charlee_time.replace(tzinfo=timezone.utc)
-                if external_time.tzinfo is None:
-                    external_time = external_time.replace(tzinfo=timezone.utc)
-
-                # If both modified after last sync, we have a conflict
-                if connection.last_sync_at:
-                    last_sync = connection.last_sync_at
-                    if last_sync.tzinfo is None:
-                        last_sync = last_sync.replace(tzinfo=timezone.utc)
-
-                    if charlee_time > last_sync and external_time > last_sync:
-                        # Check if conflict already exists
-                        existing_conflict = (
-                            db.query(CalendarConflict)
-                            .filter(
-                                CalendarConflict.event_id == event.id,
-                                CalendarConflict.status != "resolved",
-                            )
-                            .first()
-                        )
-
-                        if not existing_conflict:
-                            # Create conflict
-                            conflict = CalendarConflict(
-                                event_id=event.id,
-                                user_id=connection.user_id,
-                                conflict_type="both_modified",
-                                charlee_version=event.to_dict(),
-                                external_version=event.to_dict(),  # TODO: fetch from external
-                                resolution_strategy="last_modified_wins",
-                                status="detected",
-                            )
-
-                            db.add(conflict)
-                            conflicts_detected += 1
+        db.add_all(
+            [
+                CalendarConflict(
+                    event_id=event.id,
+                    user_id=connection.user_id,
+                    conflict_type="both_modified",
+                    charlee_version=event.to_dict(),
+                    external_version=event.to_dict(),  # TODO: fetch from external
+                    resolution_strategy="last_modified_wins",
+                    status="detected",
+                )
+                for event in events
+            ]
+        )
+        conflicts_detected = len(events)
 
         db.commit()
 
@@ -392,6 +364,7 @@ def resolve_conflicts(self, connection_id: int, strategy: Optional[str] = None)
         # Get unresolved conflicts
         conflicts = (
             db.query(CalendarConflict)
+            .options(undefer_group("payload"))
             .join(CalendarEvent)
             .filter(
                 CalendarEvent.connection_id == connection_id,
@@ -401,6 +374,10 @@ def resolve_conflicts(self, connection_id: int, strategy: Optional[str] = None)
         )
 
         resolved_count = 0
+        resolutions: dict[str, dict[int, dict]] = {
+            "system_charlee": {},
+            "system_external": {},
+        }
 
         for conflict in conflicts:
             try:
@@ -423,18 +400,15 @@ def resolve_conflicts(self, connection_id: int, strategy: Optional[str] = None)
                             resolved_version = conflict.external_version
                             resolved_by = "system_external"
 
-                        conflict.resolve(resolved_version, resolved_by)
-                        resolved_count += 1
+                        resolutions[resolved_by][conflict.id] = resolved_version
 
                 elif res_strategy == "charlee_wins":
                     # Always use Charlee version
-                    conflict.resolve(conflict.charlee_version, "system_charlee")
-                    resolved_count += 1
+                    resolutions["system_charlee"][conflict.id] = conflict.charlee_version
 
                 elif res_strategy == "external_wins":
                     # Always use external version
-                    conflict.resolve(conflict.external_version, "system_external")
-                    resolved_count += 1
+                    resolutions["system_external"][conflict.id] = conflict.external_version
 
                 elif res_strategy == "manual":
                     # Mark for manual review
@@ -454,6 +428,10 @@ def resolve_conflicts(self, connection_id: int, strategy: Optional[str] = None)
                     exc_info=True,
                 )
 
+        # One executemany UPDATE per resolver instead of a flush per conflict
+        for resolved_by, id_to_version in resolutions.items():
+            resolved_count += CalendarConflict.resolve_many(db, id_to_version, resolved_by)
+
         db.commit()
 
         logger.info(
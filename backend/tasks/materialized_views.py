@@ -0,0 +1,44 @@
+"""Celery tasks for refreshing materialized views.
+
+Reporting views are pre-aggregated on PostgreSQL and refreshed on a schedule,
+so analytics reads never aggregate the underlying tables per request.
+"""
+
+import logging
+
+from celery import shared_task
+from sqlalchemy.orm import Session
+
+from database.config import SessionLocal
+from database.models import ProjectHoursMV
+
+logger = logging.getLogger(__name__)
+
+
+def get_db() -> Session:
+    """Get database session for Celery tasks."""
+    return SessionLocal()
+
+
+@shared_task(name="maintenance.refresh_project_hours", bind=True)
+def refresh_project_hours(self) -> None:
+    """
+    Refresh mv_project_hours concurrently.
+
+    Runs every 15 minutes via Celery Beat; readers keep seeing the previous
+    snapshot until the refresh commits.
+    """
+    db = get_db()
+
+    try:
+        ProjectHoursMV.refresh(db)
+        db.commit()
+        logger.info("mv_project_hours refreshed")
+
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to refresh mv_project_hours", extra={"error": str(e)}, exc_info=True)
+        raise
+
+    finally:
+        db.close()
@@ -0,0 +1,85 @@
+"""Celery tasks for maintaining monthly table partitions.
+
+system_events and audit_logs are range-partitioned by month on PostgreSQL
+(see migration 028); partitions are created ahead of time so inserts rarely
+land in the catch-all default partition. If they do (e.g. the task stalled),
+create_monthly_partition() moves that month's rows out of the default.
+"""
+
+import logging
+from datetime import date, timedelta
+
+from celery import shared_task
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from database.config import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Partitioned tables maintained by create_monthly_partition()
+PARTITIONED_TABLES = ("system_events", "audit_logs")
+
+
+def get_db() -> Session:
+    """Get database session for Celery tasks."""
+    return SessionLocal()
+
+
+def _partitioned_tables(db: Session) -> list[str]:
+    """Return the PARTITIONED_TABLES that migration 028 has partitioned in this database."""
+    if db.execute(text("SELECT to_regproc('create_monthly_partition') IS NULL")).scalar_one():
+        return []
+    partitioned = set(
+        db.execute(text("SELECT partrelid::regclass::text FROM pg_partitioned_table")).scalars()
+    )
+    return [table for table in PARTITIONED_TABLES if table in partitioned]
+
+
+@shared_task(name="maintenance.create_next_partitions", bind=True)
+def create_next_partitions(self) -> list[str]:
+    """
+    Ensure this month's and next month's partitions exist.
+
+    Runs daily via Celery Beat; create_monthly_partition() is idempotent, so
+    repeated runs are no-ops once the partitions exist, and it moves rows the
+    default partition already holds for a month into that month's partition.
+    Schemas built with create_all() instead of the migrations have neither the
+    function nor partitioned tables, so the task skips them.
+
+    Returns:
+        list[str]: Names of the partitions ensured
+    """
+    db = get_db()
+    this_month = date.today().replace(day=1)
+    next_month = (this_month + timedelta(days=32)).replace(day=1)
+
+    try:
+        if db.get_bind().dialect.name != "postgresql":
+            return []
+
+        partitioned = _partitioned_tables(db)
+        if not partitioned:
+            logger.info("No partitioned tables to maintain")
+            return []
+
+        partitions = [
+            db.execute(
+                text("SELECT create_monthly_partition(:parent, :month)"),
+                {"parent": table, "month": month},
+            ).scalar_one()
+            for table in partitioned
+            for month in (this_month, next_month)
+        ]
+        db.commit()
+
+        logger.info("Monthly partitions ensured", extra={"partitions": partitions})
+        return partitions
+
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to create partitions", extra={"error": str(e)}, exc_info=True)
+        raise
+
+    finally:
+        db.close()
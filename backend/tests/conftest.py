@@ -3,12 +3,18 @@
 import os
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from api.main import app
-from database.config import Base, get_db
+from database.config import (
+    Base,
+    enable_sqlite_foreign_keys,
+    get_db,
+    json_deserializer,
+    json_serializer,
+)
 
 # Test database (in-memory SQLite)
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -46,7 +52,12 @@ def db():
         SQLALCHEMY_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
+
+    event.listen(engine, "connect", enable_sqlite_foreign_keys)
+
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
     # Create tables
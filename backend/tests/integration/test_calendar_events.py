@@ -131,6 +131,51 @@ class TestCalendarEventPublisher:
         assert latest_event.payload["events_created"] == 5
         assert latest_event.payload["events_updated"] == 3
 
+    @pytest.mark.asyncio
+    async def test_publish_sync_results(self, calendar_publisher, db, sample_calendar_event):
+        """Should publish a sync's events and its CALENDAR_SYNCED summary in one batch."""
+        from database.models import SystemEvent
+
+        event_ids = await calendar_publisher.publish_sync_results(
+            connection_id=sample_calendar_event.connection_id,
+            created=[sample_calendar_event],
+            updated=[sample_calendar_event],
+        )
+
+        assert len(event_ids) == 3
+        events = (
+            db.query(SystemEvent)
+            .filter(SystemEvent.id.in_(event_ids))
+            .order_by(SystemEvent.id)
+            .all()
+        )
+        assert [event.tipo for event in events] == [
+            EventType.CALENDAR_EVENT_CREATED.value,
+            EventType.CALENDAR_EVENT_UPDATED.value,
+            EventType.CALENDAR_SYNCED.value,
+        ]
+        assert events[-1].payload["events_created"] == 1
+        assert events[-1].payload["events_deleted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_sync_completed(self, calendar_publisher, db):
+        """Should save queued CALENDAR_SYNCED events in the background."""
+        from database.models import SystemEvent
+
+        calendar_publisher.queue_sync_completed(connection_id=1, stats={"events_created": 2})
+        calendar_publisher.queue_sync_completed(connection_id=2, stats={"events_deleted": 1})
+        await calendar_publisher.close()
+
+        events = (
+            db.query(SystemEvent)
+            .filter(SystemEvent.tipo == EventType.CALENDAR_SYNCED.value)
+            .order_by(SystemEvent.id)
+            .all()
+        )
+        assert [event.payload["connection_id"] for event in events] == [1, 2]
+        assert events[0].payload["events_created"] == 2
+        assert events[1].payload["events_deleted"] == 1
+
     @pytest.mark.asyncio
     async def test_publish_sync_failed(self, calendar_publisher, db):
         """Should publish CALENDAR_SYNC_FAILED event with high priority."""
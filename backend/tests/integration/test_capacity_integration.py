@@ -182,9 +182,11 @@ def test_suggest_task_postponements_with_tasks(db_session, capacity_integration)
 
     suggestions = capacity_integration._suggest_task_postponements()
 
-    assert len(suggestions) >= 1
-    assert all(task.status == "pending" for task in suggestions)
-    assert all(task.type != "fixed_appointment" for task in suggestions)
+    assert [(task.id, task.description) for task in suggestions] == [
+        (task2.id, "Task 2"),
+        (task1.id, "Task 1"),
+    ]
+    assert suggestions[0].deadline == task2.deadline
 
 
 def test_suggest_task_postponements_excludes_urgent(db_session, capacity_integration):
@@ -461,3 +463,55 @@ def test_capacity_decision_reasoning(capacity_integration, context_manager):
     assert "85" in result["reason"]  # Current load
     assert "25" in result["reason"]  # Impact (10/40 * 100)
     assert "110" in result["reason"]  # Projected load
+
+
+def test_check_capacity_reads_context_once(capacity_integration, context_manager, monkeypatch):
+    """Test that the capacity check and its wellness note share one context read."""
+    calls = []
+    get_context = context_manager.get_context
+
+    def counting_get_context():
+        calls.append(1)
+        return get_context()
+
+    monkeypatch.setattr(context_manager, "get_context", counting_get_context)
+
+    capacity_integration.check_capacity_before_accept(estimated_hours=10)
+
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "current_load, recommendation",
+    [(50, "accept"), (65, "accept_with_caution"), (75, "negotiate"), (75.5, "reject")],
+)
+def test_check_capacity_band_boundaries(
+    capacity_integration, context_manager, current_load, recommendation
+):
+    """Test that a projected load equal to a threshold stays in the lower band."""
+    context_manager.update_context({"carga_trabalho_percentual": current_load})
+
+    # 10 hours = 25% of a 40-hour week
+    result = capacity_integration.check_capacity_before_accept(estimated_hours=10)
+
+    assert result["recommendation"] == recommendation
+
+
+def test_on_task_created_reads_only_workload(capacity_integration, context_manager, monkeypatch):
+    """Test that task creation checks the workload without building the full context."""
+    context_manager.update_context({"carga_trabalho_percentual": 85})
+
+    def fail_get_context():
+        raise AssertionError("on_task_created should not build the full context")
+
+    monkeypatch.setattr(context_manager, "get_context", fail_get_context)
+
+    capacity_integration.on_task_created(
+        Event(
+            tipo=EventType.TASK_CREATED,
+            modulo_origem=ModuleName.TASK_MANAGER,
+            payload={"task_id": 123},
+        )
+    )
+
+    assert context_manager.get_workload() == 85
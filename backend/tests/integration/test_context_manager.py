@@ -5,7 +5,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from database.config import Base
-from database.models import GlobalContext, Task, User, BigRock
+from database.models import GlobalContext, SystemEvent, Task, User, BigRock
 from integration.context_manager import ContextManager
 from integration.event_bus import Event, EventBus
 from integration.event_types import EventType, ModuleName
@@ -94,6 +94,41 @@ def test_update_context(context_manager):
     assert context_manager.current_context.nivel_stress == 3
 
 
+def test_update_context_without_loop_saves_event(context_manager, event_bus, db_session):
+    """Test that CONTEXT_UPDATED is saved right away when no event loop is running."""
+    context_manager.update_context({"energia_atual": 5})
+
+    saved = (
+        db_session.query(SystemEvent)
+        .filter(SystemEvent.tipo == EventType.CONTEXT_UPDATED.value)
+        .all()
+    )
+    assert [event.payload for event in saved] == [{"energia_atual": 5}]
+    assert event_bus.event_queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_update_context_publishes_with_next_batch(context_manager, event_bus, db_session):
+    """Test that CONTEXT_UPDATED is saved in the same batch as a concurrent publish."""
+    context_manager.update_context({"energia_atual": 6})
+
+    # Joins the batch already scheduled for the context update
+    await event_bus.publish(
+        Event(
+            tipo=EventType.TASK_CREATED,
+            modulo_origem=ModuleName.TASK_MANAGER,
+            payload={"task_id": 1},
+        )
+    )
+
+    saved = (
+        db_session.query(SystemEvent)
+        .filter(SystemEvent.tipo == EventType.CONTEXT_UPDATED.value)
+        .all()
+    )
+    assert [event.payload for event in saved] == [{"energia_atual": 6}]
+
+
 @pytest.mark.asyncio
 async def test_on_cycle_phase_changed(context_manager):
     """Test cycle phase change event handler."""
@@ -1,6 +1,7 @@
 """Integration tests for Event Bus system."""
 
 import asyncio
+import json
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -53,6 +54,84 @@ async def test_publish_event(event_bus, db_session):
     assert db_event.payload["task_id"] == 123
 
 
+@pytest.mark.asyncio
+async def test_publish_many(event_bus, db_session):
+    """Test publishing a batch of events in order."""
+    events = [
+        Event(
+            tipo=EventType.TASK_CREATED,
+            modulo_origem=ModuleName.TASK_MANAGER,
+            payload={"task_id": task_id},
+        )
+        for task_id in (1, 2, 3)
+    ]
+
+    event_ids = await event_bus.publish_many(events)
+
+    assert len(event_ids) == 3
+    assert event_bus.event_queue.qsize() == 3
+    db_events = db_session.query(SystemEvent).filter(SystemEvent.id.in_(event_ids)).all()
+    payloads = {db_event.id: db_event.payload["task_id"] for db_event in db_events}
+    assert [payloads[event_id] for event_id in event_ids] == [1, 2, 3]
+    assert await event_bus.publish_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_publishes_share_one_write(event_bus, db_session, monkeypatch):
+    """Test that publishes gathered together are saved by a single publish_many."""
+    batches = []
+    publish_many = event_bus.publish_many
+
+    async def recording_publish_many(events):
+        batches.append(len(events))
+        return await publish_many(events)
+
+    monkeypatch.setattr(event_bus, "publish_many", recording_publish_many)
+    events = [
+        Event(
+            tipo=EventType.TASK_CREATED,
+            modulo_origem=ModuleName.TASK_MANAGER,
+            payload={"task_id": task_id},
+        )
+        for task_id in (1, 2, 3)
+    ]
+
+    event_ids = await asyncio.gather(*(event_bus.publish(event) for event in events))
+
+    assert batches == [3]
+    assert len(set(event_ids)) == 3
+    db_events = db_session.query(SystemEvent).filter(SystemEvent.id.in_(event_ids)).all()
+    payloads = {db_event.id: db_event.payload["task_id"] for db_event in db_events}
+    assert [payloads[event_id] for event_id in event_ids] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_publish_encodes_redis_message(db_session):
+    """Test the real-time message sent to Redis decodes back to the event."""
+    published = []
+
+    class RecordingRedis:
+        def publish(self, channel, message):
+            published.append((channel, message))
+
+    bus = EventBus(db_session=db_session, redis_client=RecordingRedis())
+    event = Event(
+        tipo=EventType.TASK_CREATED,
+        modulo_origem=ModuleName.TASK_MANAGER,
+        payload={"task_id": 7},
+    )
+
+    event_id = await bus.publish(event)
+
+    [(channel, message)] = published
+    assert channel == "charlee:events:task_created"
+    assert json.loads(message) == {
+        "id": event_id,
+        "payload": {"task_id": 7},
+        "timestamp": event.timestamp,
+    }
+
+
 @pytest.mark.asyncio
 async def test_event_subscription(event_bus):
     """Test subscribing to events."""
@@ -67,6 +146,24 @@ async def test_event_subscription(event_bus):
     assert handler in event_bus.subscribers[EventType.TASK_COMPLETED]
 
 
+def test_event_unsubscription(event_bus):
+    """Test unsubscribing one handler keeps the others in order."""
+
+    def first(event: Event):
+        pass
+
+    def second(event: Event):
+        pass
+
+    event_bus.subscribe(EventType.TASK_COMPLETED, first)
+    event_bus.subscribe(EventType.TASK_COMPLETED, second)
+    event_bus.unsubscribe(EventType.TASK_COMPLETED, first)
+    event_bus.unsubscribe(EventType.TASK_CREATED, first)
+
+    assert event_bus.subscribers[EventType.TASK_COMPLETED] == (second,)
+    assert EventType.TASK_CREATED not in event_bus.subscribers
+
+
 @pytest.mark.asyncio
 async def test_event_processing(event_bus, db_session):
     """Test event processing by subscribers."""
@@ -100,6 +197,68 @@ async def test_event_processing(event_bus, db_session):
     assert received_events[0].payload["task_id"] == 456
 
 
+@pytest.mark.asyncio
+async def test_event_processing_marks_rows_processed(event_bus, db_session):
+    """Test that processing claims saved rows and marks them once handlers have run."""
+    seen_processed = []
+
+    def handler(event: Event):
+        seen_processed.append(db_session.query(SystemEvent.processado).scalar())
+
+    event_bus.subscribe(EventType.TASK_COMPLETED, handler)
+    event_bus.start_processing()
+
+    await event_bus.publish(
+        Event(
+            tipo=EventType.TASK_COMPLETED,
+            modulo_origem=ModuleName.TASK_MANAGER,
+            payload={"task_id": 789},
+        )
+    )
+    await asyncio.sleep(0.1)
+    await event_bus.stop_processing()
+
+    assert seen_processed == [False]
+    assert db_session.query(SystemEvent).filter(SystemEvent.processado.is_(True)).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_handler_publishing_does_not_end_the_claim(event_bus, db_session):
+    """Test that a handler which publishes (and commits) leaves the claimed batch intact."""
+    handled = []
+
+    async def handler(event: Event):
+        handled.append(event.payload["task_id"])
+        await event_bus.publish(
+            Event(
+                tipo=EventType.TASK_CREATED,
+                modulo_origem=ModuleName.TASK_MANAGER,
+                payload={"task_id": event.payload["task_id"]},
+            )
+        )
+
+    event_bus.subscribe(EventType.TASK_COMPLETED, handler)
+    event_bus.start_processing()
+
+    await asyncio.gather(
+        *(
+            event_bus.publish(
+                Event(
+                    tipo=EventType.TASK_COMPLETED,
+                    modulo_origem=ModuleName.TASK_MANAGER,
+                    payload={"task_id": task_id},
+                )
+            )
+            for task_id in (1, 2)
+        )
+    )
+    await asyncio.sleep(0.2)
+    await event_bus.stop_processing()
+
+    assert handled == [1, 2]
+    assert db_session.query(SystemEvent).filter(SystemEvent.processado.is_(False)).count() == 0
+
+
 @pytest.mark.asyncio
 async def test_get_recent_events(event_bus, db_session):
     """Test retrieving recent events."""
@@ -206,7 +206,11 @@ class TestAuthTokens:
         # Verify token was saved in database
         from database.models import RefreshToken
 
-        db_token = db.query(RefreshToken).filter(RefreshToken.token == refresh_token).first()
+        db_token = (
+            db.query(RefreshToken)
+            .filter(RefreshToken.token_hash == RefreshToken.hash_token(refresh_token))
+            .first()
+        )
         assert db_token is not None, "Refresh token should be saved in database"
         assert db_token.revoked is False, "Refresh token should not be revoked"
 
@@ -23,6 +23,18 @@ class TestBigRocksAPI:
         assert "id" in data
         assert "created_at" in data
 
+    def test_big_rock_name_escaped_once(self, client, auth_headers):
+        """Should return the stored (escaped) name without escaping it again."""
+        response = client.post(
+            "/api/v1/big-rocks",
+            json={"name": "Health & Wellness"},
+            headers=auth_headers,
+        )
+
+        assert response.json()["name"] == "Health &amp; Wellness"
+        listed = client.get("/api/v1/big-rocks", headers=auth_headers).json()
+        assert listed["big_rocks"][0]["name"] == "Health &amp; Wellness"
+
     def test_create_big_rock_missing_name(self, client, auth_headers):
         """Should return 422 for missing required field."""
         response = client.post(
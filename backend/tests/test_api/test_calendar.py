@@ -426,6 +426,39 @@ class TestCalendarConflicts:
         assert data["status"] == "resolved"
         assert data["resolution_strategy"] == "charlee_wins"
 
+    def test_conflict_summary_counts_unresolved(self, client, auth_headers, sample_conflict):
+        """Should report unresolved conflicts and drop them once resolved."""
+        response = client.get("/api/v1/calendar/conflicts/summary", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"unresolved": 1}
+
+        client.post(
+            f"/api/v1/calendar/conflicts/{sample_conflict.id}/resolve",
+            headers=auth_headers,
+            json={"resolution_strategy": "charlee_wins"},
+        )
+        response = client.get("/api/v1/calendar/conflicts/summary", headers=auth_headers)
+        assert response.json() == {"unresolved": 0}
+
+    def test_list_event_conflicts_returns_open_ones(self, client, auth_headers, sample_conflict):
+        """Should list an event's unresolved conflicts and omit resolved ones."""
+        url = f"/api/v1/calendar/events/{sample_conflict.event_id}/conflicts"
+        response = client.get(url, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 1
+        assert data["conflicts"][0]["id"] == sample_conflict.id
+        assert data["conflicts"][0]["charlee_version"] == sample_conflict.charlee_version
+
+        client.post(
+            f"/api/v1/calendar/conflicts/{sample_conflict.id}/resolve",
+            headers=auth_headers,
+            json={"resolution_strategy": "charlee_wins"},
+        )
+        assert client.get(url, headers=auth_headers).json()["conflicts"] == []
+
     def test_resolve_conflict_not_found(self, client, auth_headers):
         """Should return 404 for non-existent conflict."""
         response = client.post(
@@ -55,6 +55,13 @@ class TestFreelanceProjectsAPI:
         for project in data["projects"]:
             assert project["status"] == "active"
 
+    def test_hours_summary(self, client, sample_work_log, auth_headers):
+        """Should total hours and value from the project hours view."""
+        response = client.get("/api/v2/freelancer/projects/summary", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"total_hours": 5.0, "total_value": 500.0}
+
     def test_get_project(self, client, sample_freelance_project, auth_headers):
         """Should get project by ID."""
         response = client.get(
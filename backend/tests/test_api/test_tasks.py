@@ -50,6 +50,7 @@ class TestTasksAPI:
         assert "total" in data
         assert "tasks" in data
         assert len(data["tasks"]) >= 1
+        assert data["tasks"][0]["big_rock"]["name"] == "Health & Wellness"
 
     def test_list_tasks_with_filters(self, client, sample_task, auth_headers):
         """Should filter tasks by status."""
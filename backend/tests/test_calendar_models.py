@@ -1,8 +1,19 @@
 """Tests for Calendar Integration Models and Schemas."""
 
+import logging
+
 import pytest
 from datetime import datetime, timedelta, timezone
-from database.models import CalendarConnection, CalendarEvent, CalendarSyncLog, CalendarConflict
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from database.models import (
+    CalendarConflict,
+    CalendarConnection,
+    CalendarEvent,
+    CalendarSyncLog,
+    UserConflictSummary,
+)
 from database.schemas import (
     CalendarConnectionCreate,
     CalendarConnectionUpdate,
@@ -58,6 +69,51 @@ class TestCalendarConnectionModel:
         assert connection.provider == "microsoft"
         assert connection.sync_direction == "both"
 
+    def test_repr_is_id_only_unless_engine_debug(self, db, sample_user, caplog):
+        """Should format only the id unless sqlalchemy.engine logs at DEBUG."""
+        connection = CalendarConnection(
+            user_id=sample_user.id,
+            provider="google",
+            calendar_id="primary",
+            access_token="token",
+        )
+        db.add(connection)
+        db.commit()
+        db.refresh(connection)
+
+        assert repr(connection) == f"<CalendarConnection(id={connection.id})>"
+
+        with caplog.at_level(logging.DEBUG, logger="sqlalchemy.engine"):
+            assert repr(connection) == (
+                f"<CalendarConnection(id={connection.id}, provider='google', "
+                f"user_id={sample_user.id}, sync_enabled={connection.sync_enabled!r})>"
+            )
+
+            connection_id = connection.id
+            db.expire(connection)
+            assert repr(connection) == f"<CalendarConnection(id={connection_id})>"
+        assert "provider" not in connection.__dict__
+
+    def test_update_stamps_updated_at(self, db, sample_user):
+        """Should refresh updated_at on every UPDATE without the ORM setting it."""
+        connection = CalendarConnection(
+            user_id=sample_user.id,
+            provider="google",
+            calendar_id="primary",
+            access_token="token",
+        )
+        db.add(connection)
+        db.commit()
+        stale = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        connection.updated_at = stale
+        db.commit()
+        assert connection.updated_at.replace(tzinfo=timezone.utc) == stale
+
+        connection.sync_enabled = False
+        db.commit()
+
+        assert connection.updated_at.replace(tzinfo=timezone.utc) > stale
+
     def test_is_token_expired_future(self, db, sample_user):
         """Should return False for token expiring in the future."""
         connection = CalendarConnection(
@@ -188,6 +244,172 @@ class TestCalendarEventModel:
         assert "start_time" in event_dict
         assert "end_time" in event_dict
 
+    def test_event_to_snapshot(self, db, sample_user, sample_calendar_connection):
+        """Should build hashable snapshots that compare by value."""
+        start = datetime.now(timezone.utc)
+        event = CalendarEvent(
+            connection_id=sample_calendar_connection.id,
+            user_id=sample_user.id,
+            external_event_id="google_event_457",
+            title="Snapshot",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            source="charlee",
+        )
+
+        snapshot = event.to_snapshot()
+        assert snapshot == event.to_snapshot()
+        assert snapshot.title == "Snapshot"
+
+        event.title = "Renamed"
+        assert {snapshot} ^ {event.to_snapshot()} == {snapshot, event.to_snapshot()}
+
+    def test_event_snapshot_survives_round_trip(self, db, sample_user, sample_calendar_connection):
+        """Should compare equal before and after the naive timestamps are reloaded."""
+        start = datetime.now(timezone.utc).replace(microsecond=0)
+        event = CalendarEvent(
+            connection_id=sample_calendar_connection.id,
+            user_id=sample_user.id,
+            external_event_id="google_event_458",
+            title="Snapshot",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            all_day=False,
+            status="confirmed",
+            source="external",
+        )
+        snapshot = event.to_snapshot()
+        db.add(event)
+        db.commit()
+        db.expire(event)
+
+        assert event.start_time.tzinfo is None
+        assert event.to_snapshot() == snapshot
+
+    def test_deleting_event_cascades_to_conflicts(
+        self, db, sample_user, sample_calendar_connection
+    ):
+        """Should leave conflict cleanup to ON DELETE CASCADE without orphaning rows."""
+        event = CalendarEvent(
+            connection_id=sample_calendar_connection.id,
+            user_id=sample_user.id,
+            external_event_id="google_event_788",
+            title="Deleted Event",
+            start_time=datetime.now(timezone.utc),
+            end_time=datetime.now(timezone.utc) + timedelta(hours=1),
+            source="external",
+        )
+        db.add(event)
+        db.commit()
+        db.add(
+            CalendarConflict(
+                event_id=event.id,
+                user_id=sample_user.id,
+                conflict_type="both_modified",
+                status="detected",
+            )
+        )
+        db.commit()
+
+        db.delete(event)
+        db.commit()
+
+        assert db.query(CalendarConflict).count() == 0
+
+    def test_has_conflict_tracks_unresolved_count(
+        self, db, sample_user, sample_calendar_connection
+    ):
+        """Should keep unresolved_conflict_count in sync with conflict status."""
+        event = CalendarEvent(
+            connection_id=sample_calendar_connection.id,
+            user_id=sample_user.id,
+            external_event_id="google_event_789",
+            title="Eager Event",
+            start_time=datetime.now(timezone.utc),
+            end_time=datetime.now(timezone.utc) + timedelta(hours=1),
+            source="external",
+        )
+        db.add(event)
+        db.commit()
+        assert event.has_conflict() is False
+
+        conflict = CalendarConflict(
+            event_id=event.id,
+            user_id=sample_user.id,
+            conflict_type="both_modified",
+            status="detected",
+        )
+        db.add(conflict)
+        db.commit()
+
+        assert event.unresolved_conflict_count == 1
+        assert event.has_conflict() is True
+
+        conflict.resolve({"title": "Eager Event"})
+        db.commit()
+
+        assert event.unresolved_conflict_count == 0
+        assert event.has_conflict() is False
+
+    def test_active_conflicts_excludes_resolved(self, db, sample_user, sample_calendar_connection):
+        """Should load only unresolved conflicts through active_conflicts."""
+        event = CalendarEvent(
+            connection_id=sample_calendar_connection.id,
+            user_id=sample_user.id,
+            external_event_id="google_event_791",
+            title="Active Event",
+            start_time=datetime.now(timezone.utc),
+            end_time=datetime.now(timezone.utc) + timedelta(hours=1),
+            source="external",
+        )
+        db.add(event)
+        db.commit()
+        db.add_all(
+            [
+                CalendarConflict(
+                    event_id=event.id,
+                    user_id=sample_user.id,
+                    conflict_type="both_modified",
+                    status=status,
+                )
+                for status in ("detected", "resolved", "manual_review")
+            ]
+        )
+        db.commit()
+        event_id = event.id
+        db.expunge_all()
+
+        loaded = (
+            db.query(CalendarEvent)
+            .options(selectinload(CalendarEvent.active_conflicts))
+            .filter(CalendarEvent.id == event_id)
+            .one()
+        )
+        assert sorted(c.status for c in loaded.active_conflicts) == [
+            "detected",
+            "manual_review",
+        ]
+
+    def test_relationships_raise_on_lazy_load(self, db, sample_user, sample_calendar_connection):
+        """Should refuse implicit lazy loads of event relationships."""
+        event = CalendarEvent(
+            connection_id=sample_calendar_connection.id,
+            user_id=sample_user.id,
+            external_event_id="google_event_790",
+            title="Lazy Event",
+            start_time=datetime.now(timezone.utc),
+            end_time=datetime.now(timezone.utc) + timedelta(hours=1),
+            source="external",
+        )
+        db.add(event)
+        db.commit()
+        event_id = event.id
+        db.expunge_all()
+
+        loaded = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).one()
+        with pytest.raises(InvalidRequestError):
+            _ = loaded.conflicts
+
 
 class TestCalendarSyncLogModel:
     """Test suite for CalendarSyncLog model."""
@@ -332,6 +554,8 @@ class TestCalendarConflictModel:
 
         resolved_version = {"title": "Charlee"}
         conflict.resolve(resolved_version, "system_charlee")
+        # Usable before any flush, not a pending SQL expression
+        assert conflict.resolved_at.tzinfo is timezone.utc
         db.commit()
 
         assert conflict.status == "resolved"
@@ -339,6 +563,117 @@ class TestCalendarConflictModel:
         assert conflict.resolved_by == "system_charlee"
         assert conflict.resolved_at is not None
 
+    def test_resolve_many(self, db, sample_user, sample_calendar_event):
+        """Should bulk-resolve conflicts and keep the event counter in sync."""
+        conflicts = [
+            CalendarConflict(
+                event_id=sample_calendar_event.id,
+                user_id=sample_user.id,
+                conflict_type="both_modified",
+                status="detected",
+            )
+            for _ in range(3)
+        ]
+        db.add_all(conflicts)
+        db.commit()
+        assert sample_calendar_event.unresolved_conflict_count == 3
+
+        resolved = CalendarConflict.resolve_many(
+            db,
+            {conflicts[0].id: {"title": "A"}, conflicts[1].id: {"title": "B"}},
+            resolved_by="system_charlee",
+        )
+        db.commit()
+
+        assert resolved == 2
+        assert conflicts[0].status == "resolved"
+        assert conflicts[0].resolved_version == {"title": "A"}
+        assert conflicts[0].resolved_by == "system_charlee"
+        assert conflicts[0].resolved_at is not None
+        assert conflicts[2].status == "detected"
+        assert sample_calendar_event.unresolved_conflict_count == 1
+
+    def test_external_version_stored_as_diff(self, db, sample_user, sample_calendar_event):
+        """Should persist only the fields where the external version differs."""
+        conflict = CalendarConflict(
+            event_id=sample_calendar_event.id,
+            user_id=sample_user.id,
+            conflict_type="both_modified",
+            external_version={"title": "External", "location": "Room 1"},
+            charlee_version={"title": "Charlee", "location": "Room 1"},
+        )
+        db.add(conflict)
+        db.commit()
+        db.expire(conflict)
+
+        assert conflict.external_diff == {"title": "External"}
+        assert conflict.external_version == {"title": "External", "location": "Room 1"}
+
+    def test_user_conflict_summary_follows_conflict_status(
+        self, db, sample_user, sample_calendar_event
+    ):
+        """Should count open conflicts through the summary triggers, bulk resolves included."""
+        conflicts = [
+            CalendarConflict(
+                event_id=sample_calendar_event.id,
+                user_id=sample_user.id,
+                conflict_type="both_modified",
+                status="detected",
+            )
+            for _ in range(3)
+        ]
+        db.add_all(conflicts)
+        db.commit()
+        assert UserConflictSummary.unresolved_for(db, sample_user.id) == 3
+
+        CalendarConflict.resolve_many(db, {conflicts[0].id: {}, conflicts[1].id: {}})
+        db.delete(conflicts[2])
+        db.commit()
+
+        assert UserConflictSummary.unresolved_for(db, sample_user.id) == 0
+
+    def test_user_conflict_summary_defaults_to_zero(self, db, sample_user):
+        """Should report zero unresolved conflicts when no summary row exists."""
+        assert UserConflictSummary.unresolved_for(db, sample_user.id) == 0
+
+        db.add(UserConflictSummary(user_id=sample_user.id, unresolved_count=4))
+        db.commit()
+
+        assert UserConflictSummary.unresolved_for(db, sample_user.id) == 4
+
+    def test_conflict_stores_event_snapshot(self, db, sample_user, sample_calendar_event):
+        """Should store to_dict() datetimes as ISO strings in JSON columns."""
+        conflict = CalendarConflict(
+            event_id=sample_calendar_event.id,
+            user_id=sample_user.id,
+            conflict_type="both_modified",
+            charlee_version=sample_calendar_event.to_dict(),
+            status="detected",
+        )
+        db.add(conflict)
+        db.commit()
+        db.expire(conflict)
+
+        stored_start = conflict.charlee_version["start_time"]
+        assert isinstance(stored_start, str)
+        assert datetime.fromisoformat(stored_start) == sample_calendar_event.start_time
+        assert conflict.charlee_version == sample_calendar_event.to_dict()
+
+    def test_conflict_stores_non_string_keys(self, db, sample_user, sample_calendar_event):
+        """Should accept int dict keys in JSON columns, as the stdlib encoder does."""
+        conflict = CalendarConflict(
+            event_id=sample_calendar_event.id,
+            user_id=sample_user.id,
+            conflict_type="both_modified",
+            resolved_version={1: "first"},
+            status="detected",
+        )
+        db.add(conflict)
+        db.commit()
+        db.expire(conflict)
+
+        assert conflict.resolved_version == {"1": "first"}
+
 
 class TestCalendarSchemas:
     """Test suite for Calendar Pydantic schemas."""
@@ -0,0 +1,66 @@
+"""Tests for calendar synchronization Celery tasks."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from database.models import CalendarConflict, CalendarConnection, CalendarEvent
+from tasks import calendar_sync
+
+
+@pytest.fixture
+def synced_connection(db, sample_user):
+    """Create a calendar connection that was last synced an hour ago."""
+    connection = CalendarConnection(
+        user_id=sample_user.id,
+        provider="google",
+        calendar_id="primary",
+        access_token="token",
+        last_sync_at=datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+    db.add(connection)
+    db.commit()
+    db.refresh(connection)
+    return connection
+
+
+def _event(connection, external_id, charlee_delta, external_delta):
+    now = datetime.now(timezone.utc)
+    return CalendarEvent(
+        connection_id=connection.id,
+        user_id=connection.user_id,
+        external_event_id=external_id,
+        title=external_id,
+        start_time=now,
+        end_time=now + timedelta(hours=1),
+        source="external",
+        charlee_modified_at=now + charlee_delta,
+        external_modified_at=now + external_delta,
+    )
+
+
+class TestDetectConflicts:
+    """Test suite for the detect_conflicts task."""
+
+    @patch.object(calendar_sync.resolve_conflicts, "delay")
+    def test_detects_only_events_modified_on_both_sides(self, mock_resolve, db, synced_connection):
+        """Should flag events modified on both sides since the last sync, once."""
+        db.add_all(
+            [
+                _event(synced_connection, "both", timedelta(0), timedelta(0)),
+                _event(synced_connection, "charlee_only", timedelta(0), -timedelta(hours=2)),
+                _event(synced_connection, "stale", -timedelta(hours=2), -timedelta(hours=2)),
+            ]
+        )
+        db.commit()
+
+        with patch.object(calendar_sync, "get_db", return_value=db), patch.object(db, "close"):
+            assert calendar_sync.detect_conflicts(synced_connection.id) == 1
+            # An open conflict already exists, so nothing new is detected
+            assert calendar_sync.detect_conflicts(synced_connection.id) == 0
+
+        conflicts = db.query(CalendarConflict).all()
+        assert len(conflicts) == 1
+        assert conflicts[0].charlee_version["title"] == "both"
+        mock_resolve.assert_called_once_with(synced_connection.id)
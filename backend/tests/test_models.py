@@ -0,0 +1,327 @@
+"""Tests for core and freelance ORM models."""
+
+from datetime import date, time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from database.models import (
+    DailyLog,
+    FreelanceProject,
+    Invoice,
+    MenstrualCycle,
+    ProjectHoursMV,
+    SystemEvent,
+    Task,
+    User,
+    WorkLog,
+    _copy_value,
+)
+
+
+class TestRelationshipLoading:
+    """Test suite for relationship loader strategies."""
+
+    def test_task_big_rock_is_joined(self, db, sample_task):
+        """Should load Task.big_rock in the same SELECT as the task."""
+        task_id = sample_task.id
+        db.expunge_all()
+
+        task = db.get(Task, task_id)
+        assert "big_rock" in task.__dict__
+        assert task.big_rock.name == "Health & Wellness"
+
+    def test_work_log_project_is_joined(self, db, sample_work_log):
+        """Should load WorkLog.project eagerly so calculate_amount is query-free."""
+        log_id = sample_work_log.id
+        db.expunge_all()
+
+        log = db.get(WorkLog, log_id)
+        assert "project" in log.__dict__
+        assert log.calculate_amount() == log.hours * log.project.hourly_rate
+
+    def test_user_collections_raise_on_lazy_access(self, db, sample_user):
+        """Should refuse implicit loads of the user's collections."""
+        user_id = sample_user.id
+        db.expunge_all()
+
+        user = db.get(User, user_id)
+        with pytest.raises(InvalidRequestError):
+            _ = user.tasks
+
+        user = db.query(User).options(selectinload(User.tasks)).filter_by(id=user_id).one()
+        assert user.tasks == []
+
+    def test_delete_project_cascades_work_logs(self, db, sample_work_log):
+        """Should still cascade deletes through a lazy="raise" collection."""
+        project_id = sample_work_log.project_id
+        db.expunge_all()
+
+        db.delete(db.get(FreelanceProject, project_id))
+        db.commit()
+
+        assert db.query(WorkLog).count() == 0
+
+    def test_delete_user_leaves_children_to_database_cascade(self, db, sample_task):
+        """Should delete a user's rows through ON DELETE CASCADE without loading them."""
+        user_id = sample_task.user_id
+        db.expunge_all()
+
+        db.delete(db.get(User, user_id))
+        db.commit()
+
+        assert db.query(Task).count() == 0
+
+
+class TestProjectActualHours:
+    """Test suite for FreelanceProject.actual_hours maintenance."""
+
+    def _log(self, db, project, hours):
+        log = WorkLog(
+            user_id=project.user_id,
+            project_id=project.id,
+            work_date=date.today(),
+            hours=hours,
+            description="Work",
+        )
+        db.add(log)
+        db.commit()
+        return log
+
+    def test_work_log_changes_adjust_actual_hours(self, db, sample_freelance_project):
+        """Should keep actual_hours in step with inserts, updates and deletes."""
+        project = sample_freelance_project
+        log = self._log(db, project, 3.0)
+        self._log(db, project, 2.0)
+        assert project.actual_hours == 5.0
+
+        log.hours = 4.0
+        db.commit()
+        assert project.actual_hours == 6.0
+
+        db.delete(log)
+        db.commit()
+        assert project.actual_hours == 2.0
+
+    def test_hours_and_amounts_are_exact(self, db, sample_freelance_project):
+        """Should sum fractional hours and amounts without float drift."""
+        project = sample_freelance_project
+        for _ in range(3):
+            self._log(db, project, 0.1)
+        db.expire_all()
+
+        logs = db.query(WorkLog).all()
+        assert sum(log.hours for log in logs) == Decimal("0.3")
+        assert sum(log.calculate_amount() for log in logs) == Decimal("30")
+        assert project.actual_hours == Decimal("0.3")
+
+    def test_delete_expired_work_log(self, db, sample_freelance_project):
+        """Should decrement correctly when the deleted log's attributes are expired."""
+        project = sample_freelance_project
+        log_id = self._log(db, project, 3.0).id
+        db.expunge_all()
+
+        db.delete(db.get(WorkLog, log_id))
+        db.commit()
+        assert db.get(FreelanceProject, project.id).actual_hours == 0.0
+
+    def test_recompute_actual_hours(self, db, sample_user, sample_freelance_project):
+        """Should rebuild actual_hours for all of a user's projects in one statement."""
+        project = sample_freelance_project
+        self._log(db, project, 3.0)
+        project.actual_hours = 99.0
+        db.commit()
+
+        assert FreelanceProject.recompute_actual_hours(db, user_id=sample_user.id) == 1
+        db.commit()
+        assert project.actual_hours == 3.0
+
+    def test_flush_returns_work_log_server_defaults(self, db, sample_freelance_project):
+        """Should load server defaults through INSERT ... RETURNING, with no follow-up SELECT."""
+        project = sample_freelance_project
+        logs = [
+            WorkLog(
+                user_id=project.user_id,
+                project_id=project.id,
+                work_date=date.today(),
+                hours=1.0,
+                description=f"Log {i}",
+            )
+            for i in range(3)
+        ]
+        statements = []
+
+        @event.listens_for(db.get_bind(), "before_cursor_execute")
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        db.add_all(logs)
+        db.flush()
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+
+        assert not [s for s in statements if s.startswith("SELECT")]
+        assert all("RETURNING" in s for s in statements if s.startswith("INSERT"))
+        assert all("created_at" in log.__dict__ and log.billable is True for log in logs)
+
+
+class TestProjectHoursView:
+    """Test suite for the mv_project_hours reporting view."""
+
+    def test_totals_per_project(self, db, sample_work_log, sample_freelance_project):
+        """Should expose hours and value per project, including projects without logs."""
+        empty = FreelanceProject(
+            user_id=sample_freelance_project.user_id,
+            client_name="Other Client",
+            project_name="No Logs Yet",
+            hourly_rate=80.0,
+            estimated_hours=10.0,
+        )
+        db.add(empty)
+        db.commit()
+        ProjectHoursMV.refresh(db)
+
+        rows = {row.project_id: row for row in db.query(ProjectHoursMV).all()}
+        assert rows[sample_freelance_project.id].actual_hours == Decimal("5")
+        assert rows[sample_freelance_project.id].actual_value == Decimal("500")
+        assert rows[empty.id].actual_hours == 0
+
+
+class TestInvoiceNumbering:
+    """Test suite for database-generated invoice numbers."""
+
+    def _invoice(self, db, project, **kwargs):
+        invoice = Invoice(
+            user_id=project.user_id,
+            project_id=project.id,
+            issue_date=date.today(),
+            total_amount=100.0,
+            total_hours=1.0,
+            hourly_rate=100.0,
+            **kwargs,
+        )
+        db.add(invoice)
+        db.commit()
+        return invoice
+
+    def test_invoice_number_assigned_on_insert(self, db, sample_freelance_project):
+        """Should number invoices in the INSERT when none is given."""
+        first = self._invoice(db, sample_freelance_project)
+        second = self._invoice(db, sample_freelance_project, invoice_number=None)
+        manual = self._invoice(db, sample_freelance_project, invoice_number="CUSTOM-1")
+
+        assert first.invoice_number == "INV-00000001"
+        assert second.invoice_number == "INV-00000002"
+        assert manual.invoice_number == "CUSTOM-1"
+
+
+class TestWorkLogInvoicing:
+    """Test suite for WorkLog.bulk_mark_invoiced."""
+
+    def test_bulk_mark_invoiced(self, db, sample_work_log, sample_freelance_project):
+        """Should attach only the given logs to the invoice in one UPDATE."""
+        other = WorkLog(
+            user_id=sample_work_log.user_id,
+            project_id=sample_freelance_project.id,
+            work_date=date.today(),
+            hours=1.0,
+            description="Not invoiced",
+        )
+        invoice = Invoice(
+            user_id=sample_work_log.user_id,
+            project_id=sample_freelance_project.id,
+            issue_date=date.today(),
+            total_amount=500.0,
+            total_hours=5.0,
+            hourly_rate=100.0,
+        )
+        db.add_all([other, invoice])
+        db.commit()
+
+        assert WorkLog.bulk_mark_invoiced(db, [sample_work_log.id], invoice.id) == 1
+        assert WorkLog.bulk_mark_invoiced(db, [], invoice.id) == 0
+        db.commit()
+
+        assert sample_work_log.invoiced is True
+        assert sample_work_log.invoice_id == invoice.id
+        assert other.invoiced is False
+        assert other.invoice_id is None
+
+
+class TestSystemEventQueue:
+    """Test suite for SystemEvent batch publishing and claiming."""
+
+    def test_bulk_publish_applies_defaults(self, db):
+        """Should persist every event with the column defaults filled in."""
+        events = [
+            {"tipo": "task_created", "modulo_origem": "task_manager", "payload": {"id": i}}
+            for i in range(3)
+        ]
+
+        event_ids = SystemEvent.bulk_publish(db, events)
+        db.commit()
+
+        stored = db.query(SystemEvent).order_by(SystemEvent.id).all()
+        assert event_ids == [event.id for event in stored]
+        assert [event.payload["id"] for event in stored] == [0, 1, 2]
+        assert all(event.processado is False and event.prioridade == 5 for event in stored)
+
+    def test_claim_batch_then_mark_processed(self, db):
+        """Should claim pending events by priority and mark them processed on request."""
+        SystemEvent.bulk_publish(
+            db,
+            [
+                {"tipo": "low", "modulo_origem": "tasks", "payload": {}, "prioridade": 1},
+                {"tipo": "high", "modulo_origem": "tasks", "payload": {}, "prioridade": 9},
+                {"tipo": "mid", "modulo_origem": "tasks", "payload": {}, "prioridade": 5},
+            ],
+        )
+        db.commit()
+
+        claimed = SystemEvent.claim_batch(db, limit=2)
+        assert [event.tipo for event in claimed] == ["high", "mid"]
+        assert not any(event.processado for event in claimed)
+
+        SystemEvent.mark_processed(db, [event.id for event in claimed])
+        db.commit()
+
+        assert all(event.processado and event.processado_em for event in claimed)
+        assert [event.tipo for event in SystemEvent.claim_batch(db)] == ["low"]
+
+
+class TestNativeColumnTypes:
+    """Test suite for TIME and text array columns."""
+
+    def test_daily_log_times_and_cycle_symptoms_round_trip(self, db, sample_user):
+        """Should store wake/sleep times as time values and symptoms as a list."""
+        log = DailyLog(
+            user_id=sample_user.id,
+            date=date.today(),
+            wake_time=time(7, 15),
+            sleep_time=time(23, 30),
+            special_events=["travel"],
+        )
+        cycle = MenstrualCycle(
+            user_id=sample_user.id,
+            start_date=date.today(),
+            phase="follicular",
+            symptoms=["fatigue", "high_creativity"],
+        )
+        db.add_all([log, cycle])
+        db.commit()
+        db.expire_all()
+
+        assert log.wake_time == time(7, 15)
+        assert log.special_events == ["travel"]
+        assert cycle.symptoms == ["fatigue", "high_creativity"]
+
+    def test_copy_value_renders_text_arrays(self):
+        """Should write StringArray values as quoted PostgreSQL array literals for COPY."""
+        column = MenstrualCycle.__table__.c.symptoms
+
+        assert _copy_value(column, ["fatigue", 'say "hi"', "a,b", None]) == (
+            '{"fatigue","say \\"hi\\"","a,b",NULL}'
+        )
+        assert _copy_value(column, []) == "{}"
@@ -0,0 +1,30 @@
+"""Tests for partition maintenance Celery tasks."""
+
+from unittest.mock import MagicMock, patch
+
+from tasks import partition_maintenance
+
+
+class TestCreateNextPartitions:
+    """Test suite for the create_next_partitions task."""
+
+    def test_skips_databases_without_partitioning(self, db):
+        """Should do nothing on non-PostgreSQL databases."""
+        with (
+            patch.object(partition_maintenance, "get_db", return_value=db),
+            patch.object(db, "close"),
+        ):
+            assert partition_maintenance.create_next_partitions() == []
+
+    def test_skips_schemas_built_without_migrations(self):
+        """Should not call create_monthly_partition() when it was never installed."""
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        # to_regproc('create_monthly_partition') IS NULL
+        db.execute.return_value.scalar_one.return_value = True
+
+        with patch.object(partition_maintenance, "get_db", return_value=db):
+            assert partition_maintenance.create_next_partitions() == []
+
+        assert db.execute.call_count == 1
+        db.commit.assert_not_called()
@@ -1,9 +1,22 @@
 """Tests for schema validation and sanitization."""
 
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import get_args
+
 import pytest
 from pydantic import ValidationError
 
-from database.schemas import BigRockCreate, BigRockUpdate, TaskCreate, TaskUpdate
+from database import schemas
+from database.schemas import (
+    BigRockCreate,
+    BigRockUpdate,
+    FreelanceProjectCreate,
+    FreelanceProjectUpdate,
+    TaskCreate,
+    TaskUpdate,
+)
 
 
 class TestBigRockSchemaValidation:
@@ -54,6 +67,110 @@ class TestBigRockSchemaValidation:
         assert update.color is None
         assert update.active is None
 
+    def test_task_list_shares_nested_big_rock(self):
+        """Should build one BigRockResponse per big rock across a task list."""
+        now = datetime(2024, 1, 1)
+        rock = SimpleNamespace(id=1, name="Career", color=None, active=True, created_at=now)
+        rows = [
+            SimpleNamespace(
+                id=task_id,
+                description="Task",
+                type="task",
+                deadline=None,
+                big_rock_id=1,
+                status="pending",
+                created_at=now,
+                updated_at=now,
+                completed_at=None,
+                big_rock=rock,
+            )
+            for task_id in (1, 2)
+        ]
+        first, second = schemas.TaskResponse.from_orm_list(rows)
+        assert first.big_rock is second.big_rock
+        assert first.big_rock.name == "Career"
+
+    def test_dump_list_json_matches_list_response(self):
+        """Should serialize rows to the same payload as BigRockListResponse."""
+        now = datetime(2024, 1, 1)
+        rows = [SimpleNamespace(id=1, name="Career", color=None, active=True, created_at=now)]
+        expected = schemas.BigRockListResponse(
+            total=1, big_rocks=schemas.BigRockResponse.from_orm_list(rows)
+        ).model_dump_json()
+        assert schemas.BigRockResponse.dump_list_json(rows, "big_rocks").decode() == expected
+
+    def test_dump_list_json_reports_given_total(self):
+        """Should report the full count of a paginated list instead of the page size."""
+        now = datetime(2024, 1, 1)
+        rows = [SimpleNamespace(id=1, name="Career", color=None, active=True, created_at=now)]
+        payload = schemas.BigRockResponse.dump_list_json(rows, "big_rocks", total=40)
+        assert payload.startswith(b'{"total":40,"big_rocks":[{')
+
+    def test_iter_list_json_matches_dump_list_json(self):
+        """Should stream the same payload as dump_list_json across chunk boundaries."""
+        now = datetime(2024, 1, 1)
+        rows = [
+            SimpleNamespace(id=rock_id, name="Rock", color=None, active=True, created_at=now)
+            for rock_id in range(5)
+        ]
+        expected = schemas.BigRockResponse.dump_list_json(rows, "big_rocks")
+        for chunk_size in (1, 2, 10):
+            streamed = schemas.BigRockResponse.iter_list_json(rows, "big_rocks", chunk_size)
+            assert b"".join(streamed) == expected
+        assert b"".join(schemas.BigRockResponse.iter_list_json([], "big_rocks")) == (
+            schemas.BigRockResponse.dump_list_json([], "big_rocks")
+        )
+
+    def test_from_orm_list_shares_fields_set(self):
+        """Should reuse one fields-set for complete rows without breaking model_copy."""
+        now = datetime(2024, 1, 1)
+        rows = [
+            SimpleNamespace(id=rock_id, name="Career", color=None, active=True, created_at=now)
+            for rock_id in (1, 2)
+        ]
+        first, second = schemas.BigRockResponse.from_orm_list(rows)
+        assert first.model_fields_set is second.model_fields_set
+        assert first.model_copy(update={"name": "Health"}).name == "Health"
+        assert second.model_fields_set == set(schemas.BigRockResponse.model_fields)
+
+    def test_from_orm_fast_defaults_missing_attributes(self):
+        """Should fall back to field defaults for attributes the row does not have."""
+        row = SimpleNamespace(id=1, name="Career", active=True, created_at=datetime(2024, 1, 1))
+        assert schemas.BigRockResponse.from_orm_fast(row).color is None
+
+    def test_from_orm_fast_reuses_literal_members(self):
+        """Should hand out the Literal's own string for equal values read from a row."""
+        now = datetime(2024, 1, 1)
+        task_type = "".join(["fixed_", "appointment"])  # a fresh str, as a DB driver returns
+        row = SimpleNamespace(
+            id=1,
+            description="Task",
+            type=task_type,
+            deadline=None,
+            big_rock_id=None,
+            status="pending",
+            created_at=now,
+            updated_at=now,
+        )
+        response = schemas.TaskResponse.from_orm_fast(row)
+        assert response.type == task_type
+        assert response.type is get_args(schemas.TaskType)[0]
+
+    def test_warm_up_builds_list_adapters(self):
+        """Should build list adapters for loaded response schemas up front."""
+        schemas._list_adapter.cache_clear()
+        schemas.warm_up()
+        hits = schemas._list_adapter.cache_info().hits
+        schemas._list_adapter(schemas.TaskResponse)
+        assert schemas._list_adapter.cache_info().hits == hits + 1
+
+    def test_apply_patch_copies_only_set_fields(self):
+        """Should apply exactly the fields model_dump(exclude_unset=True) would."""
+        row = SimpleNamespace(name="Career", color="#000000", active=True)
+        patch = BigRockUpdate(name="Health", color=None)
+        schemas.apply_patch(row, patch)
+        assert vars(row) == {"name": "Health", "color": None, "active": True}
+
 
 class TestTaskSchemaValidation:
     """Test Task schema validation."""
@@ -126,3 +243,73 @@ class TestTaskSchemaValidation:
         """Should reject invalid statuses."""
         with pytest.raises(ValidationError):
             TaskUpdate(status="invalid_status")
+
+
+class TestFreelanceProjectSchemaValidation:
+    """Test suite for FreelanceProject schema validation."""
+
+    def test_tags_accept_comma_separated_string(self):
+        """Should split legacy comma-separated tags into a list."""
+        project = FreelanceProjectCreate(
+            client_name="Client",
+            project_name="Project",
+            hourly_rate=100.0,
+            estimated_hours=10.0,
+            tags="python, fastapi,,api",
+        )
+        assert project.tags == ["python", "fastapi", "api"]
+
+    def test_money_fields_are_exact_and_serialize_as_numbers(self):
+        """Should keep rates and hours as Decimal while emitting JSON numbers."""
+        project = FreelanceProjectCreate(
+            client_name="Client",
+            project_name="Project",
+            hourly_rate="0.1",
+            estimated_hours=0.2,
+        )
+        assert project.hourly_rate + project.estimated_hours == Decimal("0.3")
+        assert '"hourly_rate":0.1' in project.model_dump_json()
+
+    @pytest.mark.parametrize("hourly_rate", ["1000000", "100.125"])
+    def test_money_fields_reject_values_the_column_cannot_hold(self, hourly_rate):
+        """Should reject rates that overflow or get rounded by NUMERIC(8, 2)."""
+        with pytest.raises(ValidationError):
+            FreelanceProjectCreate(
+                client_name="Client",
+                project_name="Project",
+                hourly_rate=hourly_rate,
+                estimated_hours=10,
+            )
+        with pytest.raises(ValidationError):
+            FreelanceProjectUpdate(hourly_rate=hourly_rate)
+
+    def test_update_tags_accept_list(self):
+        """Should keep list tags unchanged."""
+        assert FreelanceProjectUpdate(tags=["design"]).tags == ["design"]
+
+    def test_freelance_schemas_resolve_from_package(self):
+        """Should expose the lazily loaded freelance schemas on database.schemas."""
+        from database.schemas import freelance
+
+        assert schemas.InvoiceResponse is freelance.InvoiceResponse
+        with pytest.raises(AttributeError):
+            _ = schemas.NotASchema
+
+
+class TestPricingParameterSchemaValidation:
+    """Test suite for PricingParameter factor validation."""
+
+    def test_factors_accept_positive_numbers(self):
+        """Should accept int and float multipliers."""
+        params = schemas.PricingParameterCreate(
+            base_hourly_rate=100.0, complexity_factors={"5-6": 1, "7-8": 1.2}
+        )
+        assert params.complexity_factors == {"5-6": 1.0, "7-8": 1.2}
+
+    @pytest.mark.parametrize("value", [-1.0, 0, "1.5"])
+    def test_factors_reject_invalid_values(self, value):
+        """Should reject non-positive or non-numeric multipliers on create and update."""
+        with pytest.raises(ValidationError):
+            schemas.PricingParameterCreate(base_hourly_rate=100.0, client_factors={"x": value})
+        with pytest.raises(ValidationError):
+            schemas.PricingParameterUpdate(client_factors={"x": value})
@@ -2,6 +2,8 @@
 
 from api.security import (
     SecurityValidator,
+    _sanitize_string_cached,
+    clear_sanitize_cache,
     sanitize_filename,
     sanitize_html,
     sanitize_string,
@@ -54,6 +56,35 @@ class TestInputSanitization:
         # Count should remain the same (HTML escaping might change representation)
         assert "Line 1" in result and "Line 2" in result
 
+    def test_sanitize_string_cache_keys_on_options(self):
+        """Should not reuse a cached result across different options."""
+        assert sanitize_string("a\nb <i>", allow_newlines=False) == "a b &lt;i&gt;"
+        assert sanitize_string("a\nb <i>", allow_newlines=False) == "a b &lt;i&gt;"
+        assert sanitize_string("a\nb <i>", strip_html=False) == "a\nb <i>"
+        assert sanitize_string("a\nb <i>", max_length=3) == "a\nb"
+
+    def test_sanitize_string_none_if_blank(self):
+        """Should return None for blank results only when asked to."""
+        assert sanitize_string(" \n\t ", none_if_blank=True) is None
+        assert sanitize_string("", none_if_blank=True) is None
+        assert sanitize_string(" \n ", allow_newlines=False) == ""
+        assert sanitize_string(" x ", none_if_blank=True) == "x"
+
+    def test_sanitize_string_long_text_bypasses_cache(self):
+        """Should sanitize text above the cache threshold the same way."""
+        long_text = "<b>" + "x" * 600
+        assert sanitize_string(long_text, max_length=10) == "&lt;b&gt;x"
+
+    def test_sanitize_string_cache_controls(self):
+        """Should memoize short strings and reset through clear_sanitize_cache."""
+        clear_sanitize_cache()
+        sanitize_string("Career", max_length=100)
+        sanitize_string("Career", max_length=100)
+        info = _sanitize_string_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        clear_sanitize_cache()
+        assert _sanitize_string_cached.cache_info().currsize == 0
+
 
 class TestColorValidation:
     """Test color validation."""